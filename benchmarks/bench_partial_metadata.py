@@ -0,0 +1,136 @@
+"""Compare full-object listing with PartialObjectMetadataList listing.
+
+Builds a synthetic list response for a kind, then measures for both representations the
+payload size and the time to turn it into "namespace/name" lines the way list tools do:
+json.loads plus OpenAPI model deserialization for the full list (when the kubernetes
+package is installed), json.loads only for the metadata list.
+
+    python benchmarks/bench_partial_metadata.py --kind secrets --count 20000
+"""
+import argparse
+import base64
+import json
+import os
+import time
+
+KINDS = {
+    "pods": ("V1PodList", "Pod", "v1"),
+    "secrets": ("V1SecretList", "Secret", "v1"),
+    "configmaps": ("V1ConfigMapList", "ConfigMap", "v1"),
+    "replicasets": ("V1ReplicaSetList", "ReplicaSet", "apps/v1"),
+}
+
+
+def _metadata(i):
+    return {
+        "name": f"obj-{i:06d}",
+        "namespace": f"ns-{i % 200:03d}",
+        "uid": f"00000000-0000-0000-0000-{i:012d}",
+        "resourceVersion": str(100000 + i),
+        "creationTimestamp": "2026-01-01T00:00:00Z",
+        "labels": {"app": f"app-{i % 500}", "tier": "backend"},
+        "managedFields": [
+            {"manager": "kube-controller-manager", "operation": "Update", "apiVersion": "v1",
+             "time": "2026-01-01T00:00:00Z", "fieldsType": "FieldsV1",
+             "fieldsV1": {"f:metadata": {"f:labels": {".": {}, "f:app": {}, "f:tier": {}}}}},
+        ],
+    }
+
+
+def _container(i):
+    return {
+        "name": "app",
+        "image": f"registry.example.com/app-{i % 500}:1.0.{i % 30}",
+        "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+        "env": [{"name": f"VAR_{n}", "value": f"value-{n}"} for n in range(10)],
+        "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"cpu": "1", "memory": "512Mi"}},
+    }
+
+
+def make_object(kind, i):
+    meta = _metadata(i)
+    if kind == "secrets":
+        blob = base64.b64encode(os.urandom(3 * 1024)).decode()
+        return {"metadata": meta, "type": "Opaque", "data": {"tls.crt": blob, "tls.key": blob[:2048]}}
+    if kind == "configmaps":
+        return {"metadata": meta, "data": {"application.yaml": "key: value\n" * 300}}
+    if kind == "replicasets":
+        return {
+            "metadata": meta,
+            "spec": {"replicas": 3, "selector": {"matchLabels": {"app": meta["labels"]["app"]}},
+                     "template": {"metadata": {"labels": meta["labels"]}, "spec": {"containers": [_container(i)]}}},
+            "status": {"replicas": 3, "readyReplicas": 3, "availableReplicas": 3},
+        }
+    return {
+        "metadata": meta,
+        "spec": {"nodeName": f"node-{i % 100}", "containers": [_container(i)]},
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            "containerStatuses": [{"name": "app", "ready": True, "restartCount": i % 3, "image": "app",
+                                   "imageID": "sha256:" + "0" * 64, "state": {"running": {"startedAt": "2026-01-01T00:00:00Z"}}}],
+        },
+    }
+
+
+def build_payloads(kind, count):
+    _, object_kind, api_version = KINDS[kind]
+    objects = [make_object(kind, i) for i in range(count)]
+    full = {"kind": f"{object_kind}List", "apiVersion": api_version, "metadata": {"resourceVersion": "1"},
+            "items": [{"kind": object_kind, "apiVersion": api_version, **o} for o in objects]}
+    partial = {"kind": "PartialObjectMetadataList", "apiVersion": "meta.k8s.io/v1", "metadata": {"resourceVersion": "1"},
+               "items": [{"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": o["metadata"]}
+                         for o in objects]}
+    return json.dumps(full).encode(), json.dumps(partial).encode()
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kind", choices=sorted(KINDS), default="secrets")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    full, partial = build_payloads(args.kind, args.count)
+
+    def names_from_json(payload):
+        items = json.loads(payload)["items"]
+        return [f"{o['metadata']['namespace']}/{o['metadata']['name']}" for o in items]
+
+    results = [
+        ("full list, json only", len(full), best_of(args.repeat, lambda: names_from_json(full))),
+        ("metadata list, json only", len(partial), best_of(args.repeat, lambda: names_from_json(partial))),
+    ]
+    try:
+        from kubernetes import client
+
+        api_client = client.ApiClient()
+        list_type = KINDS[args.kind][0]
+        text = full.decode()
+
+        def names_from_models():
+            items = api_client.deserialize(text, list_type, "application/json").items
+            return [f"{o.metadata.namespace}/{o.metadata.name}" for o in items]
+
+        results.insert(0, ("full list, typed models", len(full), best_of(args.repeat, names_from_models)))
+    except ImportError:
+        print("kubernetes package not installed: skipping typed model deserialization")
+
+    baseline_bytes, baseline_time = results[0][1], results[0][2]
+    print(f"{args.count} {args.kind}, best of {args.repeat}")
+    print(f"{'path':<26}{'bytes':>14}{'seconds':>10}{'bytes x':>9}{'time x':>8}")
+    for name, size, seconds in results:
+        print(f"{name:<26}{size:>14,}{seconds:>10.3f}{baseline_bytes / size:>9.1f}{baseline_time / seconds:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
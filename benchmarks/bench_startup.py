@@ -0,0 +1,66 @@
+"""Measure cold start of the MCP server over stdio against a synthetic cluster.
+
+Spawns kube_mcp_server.py --transport stdio --runs times, the way MCP clients that start a server
+per session do, and reports the time until the session is initialized, until the tool list is
+returned and until the first tool call is answered. The server is pointed at
+benchmarks/fake_apiserver.py through a generated kubeconfig, so the first call includes loading
+the config and the API group it needs.
+
+    python benchmarks/bench_startup.py --runs 5 --tool list_pods
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from bench_tools import KUBECONFIG, REPO
+from fake_apiserver import add_cluster_arguments, cluster_from_args, serve
+
+
+async def cold_start(kubeconfig, tool):
+    from fastmcp import Client
+    from fastmcp.client.transports import PythonStdioTransport
+
+    transport = PythonStdioTransport(
+        os.path.join(REPO, "kube_mcp_server.py"), args=["--transport", "stdio"],
+        env={**os.environ, "KUBECONFIG": kubeconfig}, cwd=REPO, keep_alive=False,
+    )
+    start = time.perf_counter()
+    async with Client(transport, timeout=120) as client:
+        initialized = time.perf_counter() - start
+        await client.list_tools()
+        listed = time.perf_counter() - start
+        result = await client.call_tool(tool, {}, raise_on_error=False)
+        answered = time.perf_counter() - start
+        text = "".join(getattr(c, "text", "") for c in result.content)
+        if result.is_error or text.startswith("Error"):
+            raise RuntimeError(f"{tool} failed: {text[:200]}")
+    return initialized, listed, answered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_cluster_arguments(parser)
+    parser.add_argument("--runs", type=int, default=5, help="server processes to start")
+    parser.add_argument("--tool", default="list_namespaces", help="tool called once per run, without arguments")
+    args = parser.parse_args()
+    server = serve(cluster_from_args(args))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kubeconfig = os.path.join(tmp, "kubeconfig")
+        with open(kubeconfig, "w") as f:
+            f.write(KUBECONFIG.format(port=server.server_port))
+        runs = [asyncio.run(cold_start(kubeconfig, args.tool)) for _ in range(args.runs)]
+    server.shutdown()
+
+    print(f"{args.runs} cold starts over stdio, python {sys.version.split()[0]}, first call {args.tool}")
+    print(f"{'milestone':<24}{'median s':>10}{'min s':>8}{'max s':>8}")
+    for label, values in zip(("initialized", "tools listed", "first call answered"), zip(*runs)):
+        print(f"{label:<24}{statistics.median(values):>10.2f}{min(values):>8.2f}{max(values):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
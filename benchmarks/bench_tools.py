@@ -0,0 +1,228 @@
+"""Drive MCP tools over the HTTP transport against a synthetic cluster and report latency.
+
+Starts benchmarks/fake_apiserver.py and kube_mcp_server.py as subprocesses (the server
+pointed at the fake cluster through a generated kubeconfig), then calls each tool --calls
+times from --concurrency concurrent MCP sessions. Per tool it reports p50/p99 latency,
+calls per second, bytes returned per call and the server's peak RSS so far.
+
+    python benchmarks/bench_tools.py --pods 50000 --deployments 5000 --events 100000 --concurrency 8
+    python benchmarks/bench_tools.py --tools list_pods,describe_pod --calls 200 --cache-ttl 5
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from fake_apiserver import SyntheticCluster, add_cluster_arguments, cluster_from_args
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+KUBECONFIG = """apiVersion: v1
+kind: Config
+clusters:
+- name: fake
+  cluster: {{server: "http://127.0.0.1:{port}"}}
+users:
+- name: bench
+  user: {{token: bench}}
+contexts:
+- name: fake
+  context: {{cluster: fake, user: bench}}
+current-context: fake
+"""
+CURSOR = object()  # stands for a changes cursor taken from a listing just before the scenario runs
+
+
+def scenarios(cluster):
+    """(label, tool, arguments) for each benchmarked call, aimed at objects that exist in cluster."""
+    namespace = cluster.namespace_name(1)
+    pod = cluster.name("pods", 1)
+    deployment = cluster.name("deployments", 1)
+    return [
+        ("list_namespaces", "list_namespaces", {}),
+        ("list_nodes", "list_nodes", {}),
+        ("list_nodes fields", "list_nodes", {"fields": "name,status,roles,version"}),
+        ("list_pods", "list_pods", {}),
+        ("list_pods ns", "list_pods", {"namespace": namespace}),
+        ("list_pods fields", "list_pods", {"namespace": namespace, "fields": "name,phase,restarts,node"}),
+        ("list_pods page", "list_pods", {"page_size": 500}),
+        ("list_pods since", "list_pods", {"namespace": namespace, "since": CURSOR}),
+        ("list_deployments", "list_deployments", {}),
+        ("list_events", "list_events", {"namespace": namespace}),
+        ("describe_pod", "describe_pod", {"pod_name": pod, "namespace": namespace}),
+        ("describe_node", "describe_node", {"node_name": cluster.name("nodes", 0)}),
+        ("get_secret", "get_secret", {"secret_name": cluster.name("secrets", 1), "namespace": namespace}),
+        ("get_pod_logs", "get_pod_logs", {"pod_name": pod, "namespace": namespace, "tail_lines": 100}),
+        ("search_pod_logs", "search_pod_logs", {"pattern": "ERROR", "namespace": namespace, "deployment": deployment}),
+        ("query_events", "query_events", {"namespace": namespace, "group_by": "reason"}),
+        ("cluster_overview", "cluster_overview", {}),
+        ("get_workload_tree", "get_workload_tree", {"kind": "deployment", "name": deployment, "namespace": namespace}),
+        ("get_resource_usage", "get_resource_usage", {"kind": "pods", "sort_by": "memory"}),
+        ("bulk_update dry_run", "bulk_update", {"namespace": namespace, "replicas": 2, "dry_run": True}),
+        ("fan_out", "fan_out", {"tool": "list_pods", "arguments": {"namespace": namespace, "fields": "name,phase"}}),
+        ("batch", "batch", {"operations": [
+            {"verb": "get", "kind": "pods", "name": pod, "namespace": namespace},
+            {"verb": "events", "kind": "pods", "name": pod, "namespace": namespace},
+            {"verb": "get", "kind": "replicasets", "name": cluster.name("replicasets", 1), "namespace": namespace},
+            {"verb": "get", "kind": "deployments", "name": cluster.name("deployments", 1), "namespace": namespace},
+        ]}),
+    ]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            urllib.request.urlopen(url, timeout=2).close()
+            return
+        except urllib.error.HTTPError:
+            return  # the server answered
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} did not come up within {timeout}s")
+            time.sleep(0.2)
+
+
+def peak_rss_mib(pid):
+    """Peak resident set size of a process (Linux /proc), or None where unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+async def with_cursor(client, tool, arguments):
+    """arguments with a CURSOR placeholder replaced by the changes cursor of a listing taken now."""
+    if arguments.get("since") is not CURSOR:
+        return arguments
+    listing = {k: v for k, v in arguments.items() if k != "since"}
+    result = await client.call_tool(tool, listing, raise_on_error=False)
+    text = "".join(getattr(c, "text", "") for c in result.content)
+    cursors = [line.split(": ", 1)[1] for line in text.splitlines() if line.startswith("Changes cursor: ")]
+    if not cursors:
+        raise RuntimeError(f"{tool} returned no changes cursor: {text[:200]}")
+    return {**arguments, "since": cursors[-1]}
+
+
+async def run_scenario(clients, tool, arguments, calls):
+    latencies, sizes, errors = [], [], 0
+    queue = asyncio.Queue()
+    for _ in range(calls):
+        queue.put_nowait(None)
+
+    async def worker(client):
+        nonlocal errors
+        while not queue.empty():
+            queue.get_nowait()
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(tool, arguments, raise_on_error=False)
+                text = "".join(getattr(c, "text", "") for c in result.content)
+                errors += result.is_error or text.startswith("Error")
+                sizes.append(len(text.encode()))
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(c) for c in clients))
+    return latencies, sizes, errors, time.perf_counter() - start
+
+
+async def bench(args, cluster, url, server_pid):
+    from fastmcp import Client
+
+    selected = set(args.tools.split(",")) if args.tools else None
+    clients = [Client(url, timeout=300) for _ in range(args.concurrency)]
+    for client in clients:
+        await client.__aenter__()
+    try:
+        print(f"{'tool':<20}{'calls':>7}{'errors':>7}{'p50 ms':>10}{'p99 ms':>10}{'calls/s':>9}{'bytes/call':>12}{'peak RSS MiB':>14}")
+        for label, tool, arguments in scenarios(cluster):
+            if selected and tool not in selected and label not in selected:
+                continue
+            arguments = await with_cursor(clients[0], tool, arguments)
+            await clients[0].call_tool(tool, arguments, raise_on_error=False)  # warm up
+            latencies, sizes, errors, elapsed = await run_scenario(clients, tool, arguments, args.calls)
+            rss = peak_rss_mib(server_pid)
+            print(
+                f"{label:<20}{len(latencies):>7}{errors:>7}"
+                f"{percentile(latencies, 50) * 1000:>10.1f}{percentile(latencies, 99) * 1000:>10.1f}"
+                f"{len(latencies) / elapsed:>9.1f}{sum(sizes) // max(1, len(sizes)):>12,}"
+                f"{'n/a' if rss is None else f'{rss:.0f}':>14}",
+                flush=True,
+            )
+    finally:
+        for client in clients:
+            await client.__aexit__(None, None, None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_cluster_arguments(parser)
+    parser.add_argument("--concurrency", type=int, default=4, help="concurrent MCP sessions")
+    parser.add_argument("--calls", type=int, default=40, help="calls per tool")
+    parser.add_argument("--tools", help="comma-separated tools or scenario labels to run (default: all)")
+    parser.add_argument("--cache-ttl", type=float, default=0,
+                        help="KUBE_MCP_CACHE_TTL for the server (default 0: measure uncached calls)")
+    args = parser.parse_args()
+    cluster = cluster_from_args(args)
+    if args.tools:
+        known = {name for label, tool, _ in scenarios(cluster) for name in (label, tool)}
+        unknown = sorted(set(args.tools.split(",")) - known)
+        if unknown:
+            parser.error(f"no scenario for {', '.join(unknown)}; choose from {', '.join(sorted(known))}")
+
+    api_port, mcp_port = free_port(), free_port()
+    processes = []
+    with tempfile.TemporaryDirectory() as tmp:
+        kubeconfig = os.path.join(tmp, "kubeconfig")
+        with open(kubeconfig, "w") as f:
+            f.write(KUBECONFIG.format(port=api_port))
+        try:
+            fake_args = [f"--{k.replace('_', '-')}={getattr(args, k)}" for k in
+                         ("namespaces", "nodes", "pods", "deployments", "events", "log_lines")]
+            processes.append(subprocess.Popen(
+                [sys.executable, os.path.join(HERE, "fake_apiserver.py"), f"--port={api_port}", *fake_args],
+                stdout=subprocess.DEVNULL,
+            ))
+            wait_for(f"http://127.0.0.1:{api_port}/api/v1/namespaces?limit=1")
+            env = {**os.environ, "KUBECONFIG": kubeconfig, "KUBE_MCP_CACHE_TTL": str(args.cache_ttl)}
+            server_code = ("import kube_mcp_server as k; "
+                           f"k.mcp.run(transport='http', host='127.0.0.1', port={mcp_port}, show_banner=False, log_level='warning')")
+            server = subprocess.Popen([sys.executable, "-c", server_code], cwd=REPO, env=env)
+            processes.append(server)
+            url = f"http://127.0.0.1:{mcp_port}/mcp"
+            wait_for(url)
+            print(f"cluster: {cluster.counts['pods']} pods, {cluster.counts['deployments']} deployments, "
+                  f"{cluster.counts['events']} events, {cluster.counts['nodes']} nodes; "
+                  f"concurrency {args.concurrency}, {args.calls} calls per tool")
+            asyncio.run(bench(args, cluster, url, server.pid))
+        finally:
+            for process in processes:
+                process.terminate()
+                process.wait()
+
+
+if __name__ == "__main__":
+    main()
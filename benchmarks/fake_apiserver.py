@@ -0,0 +1,704 @@
+"""Stand-in Kubernetes API server serving a synthetic cluster, for benchmarks.
+
+Objects are generated on demand from their index, so a cluster of 50k pods and 100k events
+costs next to no memory. Lists support limit/continue, label and field selectors (equality
+only) and PartialObjectMetadataList; single reads, pod logs, workload scale and apply patches,
+namespace create/delete, watches (replaying changes made through the server) and
+metrics.k8s.io pod/node usage are served too. Requests are answered by a ThreadingHTTPServer, so the server is rarely the bottleneck.
+
+    python benchmarks/fake_apiserver.py --port 18080 --pods 50000 --deployments 5000 --events 100000
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# kind -> (API prefix, object kind, namespaced)
+KINDS = {
+    "namespaces": ("api/v1", "Namespace", False),
+    "nodes": ("api/v1", "Node", False),
+    "persistentvolumes": ("api/v1", "PersistentVolume", False),
+    "pods": ("api/v1", "Pod", True),
+    "services": ("api/v1", "Service", True),
+    "configmaps": ("api/v1", "ConfigMap", True),
+    "secrets": ("api/v1", "Secret", True),
+    "persistentvolumeclaims": ("api/v1", "PersistentVolumeClaim", True),
+    "events": ("api/v1", "Event", True),
+    "deployments": ("apis/apps/v1", "Deployment", True),
+    "replicasets": ("apis/apps/v1", "ReplicaSet", True),
+    "statefulsets": ("apis/apps/v1", "StatefulSet", True),
+    "daemonsets": ("apis/apps/v1", "DaemonSet", True),
+    "jobs": ("apis/batch/v1", "Job", True),
+    "cronjobs": ("apis/batch/v1", "CronJob", True),
+    "ingresses": ("apis/networking.k8s.io/v1", "Ingress", True),
+}
+METRICS_PREFIX = "apis/metrics.k8s.io/v1beta1"
+EVENT_REASONS = [
+    ("Normal", "Scheduled"), ("Normal", "Pulled"), ("Normal", "Created"), ("Normal", "Started"),
+    ("Warning", "BackOff"), ("Warning", "Unhealthy"), ("Warning", "FailedScheduling"), ("Normal", "Killing"),
+]
+CREATED = "2026-01-01T00:00:00Z"
+
+
+def _timestamp(seconds_ago):
+    return (datetime.now(timezone.utc) - timedelta(seconds=seconds_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _lookup(obj, path):
+    for part in path.split("."):
+        obj = obj.get(part) if isinstance(obj, dict) else None
+    return obj
+
+
+def _merge(target, patch):
+    """Recursively merge patch into target (dicts merge, anything else replaces) and return target."""
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def _selector(spec, value_of):
+    """Compile an equality-based label/field selector ("a=b,c!=d,e") into a predicate."""
+    terms = []
+    for term in filter(None, (t.strip() for t in (spec or "").split(","))):
+        match = re.match(r"^([^!=]+?)\s*(==|=|!=)\s*(.*)$", term)
+        if match:
+            key, op, value = match.groups()
+            terms.append((key, op != "!=", value))
+        else:
+            terms.append((term, None, None))
+
+    def matches(obj):
+        for key, equal, value in terms:
+            actual = value_of(obj, key)
+            if equal is None:
+                if actual is None:
+                    return False
+            elif (str(actual) == value if actual is not None else value == "") != equal:
+                return False
+        return True
+
+    return matches
+
+
+def _label(obj, key):
+    return obj["metadata"].get("labels", {}).get(key)
+
+
+class SyntheticCluster:
+    """Deterministic cluster contents: object i of a kind is always the same."""
+
+    def __init__(self, namespaces=20, nodes=50, pods=5000, deployments=500, events=10000, log_lines=1000, **counts):
+        deployments = max(1, deployments)
+        self.counts = {
+            "namespaces": max(1, namespaces),
+            "nodes": max(1, nodes),
+            "pods": pods,
+            "deployments": deployments,
+            "replicasets": deployments,
+            "events": events,
+            "statefulsets": max(1, deployments // 10),
+            "daemonsets": 3,
+            "services": deployments,
+            "configmaps": deployments,
+            "secrets": deployments,
+            "jobs": max(1, deployments // 5),
+            "cronjobs": max(1, deployments // 20),
+            "ingresses": max(1, deployments // 10),
+        }
+        self.counts["persistentvolumeclaims"] = self.counts["persistentvolumes"] = self.counts["statefulsets"]
+        self.counts.update({k: v for k, v in counts.items() if v is not None})
+        self.log_lines = log_lines
+        self.lock = threading.Lock()
+        self.resource_version = 1000
+        self.changes = []  # (resourceVersion, kind, event type, object) for watches
+        self.max_changes = 10000  # watch history kept; older resourceVersions get 410 Gone
+        self.compacted = self.resource_version
+        self.replicas = {}  # (namespace, workload name) -> scaled replicas
+        self.rolling = set()  # (namespace, workload name) of scaled workloads whose rollout is still running
+        self.applied = {}  # (kind, namespace, name) -> fields set by server-side apply
+        self.rollout_seconds = 1.0
+        self.extra_namespaces = {}
+        self.metrics_available = True  # False: metrics.k8s.io answers 404, as on a cluster without metrics-server
+        self.deleted_namespaces = set()
+
+    # -- naming -----------------------------------------------------------------------------
+
+    def namespace_name(self, n):
+        return f"ns-{n:03d}"
+
+    def namespace_index(self, kind, i):
+        """Index of the namespace object i of kind lives in, cheap enough to filter on."""
+        n = self.counts["namespaces"]
+        if kind == "pods":
+            return i % self.counts["deployments"] % n
+        if kind == "events":
+            return self.namespace_index("pods", i % max(1, self.counts["pods"]))
+        if kind == "daemonsets":
+            return 0
+        return i % n
+
+    def name(self, kind, i):
+        if kind == "namespaces":
+            return self.namespace_name(i)
+        if kind == "nodes":
+            return f"node-{i:04d}"
+        if kind == "pods":
+            return f"{self.name('replicasets', i % self.counts['deployments'])}-{i:06d}"
+        if kind == "replicasets":
+            return f"app-{i:05d}-7d9f8c6b5-{i:05d}"
+        if kind == "events":
+            return f"{self.name('pods', i % max(1, self.counts['pods']))}.{i:08d}"
+        return f"{kind[:-1] if kind.endswith('s') else kind}-{i:05d}"
+
+    def index(self, kind, name):
+        match = re.search(r"(\d+)$", name or "")
+        if not match:
+            return None
+        i = int(match.group(1))
+        return i if 0 <= i < self.counts.get(kind, 0) and self.name(kind, i) == name else None
+
+    # -- objects ------------------------------------------------------------------------------
+
+    def _metadata(self, kind, i, labels=None, owner=None):
+        meta = {
+            "name": self.name(kind, i),
+            "uid": f"{kind[:4]}-{i:012d}",
+            "resourceVersion": str(100 + i),
+            "creationTimestamp": CREATED,
+            "labels": labels or {"app": f"app-{i % 1000:05d}"},
+            "managedFields": [{"manager": "kube-controller-manager", "operation": "Update", "apiVersion": "v1",
+                               "time": CREATED, "fieldsType": "FieldsV1", "fieldsV1": {"f:metadata": {}}}],
+        }
+        if KINDS[kind][2]:
+            meta["namespace"] = self.namespace_name(self.namespace_index(kind, i))
+        if owner:
+            owner_kind, j = owner
+            meta["ownerReferences"] = [{"apiVersion": KINDS[owner_kind][0].split("/", 1)[-1], "kind": KINDS[owner_kind][1],
+                                        "name": self.name(owner_kind, j), "uid": f"{owner_kind[:4]}-{j:012d}",
+                                        "controller": True}]
+        return meta
+
+    def _container(self, i):
+        return {
+            "name": "app",
+            "image": f"registry.example.com/app-{i % 1000:05d}:1.{i % 7}",
+            "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+            "env": [{"name": f"VAR_{n}", "value": f"value-{n}"} for n in range(5)],
+            "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"cpu": "500m", "memory": "512Mi"}},
+        }
+
+    def make(self, kind, i):
+        api_version, object_kind = KINDS[kind][0].split("/", 1)[-1], KINDS[kind][1]
+        obj = {"apiVersion": api_version, "kind": object_kind, **getattr(self, "_make_" + kind, self._make_generic)(kind, i)}
+        if self.applied:
+            overlay = self.applied.get((kind, obj["metadata"].get("namespace"), obj["metadata"]["name"]))
+            if overlay:
+                _merge(obj, overlay)
+        return obj
+
+    def _make_generic(self, kind, i):
+        return {"metadata": self._metadata(kind, i)}
+
+    def _make_namespaces(self, kind, i):
+        return {"metadata": self._metadata(kind, i, labels={"team": f"team-{i % 10}"}), "status": {"phase": "Active"}}
+
+    def _make_nodes(self, kind, i):
+        ready = "False" if i % 50 == 49 else "True"
+        pressure = "True" if i % 40 == 39 else "False"
+        role = "control-plane" if i < 3 else "worker"
+        return {
+            "metadata": self._metadata(kind, i, labels={f"node-role.kubernetes.io/{role}": "",
+                                                        "kubernetes.io/hostname": self.name(kind, i)}),
+            "spec": {"podCIDR": f"10.{i // 256 % 256}.{i % 256}.0/24"},
+            "status": {
+                "capacity": {"cpu": "16", "memory": "64Gi", "pods": "110"},
+                "allocatable": {"cpu": "15800m", "memory": "62Gi", "pods": "110"},
+                "conditions": [
+                    {"type": "Ready", "status": ready, "reason": "KubeletReady" if ready == "True" else "KubeletNotReady"},
+                    {"type": "MemoryPressure", "status": pressure},
+                    {"type": "DiskPressure", "status": "False"},
+                    {"type": "PIDPressure", "status": "False"},
+                ],
+                "nodeInfo": {"kubeletVersion": "v1.30.2", "osImage": "Ubuntu 22.04", "containerRuntimeVersion": "containerd://1.7"},
+                "addresses": [{"type": "InternalIP", "address": f"192.168.{i // 256 % 256}.{i % 256}"}],
+            },
+        }
+
+    def _make_pods(self, kind, i):
+        d = i % self.counts["deployments"]
+        labels = {"app": f"app-{d:05d}", "pod-template-hash": "7d9f8c6b5"}
+        if i % 40 == 7:
+            phase, state, ready, restarts = "Running", {"waiting": {"reason": "CrashLoopBackOff"}}, False, 12 + i % 30
+        elif i % 25 == 3:
+            phase, state, ready, restarts = "Pending", {"waiting": {"reason": "ContainerCreating"}}, False, 0
+        else:
+            phase, state, ready, restarts = "Running", {"running": {"startedAt": CREATED}}, True, i % 3
+        status = {
+            "phase": phase,
+            "podIP": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            "startTime": CREATED,
+            "conditions": [{"type": "Ready", "status": str(ready)}],
+            "containerStatuses": [{"name": "app", "ready": ready, "restartCount": restarts,
+                                   "image": self._container(d)["image"], "imageID": "sha256:" + "0" * 64, "state": state}],
+        }
+        if phase == "Pending":
+            status.pop("podIP")
+        return {
+            "metadata": self._metadata(kind, i, labels=labels, owner=("replicasets", d)),
+            "spec": {"nodeName": self.name("nodes", i % self.counts["nodes"]), "containers": [self._container(d)]},
+            "status": status,
+        }
+
+    def _workload(self, kind, i, replicas, ready, owner=None):
+        labels = {"app": f"app-{i:05d}"}
+        return {
+            "metadata": self._metadata(kind, i, labels=labels, owner=owner),
+            "spec": {"replicas": replicas, "selector": {"matchLabels": labels},
+                     "template": {"metadata": {"labels": labels}, "spec": {"containers": [self._container(i)]}}},
+            "status": {"replicas": replicas, "readyReplicas": ready, "availableReplicas": ready, "updatedReplicas": replicas},
+        }
+
+    def _make_deployments(self, kind, i):
+        obj = self._scaled_workload(kind, i, 3, broken=i % 20 == 19)
+        obj["status"]["unavailableReplicas"] = obj["spec"]["replicas"] - obj["status"]["readyReplicas"] or None
+        return obj
+
+    def _make_replicasets(self, kind, i):
+        return self._workload(kind, i, 3, 1 if i % 20 == 19 else 3, owner=("deployments", i))
+
+    def _make_statefulsets(self, kind, i):
+        return self._scaled_workload(kind, i, 2)
+
+    def _scaled_workload(self, kind, i, default_replicas, broken=False):
+        """A workload at its scaled replica count; broken ones keep one ready, rolling ones have none updated."""
+        key = (self.namespace_name(self.namespace_index(kind, i)), self.name(kind, i))
+        replicas = self.replicas.get(key, default_replicas)
+        obj = self._workload(kind, i, replicas, min(replicas, 1) if broken else replicas)
+        if key in self.rolling:
+            obj["status"]["updatedReplicas"] = 0
+        return obj
+
+    def scale(self, kind, namespace, name, replicas):
+        """Scale a workload; its rollout completes rollout_seconds later, with a MODIFIED change for each step."""
+        key = (namespace, name)
+        self.replicas[key] = replicas
+        self.rolling.add(key)
+        self.record(kind, "MODIFIED", self.get(kind, namespace, name))
+
+        def finish():
+            self.rolling.discard(key)
+            self.record(kind, "MODIFIED", self.get(kind, namespace, name))
+
+        timer = threading.Timer(self.rollout_seconds, finish)
+        timer.daemon = True
+        timer.start()
+
+    def _make_daemonsets(self, kind, i):
+        nodes = self.counts["nodes"]
+        obj = self._workload(kind, i, None, None)
+        obj["status"] = {"desiredNumberScheduled": nodes, "currentNumberScheduled": nodes, "numberMisscheduled": 0,
+                         "numberReady": nodes - (1 if i == 0 else 0), "numberAvailable": nodes - (1 if i == 0 else 0),
+                         "numberUnavailable": 1 if i == 0 else None}
+        return obj
+
+    def _make_services(self, kind, i):
+        return {"metadata": self._metadata(kind, i),
+                "spec": {"type": "ClusterIP", "clusterIP": f"172.20.{i // 256 % 256}.{i % 256}",
+                         "selector": {"app": f"app-{i:05d}"}, "ports": [{"port": 80, "targetPort": 8080, "protocol": "TCP"}]}}
+
+    def _make_configmaps(self, kind, i):
+        return {"metadata": self._metadata(kind, i), "data": {"application.yaml": "key: value\n" * 50, "LOG_LEVEL": "info"}}
+
+    def _make_secrets(self, kind, i):
+        if i % 100 == 42:  # Helm release secrets are the large ones in real clusters
+            return {"metadata": self._metadata(kind, i, labels={"owner": "helm", "name": f"release-{i:05d}"}),
+                    "type": "helm.sh/release.v1", "data": {"release": "SDRz" * 256 * 1024}}
+        return {"metadata": self._metadata(kind, i), "type": "Opaque",
+                "data": {"username": "YWRtaW4=", "password": "c2VjcmV0", "tls.crt": "QUFB" * 512}}
+
+    def _make_persistentvolumeclaims(self, kind, i):
+        return {"metadata": self._metadata(kind, i),
+                "spec": {"accessModes": ["ReadWriteOnce"], "storageClassName": "standard", "volumeName": f"pv-{i:05d}",
+                         "resources": {"requests": {"storage": "10Gi"}}},
+                "status": {"phase": "Bound", "capacity": {"storage": "10Gi"}}}
+
+    def _make_persistentvolumes(self, kind, i):
+        claim_ns = self.namespace_name(self.namespace_index("persistentvolumeclaims", i))
+        return {"metadata": self._metadata(kind, i),
+                "spec": {"capacity": {"storage": "10Gi"}, "storageClassName": "standard",
+                         "persistentVolumeReclaimPolicy": "Delete",
+                         "claimRef": {"namespace": claim_ns, "name": self.name("persistentvolumeclaims", i)}},
+                "status": {"phase": "Bound"}}
+
+    def _make_events(self, kind, i):
+        pod = i % max(1, self.counts["pods"])
+        event_type, reason = EVENT_REASONS[i % len(EVENT_REASONS)]
+        stamp = _timestamp(i % 3600)
+        return {"metadata": self._metadata(kind, i),
+                "involvedObject": {"kind": "Pod", "name": self.name("pods", pod),
+                                   "namespace": self.namespace_name(self.namespace_index("pods", pod)), "apiVersion": "v1"},
+                "reason": reason, "type": event_type, "message": f"{reason} for container app (event {i})",
+                "count": 1 + i % 5, "firstTimestamp": stamp, "lastTimestamp": stamp,
+                "source": {"component": "kubelet"}}
+
+    def _make_jobs(self, kind, i):
+        failed = i % 10 == 9
+        cronjob = i % self.counts["namespaces"]  # same namespace as job i
+        owner = ("cronjobs", cronjob) if cronjob < self.counts["cronjobs"] else None
+        return {"metadata": self._metadata(kind, i, owner=owner),
+                "spec": {"completions": 1, "template": {"spec": {"containers": [self._container(i)]}}},
+                "status": {"succeeded": 0 if failed else 1, "failed": 1 if failed else None, "startTime": CREATED}}
+
+    def _make_cronjobs(self, kind, i):
+        return {"metadata": self._metadata(kind, i),
+                "spec": {"schedule": "*/15 * * * *", "suspend": False,
+                         "jobTemplate": {"spec": {"template": {"spec": {"containers": [self._container(i)]}}}}},
+                "status": {"lastScheduleTime": _timestamp(i % 900)}}
+
+    def _make_ingresses(self, kind, i):
+        return {"metadata": self._metadata(kind, i),
+                "spec": {"ingressClassName": "nginx",
+                         "rules": [{"host": f"app-{i:05d}.example.com", "http": {"paths": [
+                             {"path": "/", "pathType": "Prefix",
+                              "backend": {"service": {"name": self.name("services", i), "port": {"number": 80}}}}]}}]},
+                "status": {"loadBalancer": {}}}
+
+    # -- queries ------------------------------------------------------------------------------
+
+    def get(self, kind, namespace, name):
+        if kind == "namespaces" and name in self.extra_namespaces:
+            return self.extra_namespaces[name]
+        i = self.index(kind, name)
+        if i is None or (kind == "namespaces" and name in self.deleted_namespaces):
+            return None
+        if KINDS[kind][2] and self.namespace_name(self.namespace_index(kind, i)) != namespace:
+            return None
+        return self.make(kind, i)
+
+    def scan(self, kind, namespace=None, start=0):
+        """Yield (index, object) from index start on, restricted to namespace."""
+        if namespace is not None:
+            match = re.match(r"^ns-(\d+)$", namespace)
+            if not match:
+                return
+            target = int(match.group(1))
+        for i in range(start, self.counts.get(kind, 0)):
+            if namespace is not None and self.namespace_index(kind, i) != target:
+                continue
+            if kind == "namespaces" and self.name(kind, i) in self.deleted_namespaces:
+                continue
+            yield i, self.make(kind, i)
+        if kind == "namespaces":
+            for j, obj in enumerate(list(self.extra_namespaces.values())):
+                if self.counts["namespaces"] + j >= start:
+                    yield self.counts["namespaces"] + j, obj
+
+    def list(self, kind, namespace=None, limit=None, continue_token=None, label_selector=None, field_selector=None):
+        """Return (items, next continue token or None)."""
+        labels = _selector(label_selector, _label)
+        fields = _selector(field_selector, _lookup)
+        items, start = [], int(continue_token or 0)
+        for i, obj in self.scan(kind, namespace, start):
+            if labels(obj) and fields(obj):
+                if limit and len(items) == limit:
+                    return items, str(i)
+                items.append(obj)
+        return items, None
+
+    def usage(self, kind, obj):
+        """metrics.k8s.io PodMetrics/NodeMetrics for a pod or node, None for pods that are not running.
+
+        Pods mostly use a fraction of their 100m/128Mi request; every 97th runs hot on CPU and every
+        89th on memory, so top-N and usage/request rankings have clear winners.
+        """
+        meta = obj["metadata"]
+        i = self.index(kind, meta["name"])
+        metrics = {"apiVersion": "metrics.k8s.io/v1beta1", "kind": "NodeMetrics" if kind == "nodes" else "PodMetrics",
+                   "metadata": {k: meta[k] for k in ("name", "namespace", "labels", "creationTimestamp") if k in meta},
+                   "timestamp": _timestamp(5), "window": "15s"}
+        if kind == "nodes":
+            metrics["usage"] = {"cpu": f"{(500 + i * 733 % 12000) * 10 ** 6}n", "memory": f"{(4 + i * 7 % 50) * 2 ** 20}Ki"}
+            return metrics
+        if obj["status"]["phase"] != "Running":
+            return None
+        cpu = 450 + i % 50 if i % 97 == 13 else 5 + i * 37 % 90
+        memory = 480 if i % 89 == 5 else 32 + i * 13 % 96
+        metrics["containers"] = [{"name": c["name"], "usage": {"cpu": f"{cpu * 10 ** 6}n", "memory": f"{memory * 1024}Ki"}}
+                                 for c in obj["spec"]["containers"]]
+        return metrics
+
+    def log(self, namespace, name, tail_lines=None, limit_bytes=None, timestamps=False):
+        lines = [f"{_timestamp(self.log_lines - n)} INFO {name} handled request {n} in {n % 97}ms\n" if n % 50 != 49
+                 else f"{_timestamp(self.log_lines - n)} ERROR {name} request {n} failed: upstream timeout\n"
+                 for n in range(self.log_lines)]
+        if timestamps:
+            lines = [f"{line[:20]} {line}" for line in lines]
+        if tail_lines is not None:
+            lines = lines[-tail_lines:] if tail_lines else []
+        data = "".join(lines).encode()
+        return data[:limit_bytes] if limit_bytes else data
+
+    # -- changes ------------------------------------------------------------------------------
+
+    def record(self, kind, event_type, obj):
+        with self.lock:
+            self.resource_version += 1
+            obj = {**obj, "metadata": {**obj["metadata"], "resourceVersion": str(self.resource_version)}}
+            self.changes.append((self.resource_version, kind, event_type, obj))
+            if len(self.changes) > self.max_changes:
+                self.compacted = self.changes.pop(0)[0]
+            return obj
+
+    def changes_since(self, kind, resource_version):
+        with self.lock:
+            return [(t, o) for rv, k, t, o in self.changes if k == kind and rv > resource_version]
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    cluster = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body, status=200, content_type="application/json"):
+        data = body if isinstance(body, bytes) else json.dumps(body, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        self.server.bytes_sent += len(data)
+
+    def _status(self, status, reason, message):
+        self._send({"kind": "Status", "apiVersion": "v1", "status": "Failure", "message": message,
+                    "reason": reason, "code": status}, status)
+
+    def _route(self):
+        """Split the path into (kind, namespace, name, subresource, query); kind None if not a resource path."""
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        parts = url.path.strip("/").split("/")
+        prefix = 2 if parts[:1] == ["api"] else 3
+        rest = parts[prefix:]
+        namespace = None
+        if len(rest) >= 3 and rest[0] == "namespaces":
+            namespace, rest = rest[1], rest[2:]
+        kind, name, sub = (rest + [None, None, None])[:3]
+        if kind not in KINDS or "/".join(parts[:prefix]) != KINDS[kind][0]:
+            return None, None, None, None, query
+        return kind, namespace, name, sub, query
+
+    def _metrics(self):
+        """Serve metrics.k8s.io pods and nodes (list, namespaced list and single reads) from the synthetic objects."""
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        rest = url.path.strip("/")[len(METRICS_PREFIX) + 1:].split("/")
+        namespace = None
+        if len(rest) >= 3 and rest[0] == "namespaces":
+            namespace, rest = rest[1], rest[2:]
+        kind, name = (rest + [None])[:2]
+        if kind not in ("pods", "nodes") or not self.cluster.metrics_available:
+            return self._status(404, "NotFound", f"the server could not find the requested resource ({self.path})")
+        cluster = self.cluster
+        if name:
+            obj = cluster.get(kind, namespace, name)
+            metrics = obj and cluster.usage(kind, obj)
+            if metrics is None:
+                return self._status(404, "NotFound", f'{kind}.metrics.k8s.io "{name}" not found')
+            return self._send(metrics)
+        items, token = cluster.list(kind, namespace, int(query.get("limit") or 0), query.get("continue"),
+                                    query.get("labelSelector"))
+        metadata = {"resourceVersion": ""}
+        if token:
+            metadata["continue"] = token
+        items = [m for m in (cluster.usage(kind, o) for o in items) if m is not None]
+        self._send({"apiVersion": "metrics.k8s.io/v1beta1", "kind": f"{'Node' if kind == 'nodes' else 'Pod'}MetricsList",
+                    "metadata": metadata, "items": items})
+
+    def do_GET(self):
+        if self.path.startswith(f"/{METRICS_PREFIX}/"):
+            return self._metrics()
+        kind, namespace, name, sub, query = self._route()
+        cluster = self.cluster
+        if kind is None:
+            return self._status(404, "NotFound", f"the server could not find the requested resource ({self.path})")
+        if name and sub == "log":
+            if cluster.get("pods", namespace, name) is None:
+                return self._status(404, "NotFound", f'pods "{name}" not found')
+            tail = query.get("tailLines")
+            limit = query.get("limitBytes")
+            return self._send(cluster.log(namespace, name, tail and int(tail), limit and int(limit),
+                                          query.get("timestamps") == "true"),
+                              content_type="text/plain")
+        if name:
+            obj = cluster.get(kind, namespace, name)
+            if obj is None:
+                return self._status(404, "NotFound", f'{kind} "{name}" not found')
+            return self._send(obj)
+        if query.get("watch") in ("1", "true"):
+            return self._watch(kind, namespace, query)
+        items, token = cluster.list(kind, namespace, int(query.get("limit") or 0), query.get("continue"),
+                                    query.get("labelSelector"), query.get("fieldSelector"))
+        api_version, object_kind = KINDS[kind][0].split("/", 1)[-1], KINDS[kind][1]
+        metadata = {"resourceVersion": str(cluster.resource_version)}
+        if token:
+            metadata["continue"] = token
+        if "as=PartialObjectMetadataList" in self.headers.get("Accept", ""):
+            items = [{"apiVersion": "meta.k8s.io/v1", "kind": "PartialObjectMetadata", "metadata": o["metadata"]}
+                     for o in items]
+            return self._send({"apiVersion": "meta.k8s.io/v1", "kind": "PartialObjectMetadataList",
+                               "metadata": metadata, "items": items})
+        self._send({"apiVersion": api_version, "kind": f"{object_kind}List", "metadata": metadata, "items": items})
+
+    def _watch(self, kind, namespace, query):
+        """Stream changes after resourceVersion, then a bookmark, until timeoutSeconds (at most 30s).
+
+        A resourceVersion older than the kept history gets an ERROR event with code 410, as from etcd compaction.
+        """
+        since = int(query.get("resourceVersion") or self.cluster.resource_version)
+        labels, fields = _selector(query.get("labelSelector"), _label), _selector(query.get("fieldSelector"), _lookup)
+        deadline = time.monotonic() + min(float(query.get("timeoutSeconds") or 30), 30)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def emit(event):
+            line = json.dumps(event, separators=(",", ":")).encode() + b"\n"
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+            self.wfile.flush()
+
+        try:
+            if since < self.cluster.compacted:
+                emit({"type": "ERROR", "object": {"kind": "Status", "apiVersion": "v1", "status": "Failure", "code": 410,
+                                                  "reason": "Expired", "message": f"too old resource version: {since}"}})
+                deadline = 0
+            while time.monotonic() < deadline:
+                current = self.cluster.resource_version
+                for event_type, obj in self.cluster.changes_since(kind, since):
+                    if (namespace is None or obj["metadata"].get("namespace") == namespace) and labels(obj) and fields(obj):
+                        emit({"type": event_type, "object": obj})
+                    since = max(since, int(obj["metadata"]["resourceVersion"]))
+                since = max(since, current)
+                if query.get("allowWatchBookmarks") in ("1", "true"):
+                    emit({"type": "BOOKMARK", "object": {"kind": KINDS[kind][1], "apiVersion": "v1",
+                                                         "metadata": {"resourceVersion": str(since)}}})
+                time.sleep(min(1.0, max(0.0, deadline - time.monotonic())))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_PATCH(self):
+        """Scale patches of deployments/statefulsets and server-side apply of workloads; dryRun=All persists nothing."""
+        kind, namespace, name, sub, query = self._route()
+        body = self._body()
+        dry_run = query.get("dryRun") == "All"
+        obj = self.cluster.get(kind, namespace, name) if kind in ("deployments", "statefulsets", "daemonsets") else None
+        if obj is None:
+            return self._status(404, "NotFound", f"cannot patch {self.path}")
+        if sub == "scale" and kind != "daemonsets":
+            replicas = body.get("spec", {}).get("replicas", obj["spec"]["replicas"])
+            if not dry_run:
+                self.cluster.scale(kind, namespace, name, replicas)
+            return self._send({"apiVersion": "autoscaling/v1", "kind": "Scale",
+                               "metadata": {"name": name, "namespace": namespace},
+                               "spec": {"replicas": replicas}, "status": {"replicas": obj["status"]["replicas"]}})
+        if sub is None and self.headers.get("Content-Type", "").startswith("application/apply-patch"):
+            if not query.get("fieldManager"):
+                return self._status(422, "Invalid", "fieldManager is required for apply requests")
+            if body.get("kind") != obj["kind"] or body.get("metadata", {}).get("name") != name:
+                return self._status(400, "BadRequest", "apply body kind/name do not match the request")
+            overlay = {k: v for k, v in body.items() if k not in ("apiVersion", "kind", "metadata", "status")}
+            if "spec" in overlay and "replicas" in overlay["spec"] and not dry_run:
+                self.cluster.scale(kind, namespace, name, overlay["spec"].pop("replicas"))
+            if dry_run:
+                return self._send(_merge(obj, overlay))
+            _merge(self.cluster.applied.setdefault((kind, namespace, name), {}), overlay)
+            return self._send(self.cluster.record(kind, "MODIFIED", self.cluster.get(kind, namespace, name)))
+        return self._status(415, "UnsupportedMediaType", f"cannot patch {self.path}")
+
+    def do_POST(self):
+        kind, _, name, _, _ = self._route()
+        body = self._body()
+        if kind != "namespaces" or name:
+            return self._status(405, "MethodNotAllowed", f"cannot create {self.path}")
+        new_name = body.get("metadata", {}).get("name")
+        if self.cluster.get("namespaces", None, new_name) is not None:
+            return self._status(409, "AlreadyExists", f'namespaces "{new_name}" already exists')
+        obj = {"apiVersion": "v1", "kind": "Namespace", "status": {"phase": "Active"},
+               "metadata": {"name": new_name, "uid": f"extra-{new_name}", "creationTimestamp": _timestamp(0)}}
+        obj = self.cluster.extra_namespaces[new_name] = self.cluster.record("namespaces", "ADDED", obj)
+        self._send(obj, 201)
+
+    def do_DELETE(self):
+        kind, _, name, _, _ = self._route()
+        obj = self.cluster.get(kind, None, name) if kind == "namespaces" else None
+        if obj is None:
+            return self._status(404, "NotFound", f"cannot delete {self.path}")
+        self.cluster.extra_namespaces.pop(name, None)
+        self.cluster.deleted_namespaces.add(name)
+        self._send(self.cluster.record("namespaces", "DELETED", obj))
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)  # clients giving up (timeouts) are expected
+
+
+def serve(cluster, host="127.0.0.1", port=0):
+    """Start serving cluster in a background thread; returns the server (see server.server_port)."""
+    handler = type("BoundHandler", (Handler,), {"cluster": cluster})
+    server = Server((host, port), handler)
+    server.bytes_sent = 0
+    threading.Thread(target=server.serve_forever, name="fake-apiserver", daemon=True).start()
+    return server
+
+
+def add_cluster_arguments(parser):
+    parser.add_argument("--namespaces", type=int, default=20)
+    parser.add_argument("--nodes", type=int, default=50)
+    parser.add_argument("--pods", type=int, default=5000)
+    parser.add_argument("--deployments", type=int, default=500)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--log-lines", type=int, default=1000)
+
+
+def cluster_from_args(args):
+    return SyntheticCluster(namespaces=args.namespaces, nodes=args.nodes, pods=args.pods,
+                            deployments=args.deployments, events=args.events, log_lines=args.log_lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18080)
+    add_cluster_arguments(parser)
+    args = parser.parse_args()
+    server = serve(cluster_from_args(args), args.host, args.port)
+    print(f"fake API server on http://{args.host}:{server.server_port}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
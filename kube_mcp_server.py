@@ -1,605 +1,3877 @@
 
-from fastmcp import FastMCP
-from kubernetes import client, config
+import time
+
+_started = time.perf_counter()  # baseline of the startup report, taken before the heavy imports below
+
+import argparse
+import asyncio
+import base64
+import codecs
+import contextvars
+import heapq
+import inspect
+import json
+import keyword
+import logging
+import os
+import re
+import sys
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, partial, wraps
+
+from fastmcp import Context, FastMCP
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+import yaml
+from starlette.responses import PlainTextResponse
+import urllib3
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding/encoding
+    orjson = None
+
+mcp = FastMCP("Kubernetes MCP Server")
+logger = logging.getLogger("kube_mcp_server")
+
+# Startup report: seconds per startup phase, in the order they happened. "ready" and "first tool call"
+# count from the start of the imports; the others are durations.
+_startup = {"imports": time.perf_counter() - _started}
+
+
+def _startup_phase(name, seconds):
+    _startup.setdefault(name, seconds)
+
+
+def _startup_report():
+    return "\n".join(f"{phase:<28}{seconds * 1000:>9.0f} ms" for phase, seconds in list(_startup.items()))
+
+
+# Connection pool size per context; urllib3 keeps at most this many idle connections.
+POOL_MAXSIZE = int(os.environ.get("KUBE_MCP_POOL_MAXSIZE", "32"))
+# How often (seconds) to stat kubeconfig / token files for changes.
+CONFIG_CHECK_INTERVAL = float(os.environ.get("KUBE_MCP_CONFIG_CHECK_INTERVAL", "5"))
+SERVICE_ACCOUNT_TOKEN = "/var/run/secrets/kubernetes.io/serviceaccount/token"
+
+
+class KubeClientManager:
+    """Process-wide ApiClient cache, one per kubeconfig context.
+
+    Config is loaded on first use and only reloaded when the kubeconfig files or the
+    in-cluster service account token change on disk. Short-lived exec/OIDC tokens are
+    refreshed by the client's own refresh_api_key_hook, so no reload is needed for them.
+    """
+
+    def __init__(self, pool_maxsize=POOL_MAXSIZE, check_interval=CONFIG_CHECK_INTERVAL):
+        self.pool_maxsize = pool_maxsize
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._locks = {}  # context -> lock held while that context's config is checked or loaded
+        self._entries = {}
+
+    def _watched_files(self):
+        paths = os.environ.get("KUBECONFIG") or "~/.kube/config"
+        files = [os.path.expanduser(p) for p in paths.split(os.pathsep) if p]
+        files.append(SERVICE_ACCOUNT_TOKEN)
+        return files
+
+    def _fingerprint(self):
+        stamp = []
+        for path in self._watched_files():
+            try:
+                st = os.stat(path)
+                stamp.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append((path, None, None))
+        return tuple(stamp)
+
+    def _load(self, context):
+        start = time.perf_counter()
+        configuration = client.Configuration()
+        try:
+            config.load_kube_config(context=context, client_configuration=configuration)
+        except Exception:
+            if context:
+                raise
+            config.load_incluster_config(client_configuration=configuration)
+        configuration.connection_pool_maxsize = self.pool_maxsize
+        _startup_phase(f"config {context or 'default'}", time.perf_counter() - start)
+        return InstrumentedApiClient(configuration)
+
+    def _context_lock(self, context):
+        with self._lock:
+            return self._locks.setdefault(context, threading.Lock())
+
+    def _entry(self, context):
+        # Per-context locks: a slow exec/OIDC plugin of one context does not hold up loading the others.
+        with _phase("config"), self._context_lock(context):
+            entry = self._entries.get(context)
+            now = time.monotonic()
+            if entry and now - entry["checked_at"] < self.check_interval:
+                return entry
+            fingerprint = self._fingerprint()
+            if entry and entry["fingerprint"] == fingerprint:
+                entry["checked_at"] = now
+                return entry
+            # Replaced clients are not closed: other threads may still have requests in flight.
+            entry = {
+                "api_client": self._load(context),
+                "apis": {},
+                "fingerprint": fingerprint,
+                "checked_at": now,
+            }
+            self._entries[context] = entry
+            return entry
+
+    def contexts(self):
+        """Return (context names, current context) from the kubeconfig; ([], None) without one."""
+        try:
+            contexts, current = config.list_kube_config_contexts()
+        except Exception:
+            return [], None
+        return [c["name"] for c in contexts], current and current["name"]
+
+    def api_client(self, context=None):
+        """Return the shared ApiClient for a context (None = current/in-cluster)."""
+        return self._entry(context)["api_client"]
+
+    def api(self, api_name, context=None):
+        """Return a shared typed API object for a context, by client class name (e.g. "CoreV1Api").
+
+        API groups are imported on first use: each generated module costs 0.1-1s to load.
+        """
+        entry = self._entry(context)
+        api = entry["apis"].get(api_name)
+        if api is None:
+            api = entry["apis"].setdefault(api_name, _api_class(api_name)(entry["api_client"]))
+        return api
+
+
+@lru_cache(maxsize=None)
+def _api_class(api_name):
+    start = time.perf_counter()
+    api_cls = getattr(client, api_name)
+    _startup_phase(f"load {api_name}", time.perf_counter() - start)
+    return api_cls
+
+
+_clients = KubeClientManager()
+
+# kind -> (API class name, namespaced list method, all-namespaces / cluster-scoped list method)
+LIST_RESOURCES = {
+    "pods": ("CoreV1Api", "list_namespaced_pod", "list_pod_for_all_namespaces"),
+    "services": ("CoreV1Api", "list_namespaced_service", "list_service_for_all_namespaces"),
+    "configmaps": ("CoreV1Api", "list_namespaced_config_map", "list_config_map_for_all_namespaces"),
+    "secrets": ("CoreV1Api", "list_namespaced_secret", "list_secret_for_all_namespaces"),
+    "persistentvolumeclaims": (
+        "CoreV1Api", "list_namespaced_persistent_volume_claim", "list_persistent_volume_claim_for_all_namespaces"
+    ),
+    "events": ("CoreV1Api", "list_namespaced_event", "list_event_for_all_namespaces"),
+    "namespaces": ("CoreV1Api", None, "list_namespace"),
+    "nodes": ("CoreV1Api", None, "list_node"),
+    "persistentvolumes": ("CoreV1Api", None, "list_persistent_volume"),
+    "deployments": ("AppsV1Api", "list_namespaced_deployment", "list_deployment_for_all_namespaces"),
+    "daemonsets": ("AppsV1Api", "list_namespaced_daemon_set", "list_daemon_set_for_all_namespaces"),
+    "statefulsets": ("AppsV1Api", "list_namespaced_stateful_set", "list_stateful_set_for_all_namespaces"),
+    "replicasets": ("AppsV1Api", "list_namespaced_replica_set", "list_replica_set_for_all_namespaces"),
+    "jobs": ("BatchV1Api", "list_namespaced_job", "list_job_for_all_namespaces"),
+    "cronjobs": ("BatchV1Api", "list_namespaced_cron_job", "list_cron_job_for_all_namespaces"),
+    "ingresses": ("NetworkingV1Api", "list_namespaced_ingress", "list_ingress_for_all_namespaces"),
+}
+
+# Informer cache (opt-in): comma-separated kinds to serve from a LIST+WATCH backed store,
+# e.g. KUBE_MCP_INFORMERS=pods,deployments,services,configmaps,events
+INFORMER_KINDS = {k.strip() for k in os.environ.get("KUBE_MCP_INFORMERS", "").split(",") if k.strip()}
+# Seconds without a successful list/watch round after which cached data counts as stale.
+INFORMER_MAX_STALENESS = float(os.environ.get("KUBE_MCP_INFORMER_MAX_STALENESS", "120"))
+# What to do with stale data: "fallback" (query the API live), "serve" (use it anyway) or "error".
+INFORMER_STALE_POLICY = os.environ.get("KUBE_MCP_INFORMER_STALE_POLICY", "fallback")
+# How long a tool waits for the initial LIST of a freshly started informer before going live.
+INFORMER_SYNC_TIMEOUT = float(os.environ.get("KUBE_MCP_INFORMER_SYNC_TIMEOUT", "10"))
+INFORMER_WATCH_TIMEOUT = 300
+
+class StaleCacheError(Exception):
+    pass
+
+
+class WatchError(Exception):
+    """A watch stream ended with an ERROR event; status is the code it carried (410 = expired)."""
+
+    def __init__(self, status):
+        super().__init__(status.get("message") or f"watch error {status.get('code')}")
+        self.status = status.get("code")
+
+
+class ListWatch:
+    """Retry loop shared by the LIST+WATCH backed stores.
+
+    Subclasses provide _relist() and _watch(), a generator that runs a watch with
+    timeout_seconds=watch_timeout, applies its events and yields once per real change. A round
+    that delivers a change or lasts until about watch_timeout resets the backoff. Any other round
+    waits and doubles the backoff up to 60s: an API error, a dropped connection, a non-410 ERROR
+    event, or a watch closed early without a change (e.g. by a proxy). 410 Gone relists straight away.
+    """
+
+    watch_timeout = INFORMER_WATCH_TIMEOUT
+
+    def _run(self):
+        backoff = 1
+        while not self._stop.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                changed, started = False, time.monotonic()
+                for _ in self._watch():
+                    changed, backoff = True, 1
+                if changed or time.monotonic() - started >= 0.9 * self.watch_timeout:
+                    backoff = 1
+                    continue
+            except (ApiException, WatchError) as e:
+                if e.status == 410:
+                    self.resource_version = None
+                    continue
+            except Exception:
+                pass
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 60)
+
+
+class Informer(ListWatch):
+    """In-memory copy of one resource kind, kept current by a LIST followed by a resumed WATCH.
+
+    Objects are indexed by namespace and name. The watch resumes from the last seen
+    resourceVersion and falls back to a full relist when the server answers 410 Gone.
+    Handlers registered with add_handler are called as handler(event_type, obj) for
+    every ADDED/MODIFIED/DELETED change, including the synthetic ones produced by a relist.
+    """
+
+    def __init__(self, kind, context=None):
+        self.kind = kind
+        self.context = context
+        self.resource_version = None
+        self.last_sync = None
+        self.synced = threading.Event()
+        self._watching = False
+        self._by_namespace = {}
+        self._handlers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"informer-{self.kind}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def add_handler(self, handler):
+        with self._lock:
+            self._handlers.append(handler)
+            existing = [obj for objs in self._by_namespace.values() for obj in objs.values()]
+        for obj in existing:
+            handler("ADDED", obj)
+
+    def age(self):
+        """Seconds since the data was last known to be current (0 while the watch is connected)."""
+        if self.last_sync is None:
+            return None
+        return 0.0 if self._watching else time.monotonic() - self.last_sync
+
+    def list(self, namespace=None):
+        with self._lock:
+            if namespace is not None:
+                return [obj for _, obj in sorted(self._by_namespace.get(namespace, {}).items())]
+            return [obj for ns in sorted(self._by_namespace) for _, obj in sorted(self._by_namespace[ns].items())]
+
+    def get(self, namespace, name):
+        with self._lock:
+            return self._by_namespace.get(namespace or "", {}).get(name)
+
+    def _list_fn(self):
+        api_name, _, method = LIST_RESOURCES[self.kind]
+        return getattr(_clients.api(api_name, self.context), method)
+
+    def _notify(self, events):
+        for event_type, obj in events:
+            for handler in list(self._handlers):
+                try:
+                    handler(event_type, obj)
+                except Exception:
+                    pass
+
+    def _relist(self):
+        store, resource_version = {}, None
+        for items, _, resource_version in _iter_pages(self._list_fn()):
+            for obj in items:
+                store.setdefault(obj.metadata.namespace or "", {})[obj.metadata.name] = obj
+        with self._lock:
+            old, self._by_namespace = self._by_namespace, store
+        events = [
+            ("DELETED", obj)
+            for ns, objs in old.items()
+            for name, obj in objs.items()
+            if name not in store.get(ns, {})
+        ]
+        events += [
+            ("MODIFIED" if name in old.get(ns, {}) else "ADDED", obj)
+            for ns, objs in store.items()
+            for name, obj in objs.items()
+        ]
+        self._notify(events)
+        self.resource_version = resource_version
+        self.last_sync = time.monotonic()
+        self.synced.set()
+
+    def _apply(self, event_type, obj):
+        ns, name = obj.metadata.namespace or "", obj.metadata.name
+        with self._lock:
+            if event_type == "DELETED":
+                self._by_namespace.get(ns, {}).pop(name, None)
+            else:
+                self._by_namespace.setdefault(ns, {})[name] = obj
+        self._notify([(event_type, obj)])
+
+    def _watch(self):
+        stream = watch.Watch().stream(
+            self._list_fn(),
+            resource_version=self.resource_version,
+            timeout_seconds=self.watch_timeout,
+            allow_watch_bookmarks=True,
+            _request_timeout=self.watch_timeout + 30,
+        )
+        self._watching = True
+        try:
+            for event in stream:
+                if self._stop.is_set():
+                    return
+                event_type = event["type"]
+                if event_type == "ERROR":
+                    raise WatchError(event["raw_object"])
+                if event_type == "BOOKMARK":
+                    self.resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+                    continue
+                obj = event["object"]
+                self.resource_version = obj.metadata.resource_version
+                self._apply(event_type, obj)
+                yield event_type
+        finally:
+            self._watching = False
+            self.last_sync = time.monotonic()
+
+
+class InformerRegistry:
+    """Starts informers lazily for the kinds enabled in KUBE_MCP_INFORMERS."""
+
+    def __init__(self, kinds=INFORMER_KINDS):
+        self.kinds = set(kinds)
+        self._lock = threading.Lock()
+        self._informers = {}
+
+    def informer(self, kind, context=None):
+        """Return the (started) informer for kind, creating it on first use."""
+        with self._lock:
+            informer = self._informers.get((kind, context))
+            if informer is None:
+                informer = self._informers[(kind, context)] = Informer(kind, context).start()
+        return informer
+
+    def usable(self, kind, context=None):
+        """Return the informer for kind if it is enabled and fresh enough to serve reads, else None."""
+        if kind not in self.kinds:
+            return None
+        informer = self.informer(kind, context)
+        if not informer.synced.wait(INFORMER_SYNC_TIMEOUT):
+            return None
+        age = informer.age()
+        if age is not None and age > INFORMER_MAX_STALENESS:
+            if INFORMER_STALE_POLICY == "serve":
+                return informer
+            if INFORMER_STALE_POLICY == "error":
+                raise StaleCacheError(f"{kind} cache is {age:.0f}s old")
+            return None
+        return informer
+
+
+_informers = InformerRegistry()
+
+
+def _per_tool(spec, cast):
+    """Parse "default,tool=value,..." into (default, {tool: value})."""
+    default, overrides = None, {}
+    for item in (s.strip() for s in spec.split(",")):
+        if "=" in item:
+            name, value = item.split("=", 1)
+            overrides[name.strip()] = cast(value)
+        elif item:
+            default = cast(item)
+    return default, overrides
+
+
+# Worker threads shared by all blocking tool calls; bounds how many API calls run at once.
+TOOL_WORKERS = int(os.environ.get("KUBE_MCP_TOOL_WORKERS", "32"))
+# Calls of one tool that may run at once, e.g. "8,get_pod_logs=2"; further calls wait their turn.
+TOOL_CONCURRENCY, TOOL_CONCURRENCY_OVERRIDES = _per_tool(os.environ.get("KUBE_MCP_TOOL_CONCURRENCY", "8"), int)
+# Seconds a tool call may take (0 = unlimited), e.g. "120,describe_node=30".
+TOOL_TIMEOUT, TOOL_TIMEOUT_OVERRIDES = _per_tool(os.environ.get("KUBE_MCP_TOOL_TIMEOUT", "120"), float)
+
+_tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="kube-mcp-tool")
+_tool_limits = {}
+# Blocking tool implementations by name, for tools that call other tools.
+_TOOL_IMPLS = {}
+# Names of the read-only tools (those with a cache kind), safe to fan out or batch.
+_READ_TOOLS = set()
+
+
+class ToolCancelled(Exception):
+    pass
+
+
+class _CallScope:
+    """Deadline, cancellation flag and phase timings of one tool call, shared with the blocking code it runs.
+
+    A child scope (for work the call spreads over other threads) has its own deadline but adds
+    its timings to the parent's.
+    """
+
+    def __init__(self, timeout, tool=None, parent=None):
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.cancelled = threading.Event()
+        self.tool = tool or (parent.tool if parent else None)
+        self.phases = parent.phases if parent else {}
+        self.local = parent.local if parent else threading.local()
+        self._lock = parent._lock if parent else threading.Lock()
+        self.api_status = None
+        self.timed_out = False
+        self.started = time.monotonic()
+        self.samples = Counter()
+
+    def remaining(self):
+        return None if self.deadline is None else max(0.0, self.deadline - time.monotonic())
+
+    def add_phase(self, phase, seconds):
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+_call_scope = contextvars.ContextVar("kube_mcp_call_scope", default=None)
+
+
+def _check_cancelled():
+    """Raise ToolCancelled if the current tool call was cancelled or ran out of time."""
+    scope = _call_scope.get()
+    if scope is not None and (scope.cancelled.is_set() or scope.remaining() == 0):
+        raise ToolCancelled("tool call cancelled or timed out")
+
+
+def _remaining():
+    """Seconds left for the current tool call, or None without a deadline."""
+    scope = _call_scope.get()
+    return None if scope is None else scope.remaining()
+
+
+def _request_timeout():
+    """The time the current tool call has left, as an API request timeout (None without a deadline).
+
+    Raises ToolCancelled once none is left: the client rejects a timeout that is not positive.
+    """
+    remaining = _remaining()
+    if remaining is not None and remaining <= 0:
+        raise ToolCancelled("tool call timed out")
+    return remaining
+
+
+@contextmanager
+def _phase(name):
+    """Count the time spent in the block towards phase name of the current tool call.
+
+    Phases nest: time spent in an inner phase (e.g. api inside render, while a generator
+    fetches the next page) is only counted for the inner one.
+    """
+    scope = _call_scope.get()
+    if scope is None:
+        yield
+        return
+    local = scope.local
+    outer_nested = getattr(local, "nested", 0.0)
+    local.nested = 0.0
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        scope.add_phase(name, elapsed - local.nested)
+        local.nested = outer_nested + elapsed
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Metrics:
+    """Minimal in-process Prometheus registry (counters, gauges, histograms) in text exposition format.
+
+    Updates are a dict lookup under a lock, cheap enough to leave on for every call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._types = {}  # name -> (type, help, buckets)
+        self._values = {}  # (name, labels) -> number, or [bucket counts..., sum, count] for histograms
+
+    def describe(self, name, kind, help_text, buckets=None):
+        self._types[name] = (kind, help_text, buckets)
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._values[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name, value, **labels):
+        buckets = self._types[name][2]
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(buckets) + 2)
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    def render(self):
+        with self._lock:
+            values = sorted(((k, list(v) if isinstance(v, list) else v) for k, v in self._values.items()))
+        lines, described = [], set()
+        for (name, labels), value in values:
+            kind, help_text, buckets = self._types[name]
+            if name not in described:
+                described.add(name)
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            if kind != "histogram":
+                lines.append(f"{name}{_prom_labels(labels)} {value:g}")
+                continue
+            for bound, count in zip(list(buckets) + ["+Inf"], value[:-2] + [value[-1]]):
+                lines.append(f"{name}_bucket{_prom_labels(labels + (('le', f'{bound:g}' if bound != '+Inf' else bound),))} {count}")
+            lines.append(f"{name}_sum{_prom_labels(labels)} {value[-2]:g}")
+            lines.append(f"{name}_count{_prom_labels(labels)} {value[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+def _prom_labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+_metrics = Metrics()
+_metrics.describe("kube_mcp_tool_calls_total", "counter", "Tool calls completed.")
+_metrics.describe("kube_mcp_tool_errors_total", "counter", "Tool calls that returned an error, by API status code, timeout or error.")
+_metrics.describe("kube_mcp_tool_in_flight", "gauge", "Tool calls currently running or waiting for a slot.")
+_metrics.describe("kube_mcp_tool_duration_seconds", "histogram", "Tool call latency.", LATENCY_BUCKETS)
+_metrics.describe("kube_mcp_tool_phase_seconds", "histogram", "Time per tool call spent in config, api, deserialize and render.", LATENCY_BUCKETS)
+_metrics.describe("kube_mcp_tool_response_bytes", "histogram", "Size of tool answers.", BYTES_BUCKETS)
+_metrics.describe("kube_mcp_api_errors_total", "counter", "Kubernetes API requests that failed, by tool and HTTP status.")
+_metrics.describe("kube_mcp_cache_requests_total", "counter", "Response cache lookups by tool and result (hit, miss, coalesced).")
+_metrics.describe("kube_mcp_cache_entries", "gauge", "Answers held by the response cache.")
+_metrics.describe("kube_mcp_cache_bytes", "gauge", "Memory held by the response cache.")
+_metrics.describe("kube_mcp_event_store_events", "gauge", "Events held by the event store, by context.")
+_metrics.describe("kube_mcp_event_store_bytes", "gauge", "Estimated memory held by the event store, by context.")
+_metrics.describe("kube_mcp_slow_calls_total", "counter", "Tool calls that exceeded KUBE_MCP_PROFILE_SLOW_SECONDS.")
+_metrics.describe("kube_mcp_startup_seconds", "gauge", "Seconds spent per startup phase (see --startup-report).")
+
+
+class InstrumentedApiClient(client.ApiClient):
+    """ApiClient that reports API request and deserialization time and failed requests to the current tool call."""
+
+    def _call_with_legacy_options(self, *args, **kwargs):
+        with _phase("api"):
+            try:
+                return super()._call_with_legacy_options(*args, **kwargs)
+            except ApiException as e:
+                scope = _call_scope.get()
+                if scope is not None:
+                    scope.api_status = e.status
+                _metrics.inc("kube_mcp_api_errors_total", tool=scope.tool if scope else "background", status=str(e.status))
+                raise
+
+    def response_deserialize(self, *args, **kwargs):
+        with _phase("deserialize"):
+            return super().response_deserialize(*args, **kwargs)
+
+
+def _record_call(tool, scope, result, seconds):
+    _metrics.inc("kube_mcp_tool_calls_total", tool=tool)
+    _metrics.observe("kube_mcp_tool_duration_seconds", seconds, tool=tool)
+    for phase, spent in list(scope.phases.items()):
+        _metrics.observe("kube_mcp_tool_phase_seconds", spent, tool=tool, phase=phase)
+    if isinstance(result, str):
+        _metrics.observe("kube_mcp_tool_response_bytes", len(result.encode()), tool=tool)
+        if result.startswith("Error"):
+            status = scope.api_status or ("timeout" if scope.timed_out else "error")
+            _metrics.inc("kube_mcp_tool_errors_total", tool=tool, status=str(status))
+
+
+# Calls running longer than this many seconds get their stacks sampled (0 = profiler off).
+PROFILE_SLOW_SECONDS = float(os.environ.get("KUBE_MCP_PROFILE_SLOW_SECONDS", "0"))
+PROFILE_INTERVAL = float(os.environ.get("KUBE_MCP_PROFILE_INTERVAL", "0.01"))
+
+
+class SlowCallProfiler:
+    """Sampling profiler for slow blocking tool calls.
+
+    Once a call has run for threshold seconds, its worker thread's stack is sampled every
+    interval; when it finishes, the most frequent stacks are logged. Fast calls are never
+    sampled, so the cost is one dict update per call while no call is slow.
+    """
+
+    def __init__(self, threshold=PROFILE_SLOW_SECONDS, interval=PROFILE_INTERVAL, top=5, depth=12):
+        self.threshold, self.interval, self.top, self.depth = threshold, interval, top, depth
+        self._active = {}  # scope -> thread ident
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start_call(self, scope):
+        if not self.threshold:
+            return
+        with self._lock:
+            self._active[scope] = threading.get_ident()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="slow-call-profiler", daemon=True)
+                self._thread.start()
+
+    def end_call(self, scope):
+        if not self.threshold:
+            return
+        with self._lock:
+            self._active.pop(scope, None)
+        seconds = time.monotonic() - scope.started
+        if seconds < self.threshold:
+            return
+        _metrics.inc("kube_mcp_slow_calls_total", tool=scope.tool)
+        if not scope.samples:
+            return
+        hottest = "\n".join(f"  {count:5d}  {stack}" for stack, count in scope.samples.most_common(self.top))
+        logger.warning("slow call %s took %.2fs, %d samples:\n%s", scope.tool, seconds, sum(scope.samples.values()), hottest)
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            now = time.monotonic()
+            with self._lock:
+                active = [(s, ident) for s, ident in self._active.items() if now - s.started >= self.threshold]
+            if not active:
+                continue
+            frames = sys._current_frames()
+            for scope, ident in active:
+                frame = frames.get(ident)
+                if frame is not None:
+                    scope.samples[self._stack(frame)] += 1
+
+    def _stack(self, frame):
+        parts = []
+        while frame is not None and len(parts) < self.depth:
+            code = frame.f_code
+            parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+            frame = frame.f_back
+        return " <- ".join(parts)
+
+
+_profiler = SlowCallProfiler()
+
+
+# Seconds a read tool's answer is reused for identical calls (0 = no caching, only coalescing).
+CACHE_TTL = float(os.environ.get("KUBE_MCP_CACHE_TTL", "5"))
+# Upper bound on the memory held by cached answers; least recently used entries go first.
+CACHE_MAX_BYTES = int(os.environ.get("KUBE_MCP_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+
+class ResponseCache:
+    """Short-lived LRU cache of read tool answers keyed by (kinds, tool, arguments).
+
+    Identical calls that arrive while one is running share its result, so the API server
+    sees a single request. Write tools invalidate the kinds they change; answers of calls
+    that were already running when that happened are not stored. Calls made with store=False
+    are shared while running but never stored.
+    """
+
+    def __init__(self, ttl=CACHE_TTL, max_bytes=CACHE_MAX_BYTES):
+        self.ttl, self.max_bytes = ttl, max_bytes
+        self._entries = OrderedDict()  # key -> (expires, size, value)
+        self._inflight = {}
+        self._size = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.coalesced = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def put(self, key, value):
+        size = sys.getsizeof(value)
+        if self.ttl <= 0 or size > self.max_bytes or value.startswith("Error"):
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, kinds="*"):
+        """Forget answers about kinds ("*" for everything), including calls still running."""
+        def stale(key):
+            return kinds == "*" or any(kind in kinds for kind in key[0])
+
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._entries if stale(k)]:
+                self._drop(key)
+            for key in [k for k in self._inflight if stale(k)]:
+                del self._inflight[key]
+
+    async def get_or_run(self, key, compute, store=True):
+        value = self.get(key) if store else None
+        if value is not None:
+            self.hits += 1
+            _metrics.inc("kube_mcp_cache_requests_total", tool=key[1], result="hit")
+            return value
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            _metrics.inc("kube_mcp_cache_requests_total", tool=key[1], result="miss")
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            # A generation of None never matches, so the answer is dropped once the call finishes.
+            task.add_done_callback(partial(self._finish, key, self._generation if store else None))
+        else:
+            self.coalesced += 1
+            _metrics.inc("kube_mcp_cache_requests_total", tool=key[1], result="coalesced")
+        return await asyncio.shield(task)
+
+    def _finish(self, key, generation, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is None and generation == self._generation:
+            self.put(key, task.result())
+
+    def _drop(self, key):
+        self._size -= self._entries.pop(key)[1]
+
+    def usage(self):
+        """Return (entries, bytes) currently held."""
+        with self._lock:
+            return len(self._entries), self._size
+
+
+_responses = ResponseCache()
+
+
+def _tool(fn=None, *, timeout=None, cache=None, invalidates=None, sensitive=()):
+    """Register fn as an async MCP tool with a per-tool concurrency limit and timeout.
+
+    Blocking implementations run on _tool_executor inside a _CallScope, so API calls get the
+    remaining time as their request timeout and long loops stop once the caller has gone away
+    (a worker thread cannot be killed). Coroutine tools are awaited directly. timeout overrides
+    KUBE_MCP_TOOL_TIMEOUT for tools that bound their own duration.
+
+    cache names the kind (or a tuple of kinds) a read tool reports on; its answers then go
+    through _responses. sensitive names arguments that make an answer hold secret values:
+    calls passing them are still coalesced, but their answers are never stored.
+    invalidates lists the kinds a write tool changes ("*" for all).
+    """
+    if fn is None:
+        return partial(_tool, timeout=timeout, cache=cache, invalidates=invalidates, sensitive=sensitive)
+    name = fn.__name__
+    limit = TOOL_CONCURRENCY_OVERRIDES.get(name, TOOL_CONCURRENCY)
+    seconds = TOOL_TIMEOUT_OVERRIDES.get(name, TOOL_TIMEOUT if timeout is None else timeout)
+    is_async = asyncio.iscoroutinefunction(fn)
+    signature = inspect.signature(fn)
+    kinds = (cache,) if isinstance(cache, str) else cache
+
+    async def invoke(args, kwargs, scope):
+        if name not in _tool_limits:
+            _tool_limits[name] = asyncio.Semaphore(limit)
+
+        def call():
+            _call_scope.set(scope)
+            _profiler.start_call(scope)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _profiler.end_call(scope)
+
+        async def limited():
+            async with _tool_limits[name]:
+                if is_async:
+                    token = _call_scope.set(scope)
+                    try:
+                        return await fn(*args, **kwargs)
+                    finally:
+                        _call_scope.reset(token)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(_tool_executor, contextvars.Context().run, call)
+
+        try:
+            return await asyncio.wait_for(limited(), seconds or None)
+        except asyncio.TimeoutError:
+            scope.timed_out = True
+            return f"Error: {name} timed out after {seconds:g}s"
+        finally:
+            scope.cancelled.set()
+
+    @wraps(fn)
+    async def run(*args, **kwargs):
+        scope = _CallScope(seconds, tool=name)
+        start = time.perf_counter()
+        _metrics.inc("kube_mcp_tool_in_flight", tool=name)
+        try:
+            if cache is None:
+                result = await invoke(args, kwargs, scope)
+            else:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = (kinds, name, tuple(bound.arguments.items()))
+                store = not any(bound.arguments.get(arg) for arg in sensitive)
+                result = await _responses.get_or_run(key, partial(invoke, args, kwargs, scope), store)
+        finally:
+            _metrics.inc("kube_mcp_tool_in_flight", -1, tool=name)
+        if invalidates:
+            _responses.invalidate(invalidates)
+        _record_call(name, scope, result, time.perf_counter() - start)
+        _startup_phase("first tool call", time.perf_counter() - _started)
+        return result
+
+    if not is_async:
+        _TOOL_IMPLS[name] = fn
+        if cache:
+            _READ_TOOLS.add(name)
+    return mcp.tool(run)
+
+
+# Page size used when walking list results; each page is processed and dropped before the next.
+LIST_PAGE_SIZE = int(os.environ.get("KUBE_MCP_LIST_PAGE_SIZE", "500"))
+
+
+def _iter_pages(list_fn, *args, page_size=LIST_PAGE_SIZE, continue_token=None, **kwargs):
+    """Yield (items, continue_token, resource_version) for each page of a list call, following continue tokens."""
+    while True:
+        _check_cancelled()
+        page = list_fn(*args, limit=page_size, _continue=continue_token, **kwargs)
+        continue_token = _get(page, "metadata.continue")
+        yield _get(page, "items", []), continue_token, _get(page, "metadata.resourceVersion")
+        if not continue_token:
+            return
+
+
+def _iter_items(list_fn, *args, **kwargs):
+    """Yield every object of a list call, one page in memory at a time."""
+    for items, _, _ in _iter_pages(list_fn, *args, **kwargs):
+        yield from items
+
+
+def _list_lines(list_fn, *args, fmt, page_size=None, continue_token=None, **kwargs):
+    """Format list results into lines page by page.
+
+    Without page_size/continue_token all pages are walked. Otherwise a single page is fetched
+    and returned together with the token for the next one (None on the last page). The list's
+    resourceVersion comes last.
+    """
+    lines, resource_version = [], None
+    pages = _iter_pages(list_fn, *args, page_size=page_size or LIST_PAGE_SIZE, continue_token=continue_token, **kwargs)
+    for items, token, resource_version in pages:
+        with _phase("render"):
+            lines.extend(fmt(obj) for obj in items)
+        if page_size or continue_token:
+            return lines, token, resource_version
+    return lines, None, resource_version
+
+
+CONTINUE_NOTE = "More results available, continue_token: "
+CURSOR_NOTE = "Changes cursor: "
+
+
+def _with_continue(text, token):
+    return f"{text}\n{CONTINUE_NOTE}{token}" if token else text
+
+
+def _name(obj):
+    return _get(obj, "metadata.name")
+
+
+def _ns_name(obj):
+    namespace, name = _get(obj, "metadata.namespace"), _get(obj, "metadata.name")
+    return f"{namespace}/{name}" if namespace else name
+
+
+def _event_line(event):
+    return f"{_ns_name(event)}: {_get(event, 'message')}"
+
+def _loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dumps(obj):
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _read_raw(api_method, *args, **kwargs):
+    """Call a typed API method but return its JSON body as plain dicts, skipping model deserialization.
+
+    Inside a tool call the request timeout defaults to the time the call has left.
+    """
+    _check_cancelled()
+    if "_request_timeout" not in kwargs:
+        kwargs["_request_timeout"] = _request_timeout()
+    resp = api_method(*args, _preload_content=False, **kwargs)
+    with _phase("api"):
+        data = resp.data
+    with _phase("deserialize"):
+        return _loads(data)
+
+
+# Only used for sanitize_for_serialization, which reads neither configuration nor context.
+_serializer = client.ApiClient()
+
+
+def _as_dict(obj):
+    """Plain JSON-style dict for an API model (e.g. an informer object) or a raw dict."""
+    if obj is None or isinstance(obj, (dict, list, str, int, float, bool)):
+        return obj
+    return _serializer.sanitize_for_serialization(obj)
+
+
+@lru_cache(maxsize=None)
+def _snake(name):
+    if keyword.iskeyword(name):
+        return "_" + name  # e.g. ListMeta.continue is generated as _continue
+    return re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name).lower()
+
+
+def _get(obj, path, default=None):
+    """Read a dotted camelCase path (e.g. "status.podIP") from an API model or a raw JSON dict."""
+    for part in path.split("."):
+        if obj is None:
+            return default
+        obj = obj.get(part) if isinstance(obj, dict) else getattr(obj, _snake(part), None)
+    return default if obj is None else obj
+
+
+def _age(timestamp):
+    if not timestamp:
+        return None
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    seconds = int((datetime.now(timezone.utc) - timestamp).total_seconds())
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+
+def _ready_containers(pod):
+    statuses = _get(pod, "status.containerStatuses", [])
+    return f"{sum(1 for s in statuses if _get(s, 'ready'))}/{len(statuses)}"
+
+
+def _images(obj, path="spec.template.spec.containers"):
+    return ",".join(_get(c, "image", "") for c in _get(obj, path, []))
+
+
+def _node_status(node):
+    ready = [c for c in _get(node, "status.conditions", []) if _get(c, "type") == "Ready"]
+    status = "Ready" if ready and _get(ready[0], "status") == "True" else "NotReady"
+    return status + (",SchedulingDisabled" if _get(node, "spec.unschedulable") else "")
+
+
+def _node_roles(node):
+    prefix = "node-role.kubernetes.io/"
+    return ",".join(k[len(prefix):] for k in _get(node, "metadata.labels", {}) if k.startswith(prefix))
+
+
+# Columns available to the fields= projection of the list tools, on every kind and per kind.
+COMMON_COLUMNS = {
+    "namespace": lambda o: _get(o, "metadata.namespace"),
+    "name": lambda o: _get(o, "metadata.name"),
+    "age": lambda o: _age(_get(o, "metadata.creationTimestamp")),
+    "labels": lambda o: ",".join(f"{k}={v}" for k, v in _get(o, "metadata.labels", {}).items()),
+}
+KIND_COLUMNS = {
+    "pods": {
+        "phase": lambda o: _get(o, "status.phase"),
+        "node": lambda o: _get(o, "spec.nodeName"),
+        "ip": lambda o: _get(o, "status.podIP"),
+        "ready": _ready_containers,
+        "restarts": lambda o: sum(_get(s, "restartCount", 0) for s in _get(o, "status.containerStatuses", [])),
+        "images": lambda o: _images(o, "spec.containers"),
+    },
+    "deployments": {
+        "replicas": lambda o: _get(o, "spec.replicas"),
+        "ready": lambda o: f"{_get(o, 'status.readyReplicas', 0)}/{_get(o, 'spec.replicas', 0)}",
+        "updated": lambda o: _get(o, "status.updatedReplicas", 0),
+        "available": lambda o: _get(o, "status.availableReplicas", 0),
+        "images": _images,
+    },
+    "statefulsets": {
+        "replicas": lambda o: _get(o, "spec.replicas"),
+        "ready": lambda o: f"{_get(o, 'status.readyReplicas', 0)}/{_get(o, 'spec.replicas', 0)}",
+        "images": _images,
+    },
+    "replicasets": {
+        "replicas": lambda o: _get(o, "spec.replicas"),
+        "ready": lambda o: f"{_get(o, 'status.readyReplicas', 0)}/{_get(o, 'spec.replicas', 0)}",
+        "owner": lambda o: ",".join(f"{_get(r, 'kind')}/{_get(r, 'name')}" for r in _get(o, "metadata.ownerReferences", [])),
+        "images": _images,
+    },
+    "daemonsets": {
+        "desired": lambda o: _get(o, "status.desiredNumberScheduled", 0),
+        "ready": lambda o: _get(o, "status.numberReady", 0),
+        "available": lambda o: _get(o, "status.numberAvailable", 0),
+        "images": _images,
+    },
+    "jobs": {
+        "completions": lambda o: f"{_get(o, 'status.succeeded', 0)}/{_get(o, 'spec.completions', 1)}",
+        "active": lambda o: _get(o, "status.active", 0),
+        "failed": lambda o: _get(o, "status.failed", 0),
+    },
+    "cronjobs": {
+        "schedule": lambda o: _get(o, "spec.schedule"),
+        "suspend": lambda o: _get(o, "spec.suspend", False),
+        "last_schedule": lambda o: _age(_get(o, "status.lastScheduleTime")),
+    },
+    "services": {
+        "type": lambda o: _get(o, "spec.type"),
+        "cluster_ip": lambda o: _get(o, "spec.clusterIP"),
+        "ports": lambda o: ",".join(f"{_get(p, 'port')}/{_get(p, 'protocol')}" for p in _get(o, "spec.ports", [])),
+    },
+    "ingresses": {
+        "class": lambda o: _get(o, "spec.ingressClassName"),
+        "hosts": lambda o: ",".join(_get(r, "host", "*") for r in _get(o, "spec.rules", [])),
+    },
+    "configmaps": {
+        "keys": lambda o: len(_get(o, "data", {})) + len(_get(o, "binaryData", {})),
+    },
+    "secrets": {
+        "type": lambda o: _get(o, "type"),
+        "keys": lambda o: len(_get(o, "data", {})),
+    },
+    "persistentvolumeclaims": {
+        "phase": lambda o: _get(o, "status.phase"),
+        "volume": lambda o: _get(o, "spec.volumeName"),
+        "capacity": lambda o: _get(o, "status.capacity.storage"),
+        "storage_class": lambda o: _get(o, "spec.storageClassName"),
+    },
+    "persistentvolumes": {
+        "phase": lambda o: _get(o, "status.phase"),
+        "capacity": lambda o: _get(o, "spec.capacity.storage"),
+        "claim": lambda o: _get(o, "spec.claimRef.namespace", "") + "/" + _get(o, "spec.claimRef.name", ""),
+        "storage_class": lambda o: _get(o, "spec.storageClassName"),
+        "reclaim_policy": lambda o: _get(o, "spec.persistentVolumeReclaimPolicy"),
+    },
+    "events": {
+        "type": lambda o: _get(o, "type"),
+        "reason": lambda o: _get(o, "reason"),
+        "object": lambda o: f"{_get(o, 'involvedObject.kind')}/{_get(o, 'involvedObject.name')}",
+        "count": lambda o: _get(o, "count"),
+        "last_seen": lambda o: _age(_get(o, "lastTimestamp") or _get(o, "eventTime")),
+        "message": lambda o: _get(o, "message"),
+    },
+    "nodes": {
+        "status": _node_status,
+        "roles": _node_roles,
+        "version": lambda o: _get(o, "status.nodeInfo.kubeletVersion"),
+    },
+    "namespaces": {
+        "phase": lambda o: _get(o, "status.phase"),
+    },
+}
+
+
+def _projection(kind, fields, default_fmt):
+    """Return (header, fmt, metadata_only) for a comma-separated fields list.
+
+    Without fields the default format is used. metadata_only tells whether every column can be
+    computed from object metadata alone.
+    """
+    if not fields:
+        return None, default_fmt, default_fmt in (_name, _ns_name)
+    columns = {**COMMON_COLUMNS, **KIND_COLUMNS.get(kind, {})}
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [n for n in names if n not in columns]
+    if unknown:
+        raise ValueError(f"unknown field(s) {', '.join(unknown)}; available: {', '.join(sorted(columns))}")
+    extractors = [columns[n] for n in names]
+
+    def fmt(obj):
+        values = (extract(obj) for extract in extractors)
+        return "\t".join("<none>" if v is None or v == "" else str(v) for v in values)
+
+    return "\t".join(n.upper() for n in names), fmt, all(n in COMMON_COLUMNS for n in names)
+
+
+# Default byte budget for a get/describe response; larger output is summarized or cut.
+RENDER_MAX_BYTES = int(os.environ.get("KUBE_MCP_RENDER_MAX_BYTES", str(64 * 1024)))
+RENDER_OUTPUTS = ("yaml", "json", "table")
+# Keys dropped from rendered objects: bookkeeping that is large and never useful to a reader.
+PRUNED_KEYS = {"managedFields", "kubectl.kubernetes.io/last-applied-configuration"}
+# Columns of output="table", per kind (see KIND_COLUMNS).
+TABLE_COLUMNS = {
+    "pods": "namespace,name,ready,phase,restarts,node,age",
+    "nodes": "name,status,roles,version,age",
+    "services": "namespace,name,type,cluster_ip,ports,age",
+    "secrets": "namespace,name,type,keys,age",
+    "configmaps": "namespace,name,keys,age",
+    "persistentvolumeclaims": "namespace,name,phase,volume,capacity,storage_class,age",
+    "jobs": "namespace,name,completions,active,failed,age",
+    "cronjobs": "namespace,name,schedule,suspend,last_schedule,age",
+    "ingresses": "namespace,name,class,hosts,age",
+    "daemonsets": "namespace,name,desired,ready,available,age",
+    "statefulsets": "namespace,name,ready,age",
+    "replicasets": "namespace,name,ready,owner,age",
+    "deployments": "namespace,name,ready,updated,available,age",
+    "events": "namespace,last_seen,type,reason,object,message",
+}
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _prune(obj):
+    """Drop nulls, empty collections and PRUNED_KEYS, recursively."""
+    if isinstance(obj, dict):
+        pruned = {}
+        for key, value in obj.items():
+            if key in PRUNED_KEYS:
+                continue
+            value = _prune(value)
+            if value is not None and value != {} and value != []:
+                pruned[key] = value
+        return pruned
+    if isinstance(obj, list):
+        return [_prune(v) for v in obj]
+    return obj
+
+
+def _table(kind, objs):
+    header, fmt, _ = _projection(kind, TABLE_COLUMNS.get(kind, "namespace,name,age"), None)
+    return "\n".join([header] + [fmt(o) for o in objs])
+
+
+def _serialize(obj, output):
+    if output == "json":
+        return orjson.dumps(obj).decode() if orjson else json.dumps(obj, separators=(",", ":"))
+    if isinstance(obj, (str, int, float, bool)):
+        return str(obj)
+    return yaml.dump(obj, Dumper=_YAML_DUMPER, sort_keys=False, default_flow_style=False, width=1 << 16).rstrip("\n")
+
+
+def _truncate(text, max_bytes):
+    """Cut text to max_bytes (UTF-8) with a note saying how much was left out."""
+    data = text.encode()
+    if not max_bytes or len(data) <= max_bytes:
+        return text
+    kept = data[:max_bytes].decode(errors="ignore")
+    return f"{kept}\n... [truncated {len(data) - max_bytes} of {len(data)} bytes; raise max_bytes or use output='table']"
+
+
+def _check_output(output):
+    if output not in RENDER_OUTPUTS:
+        raise ValueError(f"unknown output {output!r}; expected one of {', '.join(RENDER_OUTPUTS)}")
+
+
+@_phase("render")
+def _render(obj, kind=None, output="yaml", max_bytes=RENDER_MAX_BYTES, part=None):
+    """Render one object (or only its part path) compactly as yaml, json or a one-row table, within max_bytes."""
+    _check_output(output)
+    if output == "table" and kind:
+        return _truncate(_table(kind, [obj]), max_bytes)
+    return _truncate(_serialize(_prune(_as_dict(_get(obj, part) if part else obj)), output), max_bytes)
+
+
+@_phase("render")
+def _render_many(objs, kind, output="yaml", max_bytes=RENDER_MAX_BYTES, part=None):
+    """Render several objects, each as "namespace/name:" and its body (or only its part path).
+
+    objs may be a lazy iterator: once max_bytes is reached no further objects are pulled from it,
+    and the note says how many were left out when objs is a list. Returns "" when there is
+    nothing to render.
+    """
+    _check_output(output)
+    total = len(objs) if isinstance(objs, (list, tuple)) else None
+    if output == "table":
+        header, fmt, _ = _projection(kind, TABLE_COLUMNS.get(kind, "namespace,name,age"), None)
+        lines, used, note = [header], len(header) + 1, ""
+        for i, obj in enumerate(objs):
+            line = fmt(obj)
+            used += len(line.encode()) + 1
+            if max_bytes and used > max_bytes and len(lines) > 1:
+                note = f"\n... [{'more' if total is None else f'{total - i} more'} omitted; narrow the query or raise max_bytes]"
+                break
+            lines.append(line)
+        return _truncate("\n".join(lines), max_bytes) + note if len(lines) > 1 else ""
+    blocks, used = [], 0
+    for i, obj in enumerate(objs):
+        body = _prune(_as_dict(_get(obj, part) if part else obj))
+        text = _serialize(body, output)
+        block = f"{_ns_name(obj)}: {text}" if "\n" not in text else f"{_ns_name(obj)}:\n{text}"
+        used += len(block.encode()) + 2
+        if max_bytes and used > max_bytes and blocks:
+            more = "more" if total is None else f"{total - i} more"
+            blocks.append(f"... [{more} omitted; narrow the query, raise max_bytes or use output='table']")
+            break
+        blocks.append(_truncate(block, max_bytes))
+    return "\n\n".join(blocks)
+
+
+# Ask the API server for metadata only: no spec/status/data is sent or deserialized.
+METADATA_LIST_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+METADATA_WATCH_ACCEPT = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1"
+
+
+def _typed_list_fn(kind, namespace=None, context=None):
+    """Return the typed API list method for kind, bound to namespace when the kind is namespaced."""
+    api_name, namespaced_method, all_method = LIST_RESOURCES[kind]
+    api = _clients.api(api_name, context)
+    if namespace and namespaced_method:
+        return partial(getattr(api, namespaced_method), namespace)
+    return getattr(api, all_method)
+
+
+def _typed_read_fn(kind, context=None):
+    """Return the typed API read method for a namespaced kind, e.g. read_namespaced_pod for pods."""
+    api_name, namespaced_method, _ = LIST_RESOURCES[kind]
+    return getattr(_clients.api(api_name, context), namespaced_method.replace("list_", "read_", 1))
+
+
+def _raw_list_fn(kind, namespace=None, accept=None, context=None):
+    """Return a list function for kind that yields decoded JSON pages instead of models.
+
+    accept overrides the Accept header, e.g. METADATA_LIST_ACCEPT for metadata-only pages.
+    """
+    typed_list_fn = _typed_list_fn(kind, namespace, context)
+    headers = {"Accept": accept} if accept else None
+
+    def list_fn(**kwargs):
+        return _read_raw(typed_list_fn, _headers=headers, **kwargs)
+
+    return list_fn
+
+
+# "What changed since" queries: longest a bounded watch runs, and the quiet gap after which it stops early.
+CHANGES_TIMEOUT = float(os.environ.get("KUBE_MCP_CHANGES_TIMEOUT", "5"))
+CHANGES_IDLE = float(os.environ.get("KUBE_MCP_CHANGES_IDLE", "1"))
+CHANGE_TYPES = ("ADDED", "MODIFIED", "DELETED")
+
+
+class CursorExpired(Exception):
+    """The resourceVersion behind a changes cursor is older than the API server's watch history (410 Gone)."""
+
+
+def _encode_cursor(kind, resource_version, namespace, label_selector, field_selector, context):
+    """Opaque cursor for a listing: its resourceVersion plus the query it belongs to."""
+    query = {"k": kind, "rv": resource_version, "ns": namespace, "ls": label_selector, "fs": field_selector, "c": context}
+    raw = json.dumps({k: v for k, v in query.items() if v}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor, kind, namespace, label_selector, field_selector, context):
+    """Return the resourceVersion of a cursor issued for this same query, else raise ValueError."""
+    try:
+        query = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        resource_version = query["rv"]
+    except Exception:
+        raise ValueError(f"invalid changes cursor {cursor!r}")
+    asked = {"k": kind, "ns": namespace, "ls": label_selector, "fs": field_selector, "c": context}
+    if any(query.get(k) != (v or None) for k, v in asked.items()):
+        raise ValueError("changes cursor was issued for a different kind, namespace, selector or context")
+    return resource_version
+
+
+def _rv_reached(resource_version, target):
+    """Best-effort resourceVersion comparison; they are opaque, so anything non-numeric never counts as reached."""
+    try:
+        return int(resource_version) >= int(target)
+    except (TypeError, ValueError):
+        return False
+
+
+def _watch_changes(kind, namespace, resource_version, label_selector=None, field_selector=None, context=None):
+    """Net ADDED/MODIFIED/DELETED objects of kind since resource_version, and the resourceVersion reached.
+
+    Runs a watch with bookmarks from resource_version until it catches up with the current
+    resourceVersion, goes quiet for CHANGES_IDLE seconds, or CHANGES_TIMEOUT runs out. Several
+    events for one object collapse into one change. Raises CursorExpired on 410 Gone.
+    """
+    page = _raw_list_fn(kind, namespace, METADATA_LIST_ACCEPT, context)(limit=1)
+    target = _get(page, "metadata.resourceVersion")
+    timeout = CHANGES_TIMEOUT if _remaining() is None else max(0.1, min(CHANGES_TIMEOUT, _remaining() - 1))
+    deadline = time.monotonic() + timeout
+    changes, reached = {}, resource_version
+    try:
+        resp = _typed_list_fn(kind, namespace, context)(
+            watch=True, resource_version=resource_version, allow_watch_bookmarks=True,
+            timeout_seconds=max(1, int(timeout)), label_selector=label_selector, field_selector=field_selector,
+            _preload_content=False, _request_timeout=(timeout, CHANGES_IDLE),
+        )
+    except ApiException as e:
+        if e.status == 410:
+            raise CursorExpired() from e
+        raise
+    try:
+        with _phase("api"):
+            for line in watch.watch.iter_resp_lines(resp):
+                event = _loads(line)
+                event_type, obj = event.get("type"), event.get("object") or {}
+                if event_type == "ERROR":
+                    if obj.get("code") == 410:
+                        raise CursorExpired()
+                    raise ApiException(status=obj.get("code"), reason=obj.get("reason") or obj.get("message"))
+                reached = _get(obj, "metadata.resourceVersion") or reached
+                if event_type in CHANGE_TYPES:
+                    key = (_get(obj, "metadata.namespace") or "", _get(obj, "metadata.name"))
+                    before = changes.get(key, (None,))[0]
+                    if before == "ADDED" and event_type == "DELETED":
+                        del changes[key]
+                    else:
+                        if before == "ADDED" or (before == "DELETED" and event_type == "ADDED"):
+                            event_type = "ADDED" if before == "ADDED" else "MODIFIED"
+                        changes[key] = (event_type, obj)
+                if _rv_reached(reached, target) or time.monotonic() > deadline:
+                    break
+                _check_cancelled()
+    except urllib3.exceptions.ReadTimeoutError:
+        pass  # quiet for CHANGES_IDLE seconds: the watch has replayed everything it had
+    finally:
+        resp.close()
+        resp.release_conn()
+    return [changes[key] for key in sorted(changes)], reached
+
+
+def _format_changes(changes, header, fmt):
+    counts = Counter(change_type for change_type, _ in changes)
+    summary = ", ".join(f"{counts[t]} {t.lower()}" for t in CHANGE_TYPES)
+    lines = [f"Changes since cursor: {summary}."]
+    if changes:
+        if header:
+            lines.append("CHANGE\t" + header)
+        with _phase("render"):
+            for change_type in CHANGE_TYPES:
+                lines.extend(f"{change_type}\t{fmt(obj)}" for t, obj in changes if t == change_type)
+    return lines
+
+
+def _list_resource(
+    kind,
+    namespace=None,
+    label_selector=None,
+    field_selector=None,
+    fields=None,
+    page_size=None,
+    continue_token=None,
+    default_fmt=_ns_name,
+    since=None,
+    context=None,
+):
+    """Shared body of the list_* tools. Returns the formatted listing, or "" if nothing matched.
+
+    A complete listing ends with a changes cursor; passing it back as since returns only the
+    objects added, modified or deleted after it, or a full listing again if the cursor expired.
+    """
+    header, fmt, metadata_only = _projection(kind, fields, default_fmt)
+    query = (namespace, label_selector, field_selector, context)
+    if since:
+        resource_version = _decode_cursor(since, kind, *query)
+        try:
+            changes, reached = _watch_changes(kind, namespace, resource_version, label_selector, field_selector, context)
+            lines = _format_changes(changes, header, fmt)
+            return "\n".join(lines + [CURSOR_NOTE + _encode_cursor(kind, reached, *query)])
+        except CursorExpired:
+            listing = _list_resource(kind, *query[:3], fields, default_fmt=default_fmt, context=context)
+            return f"Changes cursor expired; full listing follows.\n{listing or f'No {kind} found.'}"
+    paged = page_size or continue_token
+    informer = None if paged or label_selector or field_selector else _informers.usable(kind, context)
+    if informer:
+        with _phase("render"):
+            lines, token, resource_version = [fmt(obj) for obj in informer.list(namespace)], None, informer.resource_version
+    else:
+        list_fn = _raw_list_fn(kind, namespace, METADATA_LIST_ACCEPT if metadata_only else None, context)
+        lines, token, resource_version = _list_lines(
+            list_fn, fmt=fmt, page_size=page_size, continue_token=continue_token,
+            label_selector=label_selector, field_selector=field_selector,
+        )
+    cursor = None if token or not resource_version else CURSOR_NOTE + _encode_cursor(kind, resource_version, *query)
+    if not lines:
+        return f"No {kind} found.\n{cursor}" if cursor else ""
+    if header:
+        lines.insert(0, header)
+    return "\n".join(lines + [cursor]) if cursor else _with_continue("\n".join(lines), token)
+
+
+# Log fan-out defaults for get_pod_logs across many pods (lines per pod unless tail_lines is set), and the most log bytes read per pod.
+LOG_FANOUT_PARALLELISM = int(os.environ.get("KUBE_MCP_LOG_PARALLELISM", "16"))
+LOG_POD_TIMEOUT = float(os.environ.get("KUBE_MCP_LOG_POD_TIMEOUT", "10"))
+LOG_DEADLINE = float(os.environ.get("KUBE_MCP_LOG_DEADLINE", "60"))
+LOG_TAIL_LINES = 10
+LOG_POD_MAX_BYTES = int(os.environ.get("KUBE_MCP_LOG_POD_MAX_BYTES", str(1024 * 1024)))
+# Streaming log reads: chunk size, the most log text (in UTF-8 bytes) a stream_pod_logs call returns,
+# and the longest it runs, follow_seconds included (0 = no limit).
+LOG_CHUNK_SIZE = 64 * 1024
+LOG_STREAM_MAX_RETURN = int(os.environ.get("KUBE_MCP_LOG_STREAM_MAX_RETURN", str(256 * 1024)))
+LOG_STREAM_MAX_SECONDS = float(os.environ.get("KUBE_MCP_LOG_STREAM_MAX_SECONDS", "300"))
+
+
+def _fan_out_logs(v1, targets, container, tail_lines, max_parallel, pod_timeout, deadline):
+    """Fetch logs for (namespace, name) targets concurrently.
+
+    Returns (entries, missing): one entry per pod finished before the deadline, in target
+    order, and the number of pods whose logs were still outstanding.
+    """
+    if not targets:
+        return [], 0
+
+    def fetch(ns, name):
+        try:
+            log = v1.read_namespaced_pod_log(
+                name, ns, container=container, tail_lines=tail_lines, limit_bytes=LOG_POD_MAX_BYTES or None,
+                _request_timeout=pod_timeout,
+            )
+            return f"{ns}/{name}:\n{log}"
+        except Exception as e:
+            return f"{ns}/{name}: Error fetching logs: {e}"
+
+    if _remaining() is not None:
+        deadline = min(deadline, max(0.0, _remaining() - 1))  # leave time to return what arrived
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(targets))))
+    try:
+        futures = [executor.submit(fetch, ns, name) for ns, name in targets]
+        done, pending = wait(futures, timeout=deadline)
+        return [f.result() for f in futures if f in done], len(pending)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Log search: log bytes read per container, matches returned per call, and the longest line kept.
+LOG_SEARCH_POD_BYTES = int(os.environ.get("KUBE_MCP_LOG_SEARCH_POD_BYTES", str(8 * 1024 * 1024)))
+LOG_SEARCH_MAX_MATCHES = int(os.environ.get("KUBE_MCP_LOG_SEARCH_MAX_MATCHES", "200"))
+LOG_SEARCH_LINE_MAX = 2048
+
+
+class MatchBudget:
+    """Matches a log search may still return, shared by its per-pod readers."""
+
+    def __init__(self, limit):
+        self.remaining = limit
+        self.exhausted = threading.Event()
+        self._lock = threading.Lock()
+
+    def take(self):
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            if not self.remaining:
+                self.exhausted.set()
+            return True
+
+
+def _label_selector(selector):
+    """Render a LabelSelector (matchLabels/matchExpressions) as a label_selector string."""
+    terms = [f"{k}={v}" for k, v in (_get(selector, "matchLabels") or {}).items()]
+    for expr in _get(selector, "matchExpressions") or []:
+        key, op, values = _get(expr, "key"), _get(expr, "operator"), _get(expr, "values") or []
+        terms.append({"In": f"{key} in ({','.join(values)})", "NotIn": f"{key} notin ({','.join(values)})",
+                      "Exists": key, "DoesNotExist": f"!{key}"}[op])
+    return ",".join(terms)
+
+
+def _search_log(v1, target, matcher, context_lines, budget, out, since_seconds, tail_lines, max_bytes, pod_timeout):
+    """Stream one container's log and append grep-style lines for matches (and context) to out.
+
+    Returns (bytes read, whether max_bytes may have cut the read short: it reached max_bytes). Stops as soon as budget is
+    exhausted or the call is cancelled; no more than context_lines earlier lines are kept.
+    """
+    ns, name, container, label = target
+    resp = v1.read_namespaced_pod_log(
+        name, ns, container=container, timestamps=True, since_seconds=since_seconds, tail_lines=tail_lines,
+        limit_bytes=max_bytes, _preload_content=False, _request_timeout=pod_timeout,
+    )
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    before = deque(maxlen=context_lines)
+    state = {"line": 0, "after": 0, "last": None}
+
+    def emit(line, separator):
+        stamp, _, text = line.partition(" ")
+        out.append(f"{label} {stamp}{separator} {text[:LOG_SEARCH_LINE_MAX]}")
+
+    def scan(line):
+        """Handle one log line; False once the search should stop."""
+        state["line"] += 1
+        if matcher(line.partition(" ")[2]):
+            if not budget.take():
+                return False
+            first = before[0][0] if before else state["line"]
+            if state["last"] is not None and first > state["last"] + 1 and context_lines:
+                out.append("--")
+            for _, previous in before:
+                emit(previous, "-")
+            before.clear()
+            emit(line, ":")
+            state["after"], state["last"] = context_lines, state["line"]
+        elif state["after"]:
+            emit(line, "-")
+            state["after"] -= 1
+            state["last"] = state["line"]
+        elif budget.exhausted.is_set():
+            return False
+        elif context_lines:
+            before.append((state["line"], line))
+        return True
+
+    total, rest = 0, ""
+    try:
+        for chunk in resp.stream(LOG_CHUNK_SIZE, decode_content=True):
+            _check_cancelled()
+            total += len(chunk)
+            lines = (rest + decoder.decode(chunk)).split("\n")
+            rest = lines.pop()[:LOG_SEARCH_LINE_MAX]
+            if not all(scan(line) for line in lines):
+                return total, False
+        if rest:
+            scan(rest)
+    finally:
+        resp.close()
+    return total, total >= max_bytes
+
+
+# Multi-cluster fan-out: clusters queried at once, and how long each may take.
+FANOUT_PARALLELISM = int(os.environ.get("KUBE_MCP_FANOUT_PARALLELISM", "32"))
+FANOUT_TIMEOUT = float(os.environ.get("KUBE_MCP_FANOUT_TIMEOUT", "30"))
+
+
+def _run_parallel(calls, max_parallel, timeout):
+    """Run the zero-argument callables in calls ({key: fn}) concurrently.
+
+    Returns {key: result}, with None for calls that had not finished after timeout. Each call
+    runs in its own _CallScope, so its API requests give up at the timeout as well.
+    """
+    if _remaining() is not None:
+        timeout = min(timeout, _remaining())
+    parent = _call_scope.get()
+    scopes = {key: _CallScope(timeout, parent=parent) for key in calls}
+
+    def call(key):
+        _call_scope.set(scopes[key])
+        return calls[key]()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(calls))))
+    try:
+        futures = {key: executor.submit(contextvars.Context().run, call, key) for key in calls}
+        done, _ = wait(futures.values(), timeout=timeout)
+        return {key: f.result() if f in done else None for key, f in futures.items()}
+    finally:
+        for scope in scopes.values():
+            scope.cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _merge_fan_out(results, timeout, tabular):
+    """Merge per-context answers: one table with a CONTEXT column, or one section per context."""
+    if not tabular:
+        return "\n\n".join(
+            f"=== {c} ===\n{f'Timed out after {timeout:g}s.' if text is None else text}" for c, text in results.items()
+        )
+    header, rows, notes = None, [], []
+    for c, text in results.items():
+        lines = [] if text is None else text.splitlines()
+        if text is None:
+            notes.append(f"{c}: timed out after {timeout:g}s")
+        elif text.startswith("Error") or len(lines) < 2:
+            notes.append(f"{c}: {text}")
+        else:
+            header = header or "CONTEXT\t" + lines[0]
+            for line in lines[1:]:
+                if line.startswith((CONTINUE_NOTE, CURSOR_NOTE)):
+                    notes.append(f"{c}: {line}")
+                else:
+                    rows.append(f"{c}\t{line}")
+    return "\n".join(([header] + rows if header else []) + notes)
+
+
+# Batch tool: operations run at once, and the deadline for the whole batch.
+BATCH_PARALLELISM = int(os.environ.get("KUBE_MCP_BATCH_PARALLELISM", "16"))
+BATCH_DEADLINE = float(os.environ.get("KUBE_MCP_BATCH_DEADLINE", "30"))
+BATCH_VERBS = ("get", "list", "events")
+KIND_ALIASES = {
+    "pvc": "persistentvolumeclaims",
+    "pv": "persistentvolumes",
+    "ns": "namespaces",
+    "ev": "events",
+    "deploy": "deployments",
+    "rs": "replicasets",
+    "sts": "statefulsets",
+    "ds": "daemonsets",
+    "cj": "cronjobs",
+}
+
+
+def _resource_kind(kind):
+    """Map "Pod", "pod", "pods" or a short name like "pvc" to a LIST_RESOURCES key."""
+    kind = (kind or "").lower()
+    for candidate in (kind, kind + "s", kind + "es", KIND_ALIASES.get(kind)):
+        if candidate in LIST_RESOURCES:
+            return candidate
+    raise ValueError(f"unknown kind {kind!r}; expected one of {', '.join(LIST_RESOURCES)}")
+
+
+def _batch_op(op, context, output, max_bytes):
+    """Run one batch operation: get an object, list a kind, or list the events of an object."""
+    verb, kind = op.get("verb", "get"), _resource_kind(op.get("kind"))
+    name, namespace = op.get("name"), op.get("namespace")
+    if verb not in BATCH_VERBS:
+        raise ValueError(f"unknown verb {verb!r}; expected one of {', '.join(BATCH_VERBS)}")
+    if verb == "list":
+        return _list_resource(
+            kind, namespace, op.get("label_selector"), op.get("field_selector"), op.get("fields"), context=context,
+        ) or f"No {kind} found."
+    if not name:
+        raise ValueError(f"{verb} needs a name")
+    if verb == "events":
+        return _list_resource(
+            "events", namespace, field_selector=f"involvedObject.name={name}", fields=op.get("fields"),
+            default_fmt=_event_line, context=context,
+        ) or "No events found."
+    api_name, namespaced_method, all_method = LIST_RESOURCES[kind]
+    api = _clients.api(api_name, context)
+    if namespaced_method:
+        if not namespace:
+            raise ValueError(f"get {kind} needs a namespace")
+        obj = _read_raw(getattr(api, namespaced_method.replace("list_", "read_", 1)), name, namespace)
+    else:
+        obj = _read_raw(getattr(api, all_method.replace("list_", "read_", 1)), name)
+    if kind in DATA_KINDS:
+        obj = _redact(obj, kind)
+    return _render(obj, kind, output, max_bytes)
+
+
+def _api_message(e):
+    """The message of an ApiException's Status body, or its raw body."""
+    try:
+        return _loads(e.body).get("message") or e.body
+    except Exception:
+        return e.body
+
+
+def _batch_label(op):
+    target = "/".join(str(op[k]) for k in ("namespace", "name") if op.get(k))
+    return " ".join(str(part) for part in (op.get("verb", "get"), op.get("kind"), target) if part)
+
+
+# Bulk writes: workloads patched at once, how long a call (rollout waits included) may take, and the apply field manager.
+BULK_PARALLELISM = int(os.environ.get("KUBE_MCP_BULK_PARALLELISM", "8"))
+BULK_TIMEOUT = float(os.environ.get("KUBE_MCP_BULK_TIMEOUT", "300"))
+FIELD_MANAGER = os.environ.get("KUBE_MCP_FIELD_MANAGER", "kube-mcp-server")
+APPLY_CONTENT_TYPE = "application/apply-patch+yaml"
+BULK_KINDS = {
+    "deployments": ("apps/v1", "Deployment", "namespaced_deployment"),
+    "statefulsets": ("apps/v1", "StatefulSet", "namespaced_stateful_set"),
+    "daemonsets": ("apps/v1", "DaemonSet", "namespaced_daemon_set"),
+}
+
+
+def _bulk_kind(kind):
+    kind = _resource_kind(kind)
+    if kind not in BULK_KINDS:
+        raise ValueError(f"kind must be one of {', '.join(BULK_KINDS)}")
+    return kind
+
+
+def _bulk_targets(targets, kind, namespace, label_selector, context):
+    """(kind, namespace, name) of the workloads a bulk call acts on: the explicit targets, else a selector's matches."""
+    if targets:
+        resolved = []
+        for target in targets:
+            ns = target.get("namespace") or namespace
+            if not target.get("name") or not ns:
+                raise ValueError(f"target {target} needs a name and a namespace")
+            resolved.append((_bulk_kind(target.get("kind") or kind), ns, target["name"]))
+        return resolved
+    if not namespace and not label_selector:
+        raise ValueError("give targets, or a namespace and/or label_selector to pick workloads")
+    kind = _bulk_kind(kind)
+    items = _iter_items(_raw_list_fn(kind, namespace, METADATA_LIST_ACCEPT, context), label_selector=label_selector)
+    return [(kind, _get(o, "metadata.namespace"), _get(o, "metadata.name")) for o in items]
+
+
+def _rollout_status(kind, obj):
+    """(done, summary) of a workload's rollout, read from its status."""
+    if kind == "daemonsets":
+        desired = _get(obj, "status.desiredNumberScheduled", 0)
+        updated = _get(obj, "status.updatedNumberScheduled", desired)
+        ready = _get(obj, "status.numberAvailable", 0)
+    else:
+        desired = _get(obj, "spec.replicas", 1)
+        updated = _get(obj, "status.updatedReplicas", 0)
+        ready = _get(obj, "status.availableReplicas" if kind == "deployments" else "status.readyReplicas", 0)
+    observed = _get(obj, "status.observedGeneration", 0) >= _get(obj, "metadata.generation", 0)
+    total = _get(obj, "status.replicas", desired) if kind != "daemonsets" else desired
+    done = observed and updated >= desired and ready >= desired and total <= desired
+    return done, f"{ready}/{desired} ready, {updated} updated"
+
+
+def _wait_rollout(kind, namespace, name, context):
+    """Follow one workload with a watch until its rollout completes; returns the last rollout status.
+
+    Raises ToolCancelled when the call's time runs out first.
+    """
+    list_fn = _typed_list_fn(kind, namespace, context)
+    field_selector = f"metadata.name={name}"
+
+    def current():
+        page = _read_raw(list_fn, field_selector=field_selector)
+        if not page.get("items"):
+            raise ValueError(f"{kind} {namespace}/{name} no longer exists")
+        return page["items"][0], _get(page, "metadata.resourceVersion")
+
+    obj, resource_version = current()
+    done, summary = _rollout_status(kind, obj)
+    while not done:
+        _check_cancelled()
+        seconds = _remaining() or BULK_TIMEOUT
+        resp = list_fn(
+            watch=True, field_selector=field_selector, resource_version=resource_version,
+            allow_watch_bookmarks=True, timeout_seconds=max(1, int(seconds)),
+            _preload_content=False, _request_timeout=(LOG_POD_TIMEOUT, seconds + 5),
+        )
+        try:
+            for line in watch.watch.iter_resp_lines(resp):
+                event = _loads(line)
+                event_type, obj = event.get("type"), event.get("object") or {}
+                if event_type == "ERROR":
+                    if obj.get("code") != 410:
+                        raise ApiException(status=obj.get("code"), reason=obj.get("message"))
+                    obj, resource_version = current()
+                    event_type = "MODIFIED"
+                else:
+                    resource_version = _get(obj, "metadata.resourceVersion") or resource_version
+                if event_type in ("ADDED", "MODIFIED"):
+                    done, summary = _rollout_status(kind, obj)
+                if done or event.get("type") == "ERROR":
+                    break
+                _check_cancelled()
+        except urllib3.exceptions.ReadTimeoutError:
+            pass
+        finally:
+            resp.close()
+            resp.release_conn()
+    return summary
+
+
+def _bulk_update_one(target, replicas, patch, dry_run, force, wait_for_rollout, out, context):
+    """Scale and/or server-side apply one workload, appending what happened to out as it happens.
+
+    Returns True once done, or None if the call ran out of time first.
+    """
+    kind, namespace, name = target
+    api_version, object_kind, suffix = BULK_KINDS[kind]
+    apps = _clients.api("AppsV1Api", context)
+    dry = {"dry_run": "All"} if dry_run else {}
+    try:
+        if replicas is not None:
+            if kind == "daemonsets":
+                raise ValueError("daemonsets cannot be scaled")
+            getattr(apps, f"patch_{suffix}_scale")(name, namespace, {"spec": {"replicas": replicas}}, **dry)
+            out.append(f"scaled to {replicas}")
+        if patch:
+            body = {
+                **patch, "apiVersion": api_version, "kind": object_kind,
+                "metadata": {**patch.get("metadata", {}), "name": name, "namespace": namespace},
+            }
+            getattr(apps, f"patch_{suffix}")(
+                name, namespace, body, field_manager=FIELD_MANAGER, force=force or None,
+                _content_type=APPLY_CONTENT_TYPE, **dry,
+            )
+            out.append("applied")
+        if wait_for_rollout and not dry_run:
+            out.append(f"rolled out ({_wait_rollout(kind, namespace, name, context)})")
+    except ToolCancelled:
+        return None
+    except ApiException as e:
+        out.append(f"Error: {e.status} {e.reason}: {_api_message(e)}")
+    except Exception as e:
+        out.append(f"Error: {e}")
+    return True
+
+
+# Cluster overview: how long the snapshot may take, and what counts as crash-looping.
+OVERVIEW_TIMEOUT = float(os.environ.get("KUBE_MCP_OVERVIEW_TIMEOUT", "30"))
+CRASHLOOP_RESTARTS = 5
+NODE_PRESSURE_CONDITIONS = ("MemoryPressure", "DiskPressure", "PIDPressure", "NetworkUnavailable")
+
+
+def _snapshot_items(kind, namespace, context, field_selector=None):
+    """Iterate all objects of kind, from its informer when usable, else page by page."""
+    informer = None if field_selector else _informers.usable(kind, context)
+    if informer:
+        return iter(informer.list(namespace))
+    return _iter_items(_raw_list_fn(kind, namespace, context=context), field_selector=field_selector)
+
+
+def _summarize_pods(pods):
+    phases, crashing, pending = Counter(), [], []
+    for pod in pods:
+        phase = _get(pod, "status.phase", "Unknown")
+        phases[phase] += 1
+        statuses = _get(pod, "status.containerStatuses", [])
+        restarts = sum(_get(c, "restartCount", 0) for c in statuses)
+        waiting = [_get(c, "state.waiting.reason") for c in statuses if _get(c, "state.waiting.reason")]
+        if "CrashLoopBackOff" in waiting or (restarts >= CRASHLOOP_RESTARTS and not all(_get(c, "ready") for c in statuses)):
+            crashing.append((restarts, _ns_name(pod), waiting[0] if waiting else "restarting"))
+        elif phase == "Pending":
+            unscheduled = [_get(c, "reason") for c in _get(pod, "status.conditions", [])
+                           if _get(c, "type") == "PodScheduled" and _get(c, "status") == "False"]
+            pending.append((_ns_name(pod), (waiting or unscheduled or ["Pending"])[0]))
+    crashing.sort(key=lambda c: (-c[0], c[1]))
+    return {"phases": phases, "crashing": crashing, "pending": pending}
+
+
+def _summarize_workloads(kind, objs):
+    total, unavailable = 0, []
+    for obj in objs:
+        total += 1
+        if kind == "daemonsets":
+            desired, ready = _get(obj, "status.desiredNumberScheduled", 0), _get(obj, "status.numberAvailable", 0)
+        else:
+            desired, ready = _get(obj, "spec.replicas", 1), _get(obj, "status.availableReplicas", 0)
+        if ready < desired:
+            unavailable.append((desired - ready, _ns_name(obj), f"{ready}/{desired}"))
+    unavailable.sort(key=lambda u: (-u[0], u[1]))
+    return {"total": total, "unavailable": unavailable}
+
+
+def _summarize_nodes(nodes):
+    total, not_ready, pressured, cordoned = 0, [], [], []
+    for node in nodes:
+        total += 1
+        conditions = {_get(c, "type"): c for c in _get(node, "status.conditions", [])}
+        ready = conditions.get("Ready")
+        if not ready or _get(ready, "status") != "True":
+            not_ready.append(f"{_name(node)} ({_get(ready, 'reason', 'Unknown')})")
+        pressure = [t for t in NODE_PRESSURE_CONDITIONS if _get(conditions.get(t), "status") == "True"]
+        if pressure:
+            pressured.append(f"{_name(node)} ({','.join(pressure)})")
+        if _get(node, "spec.unschedulable"):
+            cordoned.append(_name(node))
+    return {"total": total, "not_ready": not_ready, "pressured": pressured, "cordoned": cordoned}
+
+
+def _event_time(event):
+    """Epoch seconds an event last happened, from lastTimestamp, eventTime or its creation time."""
+    stamp = _get(event, "lastTimestamp") or _get(event, "eventTime") or _get(event, "metadata.creationTimestamp")
+    if isinstance(stamp, str):
+        stamp = datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+    return stamp.timestamp() if stamp is not None else None
+
+
+def _summarize_warnings(events, window_seconds):
+    reasons, objects = Counter(), {}
+    cutoff = datetime.now(timezone.utc).timestamp() - window_seconds
+    for event in events:
+        stamp = _event_time(event)
+        if stamp is not None and stamp < cutoff:
+            continue
+        reason = _get(event, "reason", "Unknown")
+        reasons[reason] += _get(event, "count", 1) or 1
+        objects.setdefault(reason, f"{_get(event, 'involvedObject.kind')}/{_get(event, 'involvedObject.name')}")
+    return {"reasons": reasons, "examples": objects}
+
+
+def _overview_part(summarize):
+    """Run one snapshot summary, turning a failure into {"error": ...} so the other kinds still report."""
+    try:
+        return summarize()
+    except ToolCancelled:
+        return {"error": "timed out"}
+    except ApiException as e:
+        return {"error": f"{e.status} {e.reason}"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _format_overview(results, namespace, limit, window_minutes):
+    """Render the per-kind summaries as a short report, naming kinds that failed or timed out."""
+    lines = [f"Cluster overview ({f'namespace {namespace}' if namespace else 'all namespaces'})"]
+    missing = [f"{kind} ({'timed out' if part is None else part['error']})"
+               for kind, part in results.items() if part is None or "error" in part]
+    parts = {kind: part for kind, part in results.items() if part is not None and "error" not in part}
+
+    def more(items):
+        return [f"    ... {len(items) - limit} more"] if len(items) > limit else []
+
+    nodes = parts.get("nodes")
+    if nodes:
+        lines.append(f"Nodes: {nodes['total']} total, {len(nodes['not_ready'])} NotReady, "
+                     f"{len(nodes['pressured'])} under pressure, {len(nodes['cordoned'])} cordoned")
+        for label, names in (("NotReady", nodes["not_ready"]), ("Pressure", nodes["pressured"]), ("Cordoned", nodes["cordoned"])):
+            if names:
+                lines.append(f"  {label}: {', '.join(names[:limit])}" + (f" (+{len(names) - limit} more)" if len(names) > limit else ""))
+    pods = parts.get("pods")
+    if pods:
+        phases = ", ".join(f"{phase} {count}" for phase, count in pods["phases"].most_common())
+        lines.append(f"Pods: {sum(pods['phases'].values())} total ({phases or 'none'}); "
+                     f"{len(pods['crashing'])} crash-looping, {len(pods['pending'])} pending")
+        if pods["crashing"]:
+            lines.append("  Crash-looping (most restarts first):")
+            lines += [f"    {name} restarts={restarts} {reason}" for restarts, name, reason in pods["crashing"][:limit]]
+            lines += more(pods["crashing"])
+        if pods["pending"]:
+            lines.append("  Pending:")
+            lines += [f"    {name} {reason}" for name, reason in pods["pending"][:limit]]
+            lines += more(pods["pending"])
+    workloads = [(kind, parts.get(kind)) for kind in ("deployments", "statefulsets", "daemonsets") if parts.get(kind)]
+    if workloads:
+        lines.append("Workloads with unavailable replicas: " + ", ".join(
+            f"{len(w['unavailable'])}/{w['total']} {kind}" for kind, w in workloads))
+        for kind, w in workloads:
+            lines += [f"    {kind[:-1]} {name} {ready} available" for _, name, ready in w["unavailable"][:limit]]
+            lines += more(w["unavailable"])
+    warnings = parts.get("events")
+    if warnings:
+        reasons = warnings["reasons"]
+        lines.append(f"Warning events (last {window_minutes:g}m): {sum(reasons.values())}")
+        lines += [f"    {reason} x{count} (e.g. {warnings['examples'][reason]})" for reason, count in reasons.most_common(limit)]
+    if missing:
+        lines.append(f"Not included: {', '.join(missing)}")
+    return "\n".join(lines)
+
+
+# Event store: events kept from a watch, capped in memory, for filtered queries without a LIST.
+EVENT_STORE_MAX_BYTES = int(os.environ.get("KUBE_MCP_EVENT_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+EVENT_MESSAGE_MAX = 512
+EVENT_GROUPS = ("reason", "object", "type", "namespace")
+
+
+class StoredEvent:
+    """The parts of an Event that queries need, with the message clipped to EVENT_MESSAGE_MAX."""
+
+    __slots__ = ("uid", "namespace", "reason", "type", "message", "count", "time", "object", "size")
+
+    def __init__(self, event):
+        self.uid = _get(event, "metadata.uid") or _ns_name(event)
+        self.namespace = _get(event, "metadata.namespace") or ""
+        self.reason = _get(event, "reason") or "Unknown"
+        self.type = _get(event, "type") or "Normal"
+        self.message = (_get(event, "message") or "")[:EVENT_MESSAGE_MAX]
+        self.count = _get(event, "count") or 1
+        self.time = _event_time(event) or 0.0
+        self.object = (
+            _get(event, "involvedObject.kind") or "",
+            _get(event, "involvedObject.namespace") or self.namespace,
+            _get(event, "involvedObject.name") or "",
+        )
+        self.size = 400 + len(self.uid) + len(self.namespace) + len(self.reason) + len(self.message) + sum(map(len, self.object))
+
+    def describe_object(self):
+        kind, namespace, name = self.object
+        return f"{namespace}/{kind}/{name}" if namespace else f"{kind}/{name}"
+
+
+class EventStore(ListWatch):
+    """History of one context's events, kept current by a LIST followed by a resumed WATCH.
+
+    Events are held in arrival order and indexed by involved object, reason and type. Updates to an event replace it; deleted events stay until evicted, so the
+    history can outlive the API server's event TTL. The oldest events are dropped once the store
+    exceeds EVENT_STORE_MAX_BYTES.
+    """
+
+    def __init__(self, context=None, max_bytes=EVENT_STORE_MAX_BYTES):
+        self.context = context
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evicted = 0
+        self.resource_version = None
+        self.synced = threading.Event()
+        self._events = OrderedDict()
+        self._by_object = {}
+        self._by_reason = {}
+        self._by_type = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="event-store", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def __len__(self):
+        return len(self._events)
+
+    def oldest(self):
+        with self._lock:
+            return next(iter(self._events.values())).time if self._events else None
 
-mcp = FastMCP("Kubernetes MCP Server")
+    def _indexes(self, event):
+        return ((self._by_object, event.object), (self._by_reason, event.reason), (self._by_type, event.type))
 
-# Top 30 Kubernetes tools as MCP tools
-@mcp.tool
-def list_pods(namespace: str = None) -> str:
-    """List all pods in a namespace, or all namespaces if none specified."""
+    def _remove(self, event):
+        del self._events[event.uid]
+        self.bytes -= event.size
+        for index, key in self._indexes(event):
+            uids = index[key]
+            uids.discard(event.uid)
+            if not uids:
+                del index[key]
+
+    def put(self, events):
+        with self._lock:
+            for event in events:
+                if event.uid in self._events:
+                    self._remove(self._events[event.uid])
+                self._events[event.uid] = event
+                self.bytes += event.size
+                for index, key in self._indexes(event):
+                    index.setdefault(key, set()).add(event.uid)
+            while self.bytes > self.max_bytes and self._events:
+                self._remove(next(iter(self._events.values())))
+                self.evicted += 1
+
+    def query(self, namespace=None, object_kind=None, object_name=None, reason=None, type=None, since_seconds=None):
+        """Matching events, newest first. object_name may end in * to match a name prefix."""
+        cutoff = time.time() - since_seconds if since_seconds else None
+        prefix = object_name[:-1] if object_name and object_name.endswith("*") else None
+        with self._lock:
+            candidates = []
+            if object_name:
+                candidates.append(set().union(*(
+                    uids for (kind, ns, name), uids in self._by_object.items()
+                    if (name.startswith(prefix) if prefix is not None else name == object_name)
+                    and (not object_kind or kind.lower() == object_kind.lower())
+                    and (not namespace or ns == namespace)
+                )))
+            if reason:
+                candidates.append(self._by_reason.get(reason, set()))
+            if type:
+                candidates.append(self._by_type.get(type.capitalize(), set()))
+            events = (self._events[uid] for uid in set.intersection(*candidates)) if candidates else self._events.values()
+            matched = []
+            for event in events:
+                if cutoff is not None and event.time < cutoff:
+                    continue
+                if namespace and event.namespace != namespace:
+                    continue
+                if object_kind and event.object[0].lower() != object_kind.lower():
+                    continue
+                matched.append(event)
+        matched.sort(key=lambda e: e.time, reverse=True)
+        return matched
+
+    def _relist(self):
+        resource_version = None
+        for items, _, resource_version in _iter_pages(_raw_list_fn("events", context=self.context)):
+            self.put(sorted((StoredEvent(obj) for obj in items), key=lambda e: e.time))
+        self.resource_version = resource_version
+        self.synced.set()
+
+    def _watch(self):
+        resp = _typed_list_fn("events", None, self.context)(
+            watch=True, resource_version=self.resource_version, allow_watch_bookmarks=True,
+            timeout_seconds=self.watch_timeout, _preload_content=False, _request_timeout=self.watch_timeout + 30,
+        )
+        try:
+            for line in watch.watch.iter_resp_lines(resp):
+                if self._stop.is_set():
+                    return
+                event = _loads(line)
+                event_type, obj = event.get("type"), event.get("object") or {}
+                if event_type == "ERROR":
+                    raise WatchError(obj)
+                self.resource_version = _get(obj, "metadata.resourceVersion") or self.resource_version
+                if event_type in ("ADDED", "MODIFIED"):
+                    self.put([StoredEvent(obj)])
+                if event_type != "BOOKMARK":
+                    yield event_type
+        finally:
+            resp.close()
+            resp.release_conn()
+
+
+_event_stores = {}
+_event_stores_lock = threading.Lock()
+
+
+def _event_store(context=None):
+    """Return the (started) event store for context, creating it on first use."""
+    with _event_stores_lock:
+        store = _event_stores.get(context)
+        if store is None:
+            store = _event_stores[context] = EventStore(context).start()
+    return store
+
+
+def _format_events(events, limit):
+    lines = ["LAST\tTYPE\tREASON\tOBJECT\tCOUNT\tMESSAGE"]
+    for event in events[:limit]:
+        last = _age(datetime.fromtimestamp(event.time, timezone.utc)) if event.time else "?"
+        lines.append(f"{last}\t{event.type}\t{event.reason}\t{event.describe_object()}\t{event.count}\t{event.message}")
+    if len(events) > limit:
+        lines.append(f"... [{len(events) - limit} more matching events; narrow the query or raise limit]")
+    return lines
+
+
+def _format_event_groups(events, group_by, limit):
+    keys = {
+        "reason": lambda e: e.reason,
+        "object": StoredEvent.describe_object,
+        "type": lambda e: e.type,
+        "namespace": lambda e: e.namespace,
+    }
+    key = keys[group_by]
+    counts, records, examples = Counter(), Counter(), {}
+    for event in events:
+        group = key(event)
+        counts[group] += event.count
+        records[group] += 1
+        examples.setdefault(group, event)
+    lines = [f"{group_by.upper()}\tCOUNT\tEVENTS\tLATEST"]
+    for group, count in counts.most_common(limit):
+        example = examples[group]
+        latest = example.reason if group_by == "object" else example.describe_object()
+        lines.append(f"{group}\t{count}\t{records[group]}\t{latest}: {example.message}")
+    return lines
+
+
+# Owner graph: ownerReferences of the cached workload kinds, for workload <-> pod resolution.
+OWNER_GRAPH_KINDS = {
+    "pods": "Pod",
+    "replicasets": "ReplicaSet",
+    "jobs": "Job",
+    "statefulsets": "StatefulSet",
+    "daemonsets": "DaemonSet",
+}
+OWNER_ROOT_KINDS = {"deployments": "Deployment", "cronjobs": "CronJob", **OWNER_GRAPH_KINDS}
+_OWNER_PLURALS = {kind: plural for plural, kind in OWNER_ROOT_KINDS.items()}
+OWNER_STATUS_COLUMNS = {
+    "pods": ("phase", "ready", "restarts", "node"),
+    "replicasets": ("ready",),
+    "statefulsets": ("ready",),
+    "daemonsets": ("desired", "ready"),
+    "jobs": ("completions", "active", "failed"),
+}
+
+
+class OwnerGraph:
+    """ownerReferences links between the objects of OWNER_GRAPH_KINDS in one context.
+
+    Fed by one OwnerFeed per kind, so it changes incrementally with their watches. Only uid, kind,
+    namespace, name and owner uids are kept per object (roughly 0.5 KB), never the objects
+    themselves. Owners that are not watched themselves (Deployments, CronJobs) are known by the
+    references pointing at them.
+    """
+
+    def __init__(self, context=None):
+        self.context = context
+        self._nodes = {}  # uid -> (kind, namespace, name), for objects and referenced owners
+        self._uids = {}  # (kind, namespace, name) -> uid
+        self._owners = {}  # uid -> owner uids, for watched objects
+        self._children = {}  # owner uid -> child uids
+        self._lock = threading.Lock()
+        self._feeds = [OwnerFeed(self, kind).start() for kind in OWNER_GRAPH_KINDS]
+
+    def synced(self, timeout):
+        deadline = time.monotonic() + timeout
+        return all(f.synced.wait(max(0, deadline - time.monotonic())) for f in self._feeds)
+
+    def _add_node(self, uid, key):
+        self._nodes[uid] = key
+        self._uids[key] = uid
+
+    def _drop_node(self, uid):
+        if uid not in self._owners and uid not in self._children:
+            key = self._nodes.pop(uid, None)
+            if key and self._uids.get(key) == uid:
+                del self._uids[key]
+
+    def update(self, kind, event_type, meta):
+        """Apply an ADDED/MODIFIED/DELETED change to an object of kind, given its metadata as JSON."""
+        uid, ns = meta["uid"], sys.intern(meta.get("namespace") or "")
+        refs = meta.get("ownerReferences") or []
+        with self._lock:
+            for owner in self._owners.pop(uid, ()):
+                self._children[owner].discard(uid)
+                if not self._children[owner]:
+                    del self._children[owner]
+                    self._drop_node(owner)
+            if event_type == "DELETED":
+                self._drop_node(uid)
+                return
+            self._add_node(uid, (kind, ns, meta["name"]))
+            self._owners[uid] = tuple(ref["uid"] for ref in refs)
+            for ref in refs:
+                if ref["uid"] not in self._nodes:
+                    self._add_node(ref["uid"], (_OWNER_PLURALS.get(ref["kind"], ref["kind"]), ns, ref["name"]))
+                self._children.setdefault(ref["uid"], set()).add(uid)
+
+    def prune(self, kind, seen):
+        """Drop the objects of kind whose uid a fresh LIST did not return."""
+        with self._lock:
+            gone = [uid for uid in self._owners if uid not in seen and self._nodes[uid][0] == kind]
+        for uid in gone:
+            self.update(kind, "DELETED", {"uid": uid})
+
+    def resolve(self, kind, namespace, name, max_children=None):
+        """Return (uid, tree) for the named object, or (None, []) if the graph does not know it.
+
+        The tree starts at the object's topmost owner and lists (depth, uid, kind, name) depth first.
+        Past max_children children of one owner, the rest are summed up as (depth, None, None, count);
+        the named object itself is always kept.
+        """
+        with self._lock:
+            uid = self._uids.get((kind, namespace, name))
+            if uid is None:
+                return None, []
+            root, seen = uid, {uid}
+            while self._owners.get(root) and self._owners[root][0] not in seen:
+                root = self._owners[root][0]
+                seen.add(root)
+            path, tree, stack, seen = seen, [], [(0, root, None)], set()
+            while stack:
+                depth, current, more = stack.pop()
+                if current is None:
+                    tree.append((depth, None, None, more))
+                    continue
+                if current in seen:
+                    continue
+                seen.add(current)
+                tree.append((depth, current, *self._nodes[current][::2]))
+                children = sorted(self._children.get(current, ()), key=lambda c: (c not in path, self._nodes[c][2]))
+                if max_children and len(children) > max_children:
+                    stack.append((depth + 1, None, len(children) - max_children))
+                    children = children[:max_children]
+                stack.extend((depth + 1, child, None) for child in reversed(children))
+            return uid, tree
+
+    def statuses(self, namespace, nodes):
+        """Short live status of each (kind, name) in nodes, keyed like nodes.
+
+        Read from the informer when KUBE_MCP_INFORMERS enables the kind, else fetched from the API
+        in parallel; objects that vanished in between get an empty status.
+        """
+        objs, reads = {}, {}
+        for kind in {kind for kind, _ in nodes if kind in OWNER_STATUS_COLUMNS}:
+            informer = _informers.usable(kind, self.context)
+            for node in (node for node in nodes if node[0] == kind):
+                if informer is not None:
+                    objs[node] = informer.get(namespace, node[1])
+                else:
+                    reads[node] = partial(_read_or_none, _typed_read_fn(kind, self.context), node[1], namespace)
+        if reads:
+            with _phase("api"):
+                objs.update(_run_parallel(reads, BATCH_PARALLELISM, _remaining() or TOOL_TIMEOUT))
+        return {
+            (kind, name): " ".join(f"{c}={KIND_COLUMNS[kind][c](obj)}" for c in OWNER_STATUS_COLUMNS[kind])
+            for (kind, name), obj in objs.items() if obj is not None
+        }
+
+
+def _read_or_none(read_fn, *args):
+    """_read_raw(read_fn, *args), or None when the object does not exist (any more)."""
     try:
+        return _read_raw(read_fn, *args)
+    except ApiException as e:
+        if e.status == 404:
+            return None
+        raise
+
+
+class OwnerFeed(ListWatch):
+    """Feeds one kind's ownerReferences into an OwnerGraph from paged metadata-only LISTs and WATCHes."""
+
+    def __init__(self, graph, kind):
+        self.graph = graph
+        self.kind = kind
+        self.resource_version = None
+        self.synced = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"owners-{self.kind}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _relist(self):
+        seen, resource_version = set(), None
+        pages = _iter_pages(_raw_list_fn(self.kind, accept=METADATA_LIST_ACCEPT, context=self.graph.context))
+        for items, _, resource_version in pages:
+            for obj in items:
+                seen.add(obj["metadata"]["uid"])
+                self.graph.update(self.kind, "ADDED", obj["metadata"])
+        self.graph.prune(self.kind, seen)
+        self.resource_version = resource_version
+        self.synced.set()
+
+    def _watch(self):
+        resp = _typed_list_fn(self.kind, None, self.graph.context)(
+            watch=True, resource_version=self.resource_version, allow_watch_bookmarks=True,
+            timeout_seconds=self.watch_timeout, _headers={"Accept": METADATA_WATCH_ACCEPT},
+            _preload_content=False, _request_timeout=self.watch_timeout + 30,
+        )
         try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        if namespace:
-            pods = v1.list_namespaced_pod(namespace)
+            for line in watch.watch.iter_resp_lines(resp):
+                if self._stop.is_set():
+                    return
+                event = _loads(line)
+                event_type, obj = event.get("type"), event.get("object") or {}
+                if event_type == "ERROR":
+                    raise WatchError(obj)
+                self.resource_version = _get(obj, "metadata.resourceVersion") or self.resource_version
+                if event_type in CHANGE_TYPES:
+                    self.graph.update(self.kind, event_type, obj["metadata"])
+                    yield event_type
+        finally:
+            resp.close()
+            resp.release_conn()
+
+
+_owner_graphs = {}
+_owner_graphs_lock = threading.Lock()
+
+
+def _owner_graph(context=None):
+    """Return the owner graph for context, starting its feeds on first use."""
+    with _owner_graphs_lock:
+        graph = _owner_graphs.get(context)
+        if graph is None:
+            graph = _owner_graphs[context] = OwnerGraph(context)
+    return graph
+
+
+# Resource usage: metrics.k8s.io joined with pod requests/limits, aggregated per context and reused for a while.
+USAGE_TTL = float(os.environ.get("KUBE_MCP_USAGE_TTL", "15"))
+USAGE_TIMEOUT = float(os.environ.get("KUBE_MCP_USAGE_TIMEOUT", "30"))
+USAGE_KINDS = ("pods", "nodes", "namespaces")
+USAGE_SORTS = ("cpu", "memory")
+METRICS_GROUP, METRICS_VERSION = "metrics.k8s.io", "v1beta1"
+QUANTITY_SUFFIXES = {
+    "n": 1e-9, "u": 1e-6, "m": 1e-3, "": 1, "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18,
+    "Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40, "Pi": 2 ** 50, "Ei": 2 ** 60,
+}
+_QUANTITY = re.compile(r"^([+-]?[0-9.]+(?:[eE][+-]?[0-9]+)?)([a-zA-Z]*)$")
+
+
+@lru_cache(maxsize=4096)
+def _quantity(value):
+    """A resource quantity ("250m", "512Mi", "1234567n") as a float in base units (cores, bytes)."""
+    match = _QUANTITY.match(str(value).strip())
+    if not match or match.group(2) not in QUANTITY_SUFFIXES:
+        raise ValueError(f"invalid quantity {value!r}")
+    return float(match.group(1)) * QUANTITY_SUFFIXES[match.group(2)]
+
+
+def _resources(containers, field):
+    """Summed cpu and memory of the containers' resources.<field> (requests/limits); None where any container lacks it."""
+    totals = {"cpu": 0.0, "memory": 0.0}
+    for c in containers:
+        values = _get(c, f"resources.{field}") or {}
+        for resource in totals:
+            if totals[resource] is not None:
+                totals[resource] = None if values.get(resource) is None else totals[resource] + _quantity(values[resource])
+    return totals["cpu"], totals["memory"]
+
+
+def _metrics_list_fn(plural, namespace=None, context=None):
+    """List function for the metrics.k8s.io pods/nodes resources, yielding decoded JSON pages."""
+    api = _clients.api("CustomObjectsApi", context)
+    if namespace:
+        return partial(_read_raw, api.list_namespaced_custom_object, METRICS_GROUP, METRICS_VERSION, namespace, plural)
+    return partial(_read_raw, api.list_cluster_custom_object, METRICS_GROUP, METRICS_VERSION, plural)
+
+
+class UsageSnapshot:
+    """CPU (cores) and memory (bytes) use of the running pods, and of the nodes for a cluster-wide snapshot.
+
+    pods holds (namespace, name, node, cpu, memory, cpu request, memory request, cpu limit, memory limit);
+    nodes holds (name, cpu, memory, allocatable cpu, allocatable memory, requested cpu, requested memory, pods).
+    Requests and limits sum the pod's containers and are None when a container sets none.
+    """
+
+    def __init__(self, namespace, context):
+        self.namespace = namespace
+        calls = {
+            "pod_metrics": lambda: list(_iter_items(_metrics_list_fn("pods", namespace, context))),
+            "pods": lambda: self._pod_specs(_snapshot_items("pods", namespace, context)),
+        }
+        if namespace is None:
+            calls["node_metrics"] = lambda: list(_iter_items(_metrics_list_fn("nodes", context=context)))
+            calls["nodes"] = lambda: {_name(n): n for n in _snapshot_items("nodes", None, context)}
+        results = _run_parallel(calls, len(calls), USAGE_TIMEOUT)
+        missing = [name for name, result in results.items() if result is None]
+        if missing:
+            raise ToolCancelled(f"timed out reading {', '.join(missing)}")
+        self.taken_at = time.monotonic()
+        self.window = _get(results["pod_metrics"][0], "window") if results["pod_metrics"] else None
+        with _phase("aggregate"):
+            self.pods = self._join_pods(results["pod_metrics"], results["pods"])
+            self.nodes = self._join_nodes(results["node_metrics"], results["nodes"], results["pods"]) if namespace is None else None
+
+    @staticmethod
+    def _pod_specs(pods):
+        specs = {}
+        for pod in pods:
+            if _get(pod, "status.phase") in ("Succeeded", "Failed"):
+                continue
+            containers = _get(pod, "spec.containers", [])
+            specs[(_get(pod, "metadata.namespace"), _name(pod))] = (
+                _get(pod, "spec.nodeName"), *_resources(containers, "requests"), *_resources(containers, "limits")
+            )
+        return specs
+
+    @staticmethod
+    def _join_pods(metrics, specs):
+        rows = []
+        for m in metrics:
+            namespace, name = _get(m, "metadata.namespace"), _name(m)
+            usage = [_get(c, "usage", {}) for c in _get(m, "containers", [])]
+            cpu = sum(_quantity(u.get("cpu", 0)) for u in usage)
+            memory = sum(_quantity(u.get("memory", 0)) for u in usage)
+            node, *resources = specs.get((namespace, name)) or (None, None, None, None, None)
+            rows.append((namespace, name, node, cpu, memory, *resources))
+        return rows
+
+    @staticmethod
+    def _join_nodes(metrics, nodes, specs):
+        requested = {}
+        for node, cpu_request, memory_request, _, _ in specs.values():
+            totals = requested.setdefault(node, [0.0, 0.0, 0])
+            totals[0] += cpu_request or 0
+            totals[1] += memory_request or 0
+            totals[2] += 1
+        rows = []
+        for m in metrics:
+            name = _name(m)
+            allocatable = _get(nodes.get(name), "status.allocatable", {})
+            cpu_requested, memory_requested, count = requested.get(name, (0.0, 0.0, 0))
+            rows.append((
+                name, _quantity(_get(m, "usage.cpu", 0)), _quantity(_get(m, "usage.memory", 0)),
+                _quantity(allocatable["cpu"]) if allocatable.get("cpu") else None,
+                _quantity(allocatable["memory"]) if allocatable.get("memory") else None,
+                cpu_requested, memory_requested, count,
+            ))
+        return rows
+
+    def age(self):
+        return time.monotonic() - self.taken_at
+
+    def fresh(self):
+        return self.age() < USAGE_TTL
+
+
+_usage_snapshots = {}
+_usage_snapshots_lock = threading.Lock()
+
+
+def _usage_snapshot(namespace=None, context=None):
+    """Return a usage snapshot no older than USAGE_TTL, taking one if needed.
+
+    Concurrent callers wait for a single snapshot; a fresh cluster-wide snapshot also answers
+    namespace queries.
+    """
+    with _usage_snapshots_lock:
+        cluster = _usage_snapshots.get((context, None))
+        if namespace and cluster and cluster["snapshot"] and cluster["snapshot"].fresh():
+            return cluster["snapshot"]
+        entry = _usage_snapshots.setdefault((context, namespace), {"lock": threading.Lock(), "snapshot": None})
+    with entry["lock"]:
+        if entry["snapshot"] is None or not entry["snapshot"].fresh():
+            entry["snapshot"] = UsageSnapshot(namespace, context)
+        return entry["snapshot"]
+
+
+def _cpu(cores):
+    return "<none>" if cores is None else f"{cores * 1000:.0f}m"
+
+
+def _memory(size):
+    return "<none>" if size is None else f"{size / 2 ** 20:.0f}Mi"
+
+
+def _percent(used, total):
+    return f"{used / total:.0%}" if used is not None and total else "<none>"
+
+
+def _usage_rows(snapshot, kind, namespace, node):
+    """(rows, header, columns) for kind, where columns(row) gives (cpu, memory, cpu base, memory base, cells)."""
+    if kind == "nodes":
+        rows = [r for r in snapshot.nodes if not node or r[0] == node]
+        header = "NODE\tCPU\tCPU%\tCPU_REQUESTED\tMEMORY\tMEMORY%\tMEMORY_REQUESTED\tPODS"
+        return rows, header, lambda r: (r[1], r[2], r[3], r[4], (
+            r[0], _cpu(r[1]), _percent(r[1], r[3]), _cpu(r[5]), _memory(r[2]), _percent(r[2], r[4]), _memory(r[6]), r[7]
+        ))
+    pods = [r for r in snapshot.pods if (not namespace or r[0] == namespace) and (not node or r[2] == node)]
+    if kind == "pods":
+        header = "POD\tNODE\tCPU\tCPU_REQ\tCPU_LIM\tCPU%REQ\tMEMORY\tMEM_REQ\tMEM_LIM\tMEM%REQ"
+        return pods, header, lambda r: (r[3], r[4], r[5], r[6], (
+            f"{r[0]}/{r[1]}", r[2] or "<none>", _cpu(r[3]), _cpu(r[5]), _cpu(r[7]), _percent(r[3], r[5]),
+            _memory(r[4]), _memory(r[6]), _memory(r[8]), _percent(r[4], r[6]),
+        ))
+    totals = {}
+    for r in pods:
+        t = totals.setdefault(r[0], [r[0], 0, 0.0, 0.0, 0.0, 0.0])
+        t[1] += 1
+        for i, value in enumerate((r[3], r[4], r[5], r[6]), 2):
+            t[i] += value or 0
+    header = "NAMESPACE\tPODS\tCPU\tCPU_REQ\tCPU%REQ\tMEMORY\tMEM_REQ\tMEM%REQ"
+    return list(totals.values()), header, lambda r: (r[2], r[3], r[4], r[5], (
+        r[0], r[1], _cpu(r[2]), _cpu(r[4]), _percent(r[2], r[4]), _memory(r[3]), _memory(r[5]), _percent(r[3], r[5]),
+    ))
+
+
+# Secret/ConfigMap data: objects per page, the most response bytes held at once, and the output ceiling per call.
+DATA_PAGE_SIZE = int(os.environ.get("KUBE_MCP_DATA_PAGE_SIZE", "50"))
+DATA_MAX_BYTES = int(os.environ.get("KUBE_MCP_DATA_MAX_BYTES", str(16 * 1024 * 1024)))
+DATA_MAX_OUTPUT = int(os.environ.get("KUBE_MCP_DATA_MAX_OUTPUT", str(1024 * 1024)))
+DATA_KINDS = ("secrets", "configmaps")
+
+
+class MemoryBudgetExceeded(Exception):
+    pass
+
+
+def _read_capped(api_method, *args, max_bytes=DATA_MAX_BYTES, **kwargs):
+    """Like _read_raw, but give up with MemoryBudgetExceeded as soon as the response body passes max_bytes."""
+    _check_cancelled()
+    if "_request_timeout" not in kwargs:
+        kwargs["_request_timeout"] = _request_timeout()
+    resp = api_method(*args, _preload_content=False, **kwargs)
+    chunks, size = [], 0
+    try:
+        with _phase("api"):
+            for chunk in resp.stream(LOG_CHUNK_SIZE, decode_content=True):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise MemoryBudgetExceeded(f"response is larger than the {max_bytes}-byte memory budget")
+                chunks.append(chunk)
+    except BaseException:
+        resp.close()  # unread data left: the connection cannot be reused
+        raise
+    finally:
+        resp.release_conn()
+    with _phase("deserialize"):
+        return _loads(b"".join(chunks))
+
+
+def _iter_data_objects(kind, namespace, label_selector, context, skipped):
+    """Yield the Secrets or ConfigMaps of a list page by page, never holding a response over DATA_MAX_BYTES.
+
+    A page over the budget is fetched again at half the page size. An object over the budget on its
+    own is listed metadata-only instead, and its name added to skipped.
+    """
+    list_fn = _typed_list_fn(kind, namespace, context)
+    token, page_size = None, DATA_PAGE_SIZE
+    while True:
+        try:
+            page = _read_capped(list_fn, limit=page_size, _continue=token, label_selector=label_selector)
+        except MemoryBudgetExceeded:
+            if page_size > 1:
+                page_size //= 2
+                continue
+            page = _read_raw(list_fn, limit=1, _continue=token, label_selector=label_selector,
+                             _headers={"Accept": METADATA_LIST_ACCEPT})
+            skipped.extend(_ns_name(o) for o in page.get("items", []))
         else:
-            pods = v1.list_pod_for_all_namespaces()
-        pod_list = []
-        for pod in pods.items:
-            pod_list.append(f"{pod.metadata.namespace}/{pod.metadata.name}")
-        return "\n".join(pod_list) if pod_list else "No pods found."
+            yield from page.get("items", [])
+            page_size = min(DATA_PAGE_SIZE, page_size * 2)
+        token = _get(page, "metadata.continue")
+        if not token:
+            return
+
+
+def _data_keys(keys):
+    return {k.strip() for k in (keys or "").split(",") if k.strip()}
+
+
+def _redact(obj, kind, keys=()):
+    """obj as a dict whose data values are replaced by their size, except the keys asked for ("*" = all).
+
+    Those are decoded: Secret data and ConfigMap binaryData are base64; values that are not UTF-8
+    text are shown as base64.
+    """
+    obj = dict(_as_dict(obj))
+    for field in ("data", "binaryData"):
+        values = obj.get(field)
+        if not values:
+            continue
+        encoded = kind == "secrets" or field == "binaryData"
+        redacted = {}
+        for key, value in values.items():
+            if key not in keys and "*" not in keys:
+                size = len(value) * 3 // 4 - value[-2:].count("=") if encoded else len(value.encode())
+                redacted[key] = f"<{size} bytes>"
+            elif encoded:
+                raw = base64.b64decode(value)
+                try:
+                    redacted[key] = raw.decode()
+                except UnicodeDecodeError:
+                    redacted[key] = f"<{len(raw)} bytes, base64> {value}"
+            else:
+                redacted[key] = value
+        obj[field] = redacted
+    return obj
+
+
+def _get_data_objects(kind, name, namespace, keys, label_selector, output, max_bytes, context, informer=None):
+    """Body of get_secret/get_configmap: one object or a page-by-page listing, with values redacted but for keys."""
+    label = {"secrets": "Secret", "configmaps": "ConfigMap"}[kind]
+    wanted = _data_keys(keys)
+    max_bytes = min(max_bytes or DATA_MAX_OUTPUT, DATA_MAX_OUTPUT)
+    if name and namespace:
+        obj = informer.get(namespace, name) if informer else None
+        if obj is None:
+            read = getattr(_clients.api("CoreV1Api", context), LIST_RESOURCES[kind][1].replace("list_", "read_", 1))
+            try:
+                obj = _read_capped(read, name, namespace)
+            except MemoryBudgetExceeded as e:
+                return f"Error: {label} {namespace}/{name}: {e} (KUBE_MCP_DATA_MAX_BYTES)"
+        obj = _redact(obj, kind, wanted)
+        present = set(obj.get("data") or ()) | set(obj.get("binaryData") or ())
+        missing = sorted(wanted - present - {"*"})
+        text = f"{label} '{name}' in namespace '{namespace}':\n" + _render(obj, kind, output, max_bytes)
+        return text + (f"\nKeys not found: {', '.join(missing)}" if missing else "")
+    skipped = []
+    if informer and not label_selector:
+        objs = informer.list(namespace)
+    else:
+        objs = _iter_data_objects(kind, namespace, label_selector, context, skipped)
+    text = _render_many((_redact(o, kind, wanted) for o in objs), kind, output, max_bytes, part="data")
+    if skipped:
+        note = (f"{len(skipped)} {kind} larger than the {DATA_MAX_BYTES}-byte memory budget not read: "
+                + ", ".join(skipped[:20]) + (" ..." if len(skipped) > 20 else ""))
+        text = f"{text}\n{note}" if text else note
+    return text
+
+
+# Top 30 Kubernetes tools as MCP tools
+@_tool(cache="pods")
+def list_pods(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all pods in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector (e.g. status.phase!=Running, spec.nodeName=x); fields picks the output
+    columns (e.g. name,phase,node,restarts). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
+    try:
+        return _list_resource(
+            "pods", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No pods found."
     except Exception as e:
         return f"Error fetching pods: {e}"
 
-@mcp.tool
-def get_pod_logs(pod_name: str = None, namespace: str = None) -> str:
-    """Get logs for a specific pod. If pod or namespace not specified, return logs for all pods in all namespaces."""
+@_tool
+def get_pod_logs(
+    pod_name: str = None,
+    namespace: str = None,
+    label_selector: str = None,
+    container: str = None,
+    tail_lines: int = None,
+    max_parallel: int = LOG_FANOUT_PARALLELISM,
+    pod_timeout_seconds: float = LOG_POD_TIMEOUT,
+    deadline_seconds: float = LOG_DEADLINE,
+    context: str = None,
+) -> str:
+    """Get logs for a specific pod. If pod or namespace not specified, return logs for all matching pods.
+
+    Logs of many pods are fetched concurrently (at most max_parallel at a time, last 10 lines
+    each unless tail_lines is set). Pods can be narrowed by namespace, label_selector and
+    container. Whatever has arrived when deadline_seconds runs out is returned. Each pod's log
+    is read up to KUBE_MCP_LOG_POD_MAX_BYTES.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
+        v1 = _clients.api("CoreV1Api", context)
         logs = []
         if pod_name and namespace:
-            logs.append(f"{namespace}/{pod_name}:\n" + v1.read_namespaced_pod_log(pod_name, namespace))
+            log = v1.read_namespaced_pod_log(
+                pod_name, namespace, container=container, tail_lines=tail_lines, limit_bytes=LOG_POD_MAX_BYTES or None,
+                _request_timeout=pod_timeout_seconds,
+            )
+            logs.append(f"{namespace}/{pod_name}:\n" + log)
         else:
-            pods = v1.list_pod_for_all_namespaces()
-            for pod in pods.items:
-                try:
-                    log = v1.read_namespaced_pod_log(pod.metadata.name, pod.metadata.namespace, tail_lines=10)
-                    logs.append(f"{pod.metadata.namespace}/{pod.metadata.name}:\n{log}")
-                except Exception as e:
-                    logs.append(f"{pod.metadata.namespace}/{pod.metadata.name}: Error fetching logs: {e}")
+            field_selector = f"metadata.name={pod_name}" if pod_name else None
+            if namespace:
+                pods = _iter_items(_raw_list_fn("pods", namespace, context=context), label_selector=label_selector, field_selector=field_selector)
+            else:
+                pods = _iter_items(_raw_list_fn("pods", context=context), label_selector=label_selector, field_selector=field_selector)
+            targets = [
+                (_get(p, "metadata.namespace"), _get(p, "metadata.name"))
+                for p in pods
+                if not container or any(_get(c, "name") == container for c in _get(p, "spec.containers", []))
+            ]
+            logs, missing = _fan_out_logs(
+                v1, targets, container, LOG_TAIL_LINES if tail_lines is None else tail_lines,
+                max_parallel, pod_timeout_seconds, deadline_seconds,
+            )
+            if missing:
+                logs.append(f"Deadline of {deadline_seconds}s reached: logs from {missing} of {len(targets)} pods not returned.")
         return "\n\n".join(logs) if logs else "No pod logs found."
     except Exception as e:
         return f"Error fetching pod logs: {e}"
 
-@mcp.tool
-def describe_pod(pod_name: str = None, namespace: str = None) -> str:
-    """Describe a specific pod, or all pods if none specified."""
+@_tool(timeout=0)
+async def stream_pod_logs(
+    pod_name: str,
+    namespace: str,
+    container: str = None,
+    since_seconds: int = None,
+    tail_lines: int = None,
+    limit_bytes: int = None,
+    timestamps: bool = False,
+    follow_seconds: float = None,
+    max_return_bytes: int = LOG_STREAM_MAX_RETURN,
+    context: str = None,
+    ctx: Context = None,
+) -> str:
+    """Stream a pod's log in chunks, sending each chunk to the client as a progress notification.
+
+    With follow_seconds set, keeps following new output for that many seconds (at most
+    KUBE_MCP_LOG_STREAM_MAX_SECONDS, which also bounds a plain read). Only the last max_return_bytes
+    of log text (UTF-8 encoded) are kept and returned, however large the log is.
+    """
     try:
+        v1 = _clients.api("CoreV1Api", context)
+        follow = bool(follow_seconds)
+        capped = follow and LOG_STREAM_MAX_SECONDS and follow_seconds > LOG_STREAM_MAX_SECONDS
+        if capped:
+            follow_seconds = LOG_STREAM_MAX_SECONDS
+        resp = await asyncio.to_thread(
+            v1.read_namespaced_pod_log,
+            pod_name,
+            namespace,
+            container=container,
+            since_seconds=since_seconds,
+            tail_lines=tail_lines,
+            limit_bytes=limit_bytes,
+            timestamps=timestamps,
+            follow=follow,
+            _preload_content=False,
+            # A blocked read gives up shortly after the follow window, so no reader thread outlives it for long.
+            _request_timeout=(LOG_POD_TIMEOUT, follow_seconds + LOG_POD_TIMEOUT) if follow else LOG_POD_TIMEOUT,
+        )
+        chunks = resp.stream(LOG_CHUNK_SIZE, decode_content=True)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        tail, kept, total, dropped, cut_short = deque(), 0, 0, False, False
+        loop = asyncio.get_running_loop()
+        seconds = follow_seconds if follow else LOG_STREAM_MAX_SECONDS
+        deadline = loop.time() + seconds if seconds else None
         try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        descriptions = []
+            while True:
+                timeout = None if deadline is None else deadline - loop.time()
+                if timeout is not None and timeout <= 0:
+                    cut_short = capped or not follow
+                    break
+                try:
+                    chunk = await asyncio.wait_for(asyncio.to_thread(next, chunks, None), timeout)
+                except asyncio.TimeoutError:
+                    cut_short = capped or not follow
+                    break
+                if not chunk:
+                    break
+                total += len(chunk)
+                text = decoder.decode(chunk)
+                tail.append(text)
+                kept += len(text.encode())
+                while kept > max_return_bytes and len(tail) > 1:
+                    kept -= len(tail.popleft().encode())
+                    dropped = True
+                if ctx is not None:
+                    await ctx.report_progress(progress=total, total=limit_bytes, message=text)
+        finally:
+            resp.close()
+        text = "".join(tail)
+        if kept > max_return_bytes:
+            # Keep the last max_return_bytes bytes, minus a character cut in half at the start.
+            data = text.encode()
+            text, dropped = data[len(data) - max(0, max_return_bytes):].decode("utf-8", "ignore"), True
+        header = f"{namespace}/{pod_name}: streamed {total} bytes"
+        if dropped:
+            header += f", showing the last {len(text.encode())} bytes"
+        if cut_short:
+            header += f", stopped after {seconds:g}s (KUBE_MCP_LOG_STREAM_MAX_SECONDS)"
+        return f"{header}\n{text}" if text else f"{header}\nNo log output."
+    except Exception as e:
+        return f"Error streaming pod logs: {e}"
+
+@_tool
+def search_pod_logs(
+    pattern: str,
+    namespace: str = None,
+    label_selector: str = None,
+    deployment: str = None,
+    container: str = None,
+    regex: bool = False,
+    ignore_case: bool = False,
+    context_lines: int = 0,
+    since_seconds: int = None,
+    tail_lines: int = None,
+    max_matches: int = LOG_SEARCH_MAX_MATCHES,
+    max_bytes_per_pod: int = LOG_SEARCH_POD_BYTES,
+    max_parallel: int = LOG_FANOUT_PARALLELISM,
+    pod_timeout_seconds: float = LOG_POD_TIMEOUT,
+    deadline_seconds: float = LOG_DEADLINE,
+    context: str = None,
+) -> str:
+    """Search the logs of many pods for a substring (or a regex with regex=True) and return only matching lines,
+    grep style: "namespace/pod timestamp: line", with context_lines of surrounding lines marked "-".
+
+    Pods are picked by namespace, label_selector or deployment (its selector). Logs are streamed and
+    matched as they arrive, reading at most max_bytes_per_pod per container (narrow with since_seconds
+    or tail_lines), and the search stops once max_matches lines matched or deadline_seconds passed.
+    """
+    try:
+        if max_bytes_per_pod is None or max_bytes_per_pod <= 0:
+            return "Error: max_bytes_per_pod must be a positive number of bytes"
+        if regex:
+            compiled = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+            matcher = lambda text: compiled.search(text) is not None
+        elif ignore_case:
+            needle = pattern.lower()
+            matcher = lambda text: needle in text.lower()
+        else:
+            matcher = lambda text: pattern in text
+        if deployment:
+            if not namespace:
+                return "Error: deployment requires namespace"
+            apps = _clients.api("AppsV1Api", context)
+            selector = _label_selector(_get(_read_raw(apps.read_namespaced_deployment, deployment, namespace), "spec.selector"))
+            label_selector = ",".join(filter(None, (label_selector, selector)))
+        pods = _iter_items(
+            _raw_list_fn("pods", namespace, context=context),
+            label_selector=label_selector, field_selector="status.phase!=Pending",
+        )
+        targets = []
+        for pod in pods:
+            ns, name = _get(pod, "metadata.namespace"), _get(pod, "metadata.name")
+            names = [_get(c, "name") for c in _get(pod, "spec.containers", [])]
+            for c in ([container] if container in names else [] if container else names):
+                targets.append((ns, name, c, f"{ns}/{name}" + (f"[{c}]" if len(names) > 1 else "")))
+        if not targets:
+            return "No matching pods found."
+        v1 = _clients.api("CoreV1Api", context)
+        budget = MatchBudget(max_matches)
+        found = {target: [] for target in targets}
+        scanned = {}
+
+        def search(target):
+            if budget.exhausted.is_set():
+                return
+            try:
+                scanned[target] = _search_log(
+                    v1, target, matcher, max(0, context_lines), budget, found[target],
+                    since_seconds, tail_lines, max_bytes_per_pod, pod_timeout_seconds,
+                )
+            except ToolCancelled:
+                pass
+            except Exception as e:
+                message = _api_message(e) if isinstance(e, ApiException) else e
+                found[target].append(f"{target[3]}: Error reading logs: {message}")
+
+        _run_parallel({target: partial(search, target) for target in targets}, max_parallel, deadline_seconds)
+        matches = max_matches - budget.remaining
+        lines = [line for target in targets for line in found[target]]
+        with_matches = sum(1 for target in targets if found[target])
+        notes = [f"{matches} matching lines in {with_matches} of {len(targets)} containers; "
+                 f"read {sum(n for n, _ in list(scanned.values())):,} bytes."]
+        if budget.exhausted.is_set():
+            notes.append(f"Stopped after max_matches={max_matches}; narrow the search or raise it for more.")
+        unfinished = len(targets) - len(scanned)
+        if unfinished and not budget.exhausted.is_set():
+            notes.append(f"Deadline of {deadline_seconds:g}s reached: {unfinished} containers not fully searched.")
+        capped = sum(1 for _, cut in list(scanned.values()) if cut)
+        if capped:
+            notes.append(f"{capped} containers reached max_bytes_per_pod={max_bytes_per_pod} and may have been cut; "
+                         "use since_seconds or tail_lines.")
+        return "\n".join(lines + [""] + notes if lines else notes)
+    except re.error as e:
+        return f"Error: invalid regex {pattern!r}: {e}"
+    except Exception as e:
+        return f"Error searching pod logs: {e}"
+
+@_tool(cache="pods")
+def describe_pod(pod_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Describe a specific pod, or all pods if none specified. output: yaml (default), json or table, capped at max_bytes."""
+    try:
+        v1 = _clients.api("CoreV1Api", context)
+        informer = _informers.usable("pods", context)
         if pod_name and namespace:
-            pod = v1.read_namespaced_pod(pod_name, namespace)
-            descriptions.append(f"{namespace}/{pod_name}:\n{pod}")
+            pod = informer.get(namespace, pod_name) if informer else None
+            if pod is None:
+                pod = _read_raw(v1.read_namespaced_pod, pod_name, namespace)
+            return f"{namespace}/{pod_name}:\n{_render(pod, 'pods', output, max_bytes)}"
         else:
-            pods = v1.list_pod_for_all_namespaces()
-            for pod in pods.items:
-                descriptions.append(f"{pod.metadata.namespace}/{pod.metadata.name}:\n{pod}")
-        return "\n\n".join(descriptions) if descriptions else "No pod descriptions found."
+            pods = informer.list() if informer else _iter_items(_raw_list_fn("pods", context=context))
+            return _render_many(pods, "pods", output, max_bytes) or "No pod descriptions found."
     except Exception as e:
         return f"Error describing pod(s): {e}"
 
-@mcp.tool
-def list_deployments(namespace: str = None) -> str:
-    """List all deployments in a namespace, or all namespaces if none specified."""
+@_tool(cache="deployments")
+def list_deployments(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all deployments in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,ready,available). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        apps_v1 = client.AppsV1Api()
-        if namespace:
-            deployments = apps_v1.list_namespaced_deployment(namespace)
-        else:
-            deployments = apps_v1.list_deployment_for_all_namespaces()
-        dep_list = [f"{d.metadata.namespace}/{d.metadata.name}" for d in deployments.items]
-        return "\n".join(dep_list) if dep_list else "No deployments found."
+        return _list_resource(
+            "deployments", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No deployments found."
     except Exception as e:
         return f"Error fetching deployments: {e}"
 
-@mcp.tool
-def scale_deployment(deployment_name: str = None, replicas: int = None, namespace: str = None) -> str:
+@_tool(invalidates=("deployments", "replicasets", "pods"))
+def scale_deployment(deployment_name: str = None, replicas: int = None, namespace: str = None, context: str = None) -> str:
     """Scale a deployment to a specified number of replicas. If not specified, returns all deployments and their replica counts."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        apps_v1 = client.AppsV1Api()
+        apps_v1 = _clients.api("AppsV1Api", context)
         if deployment_name and replicas is not None and namespace:
             body = {'spec': {'replicas': replicas}}
             apps_v1.patch_namespaced_deployment_scale(deployment_name, namespace, body)
             return f"Scaled deployment {namespace}/{deployment_name} to {replicas} replicas."
         else:
-            deployments = apps_v1.list_deployment_for_all_namespaces()
-            return "\n".join([f"{d.metadata.namespace}/{d.metadata.name}: {d.spec.replicas} replicas" for d in deployments.items])
+            deployments = _iter_items(_raw_list_fn("deployments", context=context))
+            return "\n".join([f"{_ns_name(d)}: {_get(d, 'spec.replicas')} replicas" for d in deployments])
     except Exception as e:
         return f"Error scaling deployment(s): {e}"
 
-@mcp.tool
-def list_services(namespace: str = None) -> str:
-    """List all services in a namespace, or all namespaces if none specified."""
+@_tool(cache="services")
+def list_services(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all services in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,type,cluster_ip,ports). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        if namespace:
-            services = v1.list_namespaced_service(namespace)
-        else:
-            services = v1.list_service_for_all_namespaces()
-        svc_list = [f"{s.metadata.namespace}/{s.metadata.name}" for s in services.items]
-        return "\n".join(svc_list) if svc_list else "No services found."
+        return _list_resource(
+            "services", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No services found."
     except Exception as e:
         return f"Error fetching services: {e}"
 
-@mcp.tool
-def get_service(service_name: str = None, namespace: str = None) -> str:
-    """Get details of a specific service, or all services if not specified."""
+@_tool(cache="services")
+def get_service(service_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get details of a specific service, or all services if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
+        v1 = _clients.api("CoreV1Api", context)
+        informer = _informers.usable("services", context)
         if service_name and namespace:
-            svc = v1.read_namespaced_service(service_name, namespace)
-            return str(svc)
+            svc = informer.get(namespace, service_name) if informer else None
+            if svc is None:
+                svc = _read_raw(v1.read_namespaced_service, service_name, namespace)
+            return _render(svc, "services", output, max_bytes)
         else:
-            services = v1.list_service_for_all_namespaces()
-            return "\n\n".join([f"{s.metadata.namespace}/{s.metadata.name}: {s.spec}" for s in services.items])
+            services = informer.list() if informer else _iter_items(_raw_list_fn("services", context=context))
+            return _render_many(services, "services", output, max_bytes, part="spec")
     except Exception as e:
         return f"Error fetching service(s): {e}"
 
-@mcp.tool
-def list_namespaces() -> str:
-    """List all namespaces."""
+@_tool(cache="namespaces")
+def list_namespaces(
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all namespaces.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,phase,age). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        ns = v1.list_namespace()
-        return "\n".join([n.metadata.name for n in ns.items])
+        return _list_resource(
+            "namespaces", None, label_selector, field_selector, fields, page_size, continue_token,
+            default_fmt=_name, since=since, context=context,
+        ) or "No namespaces found."
     except Exception as e:
         return f"Error fetching namespaces: {e}"
 
-@mcp.tool
-def create_namespace(namespace: str = None) -> str:
+@_tool(invalidates=("namespaces",))
+def create_namespace(namespace: str = None, context: str = None) -> str:
     """Create a new namespace. If none specified, returns all namespaces."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
+        v1 = _clients.api("CoreV1Api", context)
         if namespace:
             body = client.V1Namespace(metadata=client.V1ObjectMeta(name=namespace))
             v1.create_namespace(body)
             return f"Created namespace: {namespace}"
         else:
-            ns = v1.list_namespace()
-            return "\n".join([n.metadata.name for n in ns.items])
+            ns = _iter_items(_raw_list_fn("namespaces", context=context))
+            return "\n".join([_name(n) for n in ns])
     except Exception as e:
         return f"Error creating/listing namespaces: {e}"
 
-@mcp.tool
-def delete_namespace(namespace: str = None) -> str:
+@_tool(invalidates="*")
+def delete_namespace(namespace: str = None, context: str = None) -> str:
     """Delete a namespace. If none specified, returns all namespaces."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
+        v1 = _clients.api("CoreV1Api", context)
         if namespace:
             v1.delete_namespace(namespace)
             return f"Deleted namespace: {namespace}"
         else:
-            ns = v1.list_namespace()
-            return "\n".join([n.metadata.name for n in ns.items])
+            ns = _iter_items(_raw_list_fn("namespaces", context=context))
+            return "\n".join([_name(n) for n in ns])
     except Exception as e:
         return f"Error deleting/listing namespaces: {e}"
 
-@mcp.tool
-def list_nodes() -> str:
-    """List all nodes in the cluster."""
+@_tool(cache="nodes")
+def list_nodes(
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all nodes in the cluster.
+
+    Filter server-side with label_selector/field_selector (e.g. spec.unschedulable=true); fields picks the output
+    columns (e.g. name,status,roles,version). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        nodes = v1.list_node()
-        return "\n".join([n.metadata.name for n in nodes.items])
+        return _list_resource(
+            "nodes", None, label_selector, field_selector, fields, page_size, continue_token,
+            default_fmt=_name, since=since, context=context,
+        ) or "No nodes found."
     except Exception as e:
         return f"Error fetching nodes: {e}"
 
-@mcp.tool
-def describe_node(node_name: str = None) -> str:
-    """Describe a specific node, or all nodes if not specified."""
+@_tool(cache="nodes")
+def describe_node(node_name: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Describe a specific node, or all nodes if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
+        v1 = _clients.api("CoreV1Api", context)
         if node_name:
-            node = v1.read_node(node_name)
-            return str(node)
+            node = _read_raw(v1.read_node, node_name)
+            return _render(node, "nodes", output, max_bytes)
         else:
-            nodes = v1.list_node()
-            return "\n\n".join([str(n) for n in nodes.items])
+            nodes = _iter_items(_raw_list_fn("nodes", context=context))
+            return _render_many(nodes, "nodes", output, max_bytes)
     except Exception as e:
         return f"Error describing node(s): {e}"
 
-@mcp.tool
-def list_configmaps(namespace: str = None) -> str:
-    """List all configmaps in a namespace, or all namespaces if none specified."""
+@_tool(cache="configmaps")
+def list_configmaps(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all configmaps in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,keys,age). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        if namespace:
-            cms = v1.list_namespaced_config_map(namespace)
-        else:
-            cms = v1.list_config_map_for_all_namespaces()
-        cm_list = [f"{cm.metadata.namespace}/{cm.metadata.name}" for cm in cms.items]
-        return "\n".join(cm_list) if cm_list else "No configmaps found."
+        return _list_resource(
+            "configmaps", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No configmaps found."
     except Exception as e:
         return f"Error fetching configmaps: {e}"
 
-@mcp.tool
-def get_configmap(configmap_name: str = None, namespace: str = None) -> str:
-    """Get a specific configmap, or all configmaps if not specified."""
+@_tool(cache="configmaps")
+def get_configmap(
+    configmap_name: str = None,
+    namespace: str = None,
+    keys: str = None,
+    label_selector: str = None,
+    output: str = "yaml",
+    max_bytes: int = RENDER_MAX_BYTES,
+    context: str = None,
+) -> str:
+    """Get a specific configmap, or the configmaps of a namespace (all namespaces if none) page by page.
+
+    Values are shown as their size in bytes; keys (comma-separated, "*" for all) shows those values.
+    output: yaml (default), json or table, capped at max_bytes (at most KUBE_MCP_DATA_MAX_OUTPUT).
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        if configmap_name and namespace:
-            cm = v1.read_namespaced_config_map(configmap_name, namespace)
-            return f"ConfigMap '{configmap_name}' in namespace '{namespace}':\n" + str(cm.data)
-        else:
-            cms = v1.list_config_map_for_all_namespaces()
-            return "\n\n".join([f"{cm.metadata.namespace}/{cm.metadata.name}: {cm.data}" for cm in cms.items])
+        informer = _informers.usable("configmaps", context)
+        return _get_data_objects(
+            "configmaps", configmap_name, namespace, keys, label_selector, output, max_bytes, context, informer
+        ) or "No configmaps found."
     except Exception as e:
         return f"Error fetching configmap(s): {e}"
 
-@mcp.tool
-def list_secrets(namespace: str = None) -> str:
-    """List all secrets in a namespace, or all namespaces if none specified."""
+@_tool(cache="secrets")
+def list_secrets(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all secrets in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector (e.g. type=kubernetes.io/tls); fields picks the output
+    columns (e.g. name,type,keys). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        if namespace:
-            secrets = v1.list_namespaced_secret(namespace)
-        else:
-            secrets = v1.list_secret_for_all_namespaces()
-        secret_list = [f"{s.metadata.namespace}/{s.metadata.name}" for s in secrets.items]
-        return "\n".join(secret_list) if secret_list else "No secrets found."
+        return _list_resource(
+            "secrets", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No secrets found."
     except Exception as e:
         return f"Error fetching secrets: {e}"
 
-@mcp.tool
-def get_secret(secret_name: str = None, namespace: str = None) -> str:
-    """Get a specific secret, or all secrets if not specified."""
+@_tool(cache="secrets", sensitive=("keys",))
+def get_secret(
+    secret_name: str = None,
+    namespace: str = None,
+    keys: str = None,
+    label_selector: str = None,
+    output: str = "yaml",
+    max_bytes: int = RENDER_MAX_BYTES,
+    context: str = None,
+) -> str:
+    """Get a specific secret, or the secrets of a namespace (all namespaces if none) page by page.
+
+    Values are shown as their decoded size in bytes; keys (comma-separated, "*" for all) decodes only those.
+    output: yaml (default), json or table, capped at max_bytes (at most KUBE_MCP_DATA_MAX_OUTPUT).
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        if secret_name and namespace:
-            secret = v1.read_namespaced_secret(secret_name, namespace)
-            return str(secret)
-        else:
-            secrets = v1.list_secret_for_all_namespaces()
-            return "\n\n".join([f"{s.metadata.namespace}/{s.metadata.name}: {s.data}" for s in secrets.items])
+        return _get_data_objects(
+            "secrets", secret_name, namespace, keys, label_selector, output, max_bytes, context
+        ) or "No secrets found."
     except Exception as e:
         return f"Error fetching secret(s): {e}"
 
-@mcp.tool
-def list_persistent_volumes() -> str:
-    """List all persistent volumes."""
+@_tool(cache="persistentvolumes")
+def list_persistent_volumes(
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all persistent volumes.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,phase,capacity,claim). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        pvs = v1.list_persistent_volume()
-        return "\n".join([pv.metadata.name for pv in pvs.items])
+        return _list_resource(
+            "persistentvolumes", None, label_selector, field_selector, fields, page_size, continue_token,
+            default_fmt=_name, since=since, context=context,
+        ) or "No persistent volumes found."
     except Exception as e:
         return f"Error fetching persistent volumes: {e}"
 
-@mcp.tool
-def list_persistent_volume_claims(namespace: str = None) -> str:
-    """List all persistent volume claims in a namespace, or all namespaces if none specified."""
+@_tool(cache="persistentvolumeclaims")
+def list_persistent_volume_claims(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all persistent volume claims in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,phase,capacity). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        if namespace:
-            pvcs = v1.list_namespaced_persistent_volume_claim(namespace)
-        else:
-            pvcs = v1.list_persistent_volume_claim_for_all_namespaces()
-        pvc_list = [f"{pvc.metadata.namespace}/{pvc.metadata.name}" for pvc in pvcs.items]
-        return "\n".join(pvc_list) if pvc_list else "No PVCs found."
+        return _list_resource(
+            "persistentvolumeclaims", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No PVCs found."
     except Exception as e:
         return f"Error fetching PVCs: {e}"
 
-@mcp.tool
-def get_pvc(pvc_name: str = None, namespace: str = None) -> str:
-    """Get a specific persistent volume claim, or all PVCs if not specified."""
+@_tool(cache="persistentvolumeclaims")
+def get_pvc(pvc_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get a specific persistent volume claim, or all PVCs if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
+        v1 = _clients.api("CoreV1Api", context)
         if pvc_name and namespace:
-            pvc = v1.read_namespaced_persistent_volume_claim(pvc_name, namespace)
-            return str(pvc)
+            pvc = _read_raw(v1.read_namespaced_persistent_volume_claim, pvc_name, namespace)
+            return _render(pvc, "persistentvolumeclaims", output, max_bytes)
         else:
-            pvcs = v1.list_persistent_volume_claim_for_all_namespaces()
-            return "\n\n".join([f"{pvc.metadata.namespace}/{pvc.metadata.name}: {pvc.status.phase}" for pvc in pvcs.items])
+            pvcs = _iter_items(_raw_list_fn("persistentvolumeclaims", context=context))
+            return _render_many(pvcs, "persistentvolumeclaims", output, max_bytes, part="status.phase")
     except Exception as e:
         return f"Error fetching PVC(s): {e}"
 
-@mcp.tool
-def list_jobs(namespace: str = None) -> str:
-    """List all jobs in a namespace, or all namespaces if none specified."""
+@_tool(cache="jobs")
+def list_jobs(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all jobs in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector (e.g. status.successful=0); fields picks the output
+    columns (e.g. name,completions,failed). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        batch_v1 = client.BatchV1Api()
-        if namespace:
-            jobs = batch_v1.list_namespaced_job(namespace)
-        else:
-            jobs = batch_v1.list_job_for_all_namespaces()
-        job_list = [f"{j.metadata.namespace}/{j.metadata.name}" for j in jobs.items]
-        return "\n".join(job_list) if job_list else "No jobs found."
+        return _list_resource(
+            "jobs", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No jobs found."
     except Exception as e:
         return f"Error fetching jobs: {e}"
 
-@mcp.tool
-def get_job(job_name: str = None, namespace: str = None) -> str:
-    """Get a specific job, or all jobs if not specified."""
+@_tool(cache="jobs")
+def get_job(job_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get a specific job, or all jobs if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        batch_v1 = client.BatchV1Api()
+        batch_v1 = _clients.api("BatchV1Api", context)
         if job_name and namespace:
-            job = batch_v1.read_namespaced_job(job_name, namespace)
-            return str(job)
+            job = _read_raw(batch_v1.read_namespaced_job, job_name, namespace)
+            return _render(job, "jobs", output, max_bytes)
         else:
-            jobs = batch_v1.list_job_for_all_namespaces()
-            return "\n\n".join([f"{j.metadata.namespace}/{j.metadata.name}: {j.status}" for j in jobs.items])
+            jobs = _iter_items(_raw_list_fn("jobs", context=context))
+            return _render_many(jobs, "jobs", output, max_bytes, part="status")
     except Exception as e:
         return f"Error fetching job(s): {e}"
 
-@mcp.tool
-def list_cronjobs(namespace: str = None) -> str:
-    """List all cronjobs in a namespace, or all namespaces if none specified."""
+@_tool(cache="cronjobs")
+def list_cronjobs(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all cronjobs in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,schedule,last_schedule). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        batch_v1 = client.BatchV1beta1Api() if hasattr(client, 'BatchV1beta1Api') else client.BatchV1Api()
-        if namespace:
-            cronjobs = batch_v1.list_namespaced_cron_job(namespace)
-        else:
-            cronjobs = batch_v1.list_cron_job_for_all_namespaces()
-        cj_list = [f"{cj.metadata.namespace}/{cj.metadata.name}" for cj in cronjobs.items]
-        return "\n".join(cj_list) if cj_list else "No cronjobs found."
+        return _list_resource(
+            "cronjobs", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No cronjobs found."
     except Exception as e:
         return f"Error fetching cronjobs: {e}"
 
-@mcp.tool
-def get_cronjob(cronjob_name: str = None, namespace: str = None) -> str:
-    """Get a specific cronjob, or all cronjobs if not specified."""
+@_tool(cache="cronjobs")
+def get_cronjob(cronjob_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get a specific cronjob, or all cronjobs if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        batch_v1 = client.BatchV1beta1Api() if hasattr(client, 'BatchV1beta1Api') else client.BatchV1Api()
+        batch_v1 = _clients.api("BatchV1Api", context)
         if cronjob_name and namespace:
-            cj = batch_v1.read_namespaced_cron_job(cronjob_name, namespace)
-            return str(cj)
+            cj = _read_raw(batch_v1.read_namespaced_cron_job, cronjob_name, namespace)
+            return _render(cj, "cronjobs", output, max_bytes)
         else:
-            cronjobs = batch_v1.list_cron_job_for_all_namespaces()
-            return "\n\n".join([f"{cj.metadata.namespace}/{cj.metadata.name}: {cj.status}" for cj in cronjobs.items])
+            cronjobs = _iter_items(_raw_list_fn("cronjobs", context=context))
+            return _render_many(cronjobs, "cronjobs", output, max_bytes, part="status")
     except Exception as e:
         return f"Error fetching cronjob(s): {e}"
 
-@mcp.tool
-def list_ingresses(namespace: str = None) -> str:
-    """List all ingresses in a namespace, or all namespaces if none specified."""
+@_tool(cache="ingresses")
+def list_ingresses(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all ingresses in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,class,hosts). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        networking_v1 = client.NetworkingV1Api()
-        if namespace:
-            ingresses = networking_v1.list_namespaced_ingress(namespace)
-        else:
-            ingresses = networking_v1.list_ingress_for_all_namespaces()
-        ing_list = [f"{i.metadata.namespace}/{i.metadata.name}" for i in ingresses.items]
-        return "\n".join(ing_list) if ing_list else "No ingresses found."
+        return _list_resource(
+            "ingresses", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No ingresses found."
     except Exception as e:
         return f"Error fetching ingresses: {e}"
 
-@mcp.tool
-def get_ingress(ingress_name: str = None, namespace: str = None) -> str:
-    """Get a specific ingress, or all ingresses if not specified."""
+@_tool(cache="ingresses")
+def get_ingress(ingress_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get a specific ingress, or all ingresses if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        networking_v1 = client.NetworkingV1Api()
+        networking_v1 = _clients.api("NetworkingV1Api", context)
         if ingress_name and namespace:
-            ingress = networking_v1.read_namespaced_ingress(ingress_name, namespace)
-            return str(ingress)
+            ingress = _read_raw(networking_v1.read_namespaced_ingress, ingress_name, namespace)
+            return _render(ingress, "ingresses", output, max_bytes)
         else:
-            ingresses = networking_v1.list_ingress_for_all_namespaces()
-            return "\n\n".join([f"{i.metadata.namespace}/{i.metadata.name}: {i.status}" for i in ingresses.items])
+            ingresses = _iter_items(_raw_list_fn("ingresses", context=context))
+            return _render_many(ingresses, "ingresses", output, max_bytes, part="status")
     except Exception as e:
         return f"Error fetching ingress(es): {e}"
 
-@mcp.tool
-def list_daemonsets(namespace: str = None) -> str:
-    """List all daemonsets in a namespace, or all namespaces if none specified."""
+@_tool(cache="daemonsets")
+def list_daemonsets(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all daemonsets in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,desired,ready). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        apps_v1 = client.AppsV1Api()
-        if namespace:
-            ds = apps_v1.list_namespaced_daemon_set(namespace)
-        else:
-            ds = apps_v1.list_daemon_set_for_all_namespaces()
-        ds_list = [f"{d.metadata.namespace}/{d.metadata.name}" for d in ds.items]
-        return "\n".join(ds_list) if ds_list else "No daemonsets found."
+        return _list_resource(
+            "daemonsets", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No daemonsets found."
     except Exception as e:
         return f"Error fetching daemonsets: {e}"
 
-@mcp.tool
-def get_daemonset(daemonset_name: str = None, namespace: str = None) -> str:
-    """Get a specific daemonset, or all daemonsets if not specified."""
+@_tool(cache="daemonsets")
+def get_daemonset(daemonset_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get a specific daemonset, or all daemonsets if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        apps_v1 = client.AppsV1Api()
+        apps_v1 = _clients.api("AppsV1Api", context)
         if daemonset_name and namespace:
-            ds = apps_v1.read_namespaced_daemon_set(daemonset_name, namespace)
-            return str(ds)
+            ds = _read_raw(apps_v1.read_namespaced_daemon_set, daemonset_name, namespace)
+            return _render(ds, "daemonsets", output, max_bytes)
         else:
-            ds = apps_v1.list_daemon_set_for_all_namespaces()
-            return "\n\n".join([f"{d.metadata.namespace}/{d.metadata.name}: {d.status}" for d in ds.items])
+            ds = _iter_items(_raw_list_fn("daemonsets", context=context))
+            return _render_many(ds, "daemonsets", output, max_bytes, part="status")
     except Exception as e:
         return f"Error fetching daemonset(s): {e}"
 
-@mcp.tool
-def list_statefulsets(namespace: str = None) -> str:
-    """List all statefulsets in a namespace, or all namespaces if none specified."""
+@_tool(cache="statefulsets")
+def list_statefulsets(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all statefulsets in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,ready,images). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        apps_v1 = client.AppsV1Api()
-        if namespace:
-            ss = apps_v1.list_namespaced_stateful_set(namespace)
-        else:
-            ss = apps_v1.list_stateful_set_for_all_namespaces()
-        ss_list = [f"{s.metadata.namespace}/{s.metadata.name}" for s in ss.items]
-        return "\n".join(ss_list) if ss_list else "No statefulsets found."
+        return _list_resource(
+            "statefulsets", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No statefulsets found."
     except Exception as e:
         return f"Error fetching statefulsets: {e}"
 
-@mcp.tool
-def get_statefulset(statefulset_name: str = None, namespace: str = None) -> str:
-    """Get a specific statefulset, or all statefulsets if not specified."""
+@_tool(cache="statefulsets")
+def get_statefulset(statefulset_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get a specific statefulset, or all statefulsets if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        apps_v1 = client.AppsV1Api()
+        apps_v1 = _clients.api("AppsV1Api", context)
         if statefulset_name and namespace:
-            ss = apps_v1.read_namespaced_stateful_set(statefulset_name, namespace)
-            return str(ss)
+            ss = _read_raw(apps_v1.read_namespaced_stateful_set, statefulset_name, namespace)
+            return _render(ss, "statefulsets", output, max_bytes)
         else:
-            ss = apps_v1.list_stateful_set_for_all_namespaces()
-            return "\n\n".join([f"{s.metadata.namespace}/{s.metadata.name}: {s.status}" for s in ss.items])
+            ss = _iter_items(_raw_list_fn("statefulsets", context=context))
+            return _render_many(ss, "statefulsets", output, max_bytes, part="status")
     except Exception as e:
         return f"Error fetching statefulset(s): {e}"
 
-@mcp.tool
-def list_events(namespace: str = None) -> str:
-    """List all events in a namespace, or all namespaces if none specified."""
+@_tool(cache="events")
+def list_events(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all events in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector (e.g. type=Warning, involvedObject.name=x); fields picks the output
+    columns (e.g. object,reason,count,message). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
-        if namespace:
-            events = v1.list_namespaced_event(namespace)
-        else:
-            events = v1.list_event_for_all_namespaces()
-        event_list = [f"{e.metadata.namespace}/{e.metadata.name}: {e.message}" for e in events.items]
-        return "\n".join(event_list) if event_list else "No events found."
+        return _list_resource(
+            "events", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            default_fmt=_event_line, since=since, context=context,
+        ) or "No events found."
     except Exception as e:
         return f"Error fetching events: {e}"
 
-@mcp.tool
-def get_event(event_name: str = None, namespace: str = None) -> str:
-    """Get a specific event, or all events if not specified."""
+@_tool(cache="events")
+def get_event(event_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get a specific event, or all events if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        v1 = client.CoreV1Api()
+        v1 = _clients.api("CoreV1Api", context)
+        informer = _informers.usable("events", context)
         if event_name and namespace:
-            event = v1.read_namespaced_event(event_name, namespace)
-            return str(event)
+            event = informer.get(namespace, event_name) if informer else None
+            if event is None:
+                event = _read_raw(v1.read_namespaced_event, event_name, namespace)
+            return _render(event, "events", output, max_bytes)
         else:
-            events = v1.list_event_for_all_namespaces()
-            return "\n\n".join([f"{e.metadata.namespace}/{e.metadata.name}: {e.message}" for e in events.items])
+            events = informer.list() if informer else _iter_items(_raw_list_fn("events", context=context))
+            return _render_many(events, "events", output, max_bytes, part="message")
     except Exception as e:
         return f"Error fetching event(s): {e}"
 
-@mcp.tool
-def list_replicasets(namespace: str = None) -> str:
-    """List all replicasets in a namespace, or all namespaces if none specified."""
+@_tool(cache="replicasets")
+def list_replicasets(
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    fields: str = None,
+    page_size: int = None,
+    continue_token: str = None,
+    since: str = None,
+    context: str = None,
+) -> str:
+    """List all replicasets in a namespace, or all namespaces if none specified.
+
+    Filter server-side with label_selector/field_selector; fields picks the output
+    columns (e.g. name,ready,owner). Pass page_size/continue_token to page.
+    Pass the returned changes cursor back as since to get only what changed.
+    """
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        apps_v1 = client.AppsV1Api()
-        if namespace:
-            rs = apps_v1.list_namespaced_replica_set(namespace)
-        else:
-            rs = apps_v1.list_replica_set_for_all_namespaces()
-        rs_list = [f"{r.metadata.namespace}/{r.metadata.name}" for r in rs.items]
-        return "\n".join(rs_list) if rs_list else "No replicasets found."
+        return _list_resource(
+            "replicasets", namespace, label_selector, field_selector, fields, page_size, continue_token,
+            since=since, context=context,
+        ) or "No replicasets found."
     except Exception as e:
         return f"Error fetching replicasets: {e}"
 
-@mcp.tool
-def get_replicaset(replicaset_name: str = None, namespace: str = None) -> str:
-    """Get a specific replicaset, or all replicasets if not specified."""
+@_tool(cache="replicasets")
+def get_replicaset(replicaset_name: str = None, namespace: str = None, output: str = "yaml", max_bytes: int = RENDER_MAX_BYTES, context: str = None) -> str:
+    """Get a specific replicaset, or all replicasets if not specified. output: yaml (default), json or table, capped at max_bytes."""
     try:
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        apps_v1 = client.AppsV1Api()
+        apps_v1 = _clients.api("AppsV1Api", context)
         if replicaset_name and namespace:
-            rs = apps_v1.read_namespaced_replica_set(replicaset_name, namespace)
-            return str(rs)
+            rs = _read_raw(apps_v1.read_namespaced_replica_set, replicaset_name, namespace)
+            return _render(rs, "replicasets", output, max_bytes)
         else:
-            rs = apps_v1.list_replica_set_for_all_namespaces()
-            return "\n\n".join([f"{r.metadata.namespace}/{r.metadata.name}: {r.status}" for r in rs.items])
+            rs = _iter_items(_raw_list_fn("replicasets", context=context))
+            return _render_many(rs, "replicasets", output, max_bytes, part="status")
     except Exception as e:
         return f"Error fetching replicaset(s): {e}"
 
+@_tool
+def list_contexts() -> str:
+    """List the kubeconfig contexts (clusters) that the context argument of every tool accepts."""
+    try:
+        names, current = _clients.contexts()
+        if not names:
+            return "No kubeconfig contexts found (using in-cluster config)."
+        return "\n".join(f"{name} (current)" if name == current else name for name in names)
+    except Exception as e:
+        return f"Error listing contexts: {e}"
+
+@_tool
+def fan_out(tool: str, arguments: dict = None, contexts: str = None, timeout_seconds: float = FANOUT_TIMEOUT) -> str:
+    """Run a read tool (e.g. list_pods, list_nodes, list_events) against several clusters in parallel and merge the results.
+
+    contexts is a comma-separated list of kubeconfig contexts (default: all of them). A cluster that has not
+    answered within timeout_seconds is reported as timed out without holding up the rest. With fields=... or
+    output="table" in arguments the rows are merged into one table with a CONTEXT column.
+    """
+    try:
+        if tool not in _READ_TOOLS:
+            raise ValueError(f"only read tools can be fanned out: {', '.join(sorted(_READ_TOOLS))}")
+        arguments = {k: v for k, v in (arguments or {}).items() if k != "context"}
+        names = [c.strip() for c in contexts.split(",") if c.strip()] if contexts else _clients.contexts()[0]
+        if not names:
+            raise ValueError("no kubeconfig contexts to fan out to")
+        calls = {c: partial(_TOOL_IMPLS[tool], **arguments, context=c) for c in names}
+        results = _run_parallel(calls, FANOUT_PARALLELISM, timeout_seconds)
+        tabular = bool(arguments.get("fields")) or arguments.get("output") == "table"
+        return _merge_fan_out(results, timeout_seconds, tabular)
+    except Exception as e:
+        return f"Error fanning out {tool}: {e}"
+
+@_tool
+def batch(
+    operations: list[dict],
+    deadline_seconds: float = BATCH_DEADLINE,
+    max_parallel: int = BATCH_PARALLELISM,
+    output: str = "yaml",
+    max_bytes: int = RENDER_MAX_BYTES,
+    context: str = None,
+) -> str:
+    """Run many read operations in one call, in parallel, and return each result under its operation.
+
+    Each operation is {"verb": "get" | "list" | "events", "kind": ..., "name": ..., "namespace": ...}; list also
+    takes label_selector, field_selector and fields, events lists the events of the named object. Errors are
+    reported per operation; operations unfinished at deadline_seconds are reported as such. output and
+    max_bytes apply to each get.
+    """
+    try:
+        _check_output(output)
+
+        def run(op):
+            try:
+                return _batch_op(op, context, output, max_bytes)
+            except ApiException as e:
+                return f"Error: {e.status} {e.reason}: {_api_message(e)}"
+            except Exception as e:
+                return f"Error: {e}"
+
+        calls = {i: partial(run, op) for i, op in enumerate(operations)}
+        results = _run_parallel(calls, max_parallel, deadline_seconds)
+        return "\n\n".join(
+            f"[{i + 1}] {_batch_label(op)}\n"
+            + (f"Not finished within the {deadline_seconds:g}s deadline." if results[i] is None else results[i])
+            for i, op in enumerate(operations)
+        ) or "No operations given."
+    except Exception as e:
+        return f"Error running batch: {e}"
+
+@_tool(timeout=0, invalidates=("deployments", "statefulsets", "daemonsets", "replicasets", "pods"))
+def bulk_update(
+    targets: list[dict] = None,
+    kind: str = "deployments",
+    namespace: str = None,
+    label_selector: str = None,
+    replicas: int = None,
+    patch: dict = None,
+    dry_run: bool = False,
+    force: bool = False,
+    wait_for_rollout: bool = False,
+    max_parallel: int = BULK_PARALLELISM,
+    max_targets: int = 100,
+    timeout_seconds: float = BULK_TIMEOUT,
+    context: str = None,
+) -> str:
+    """Scale and/or server-side apply many deployments, statefulsets or daemonsets at once.
+
+    Pick workloads with targets ([{"kind": "deployment", "name": ..., "namespace": ...}]) or with kind plus
+    namespace/label_selector. replicas scales each one; patch (e.g. {"spec": {"template": {"metadata":
+    {"annotations": {...}}}}}) is server-side applied. Workloads are updated max_parallel at a time; dry_run
+    validates without persisting. wait_for_rollout follows each one with a watch until it has rolled out or
+    timeout_seconds pass.
+    """
+    try:
+        if replicas is None and not patch:
+            return "Error: give replicas and/or patch"
+        resolved = _bulk_targets(targets, kind, namespace, label_selector, context)
+        if not resolved:
+            return "No matching workloads found."
+        if len(resolved) > max_targets:
+            return f"Error: {len(resolved)} workloads matched, more than max_targets={max_targets}; narrow the selection or raise it"
+        outcomes = {target: [] for target in resolved}
+        calls = {
+            target: partial(_bulk_update_one, target, replicas, patch, dry_run, force, wait_for_rollout, outcomes[target], context)
+            for target in resolved
+        }
+        results = _run_parallel(calls, max_parallel, timeout_seconds)
+        lines, counts = [], Counter()
+        for (kind_, ns, name), outcome in outcomes.items():
+            if results[(kind_, ns, name)] is None:
+                outcome = outcome + [f"not finished within {timeout_seconds:g}s"]
+                counts["not finished"] += 1
+            else:
+                counts["failed" if outcome and outcome[-1].startswith("Error") else "done"] += 1
+            lines.append(f"{BULK_KINDS[kind_][1]} {ns}/{name}: {'; '.join(outcome) or 'nothing done'}")
+        summary = ", ".join(f"{counts[state]} {state}" for state in ("done", "failed", "not finished") if counts[state])
+        return "\n".join([f"{len(resolved)} workloads{' (dry run)' if dry_run else ''}: {summary}."] + lines)
+    except Exception as e:
+        return f"Error running bulk update: {e}"
+
+@_tool(cache=("pods", "deployments", "statefulsets", "daemonsets", "nodes", "events"))
+def cluster_overview(
+    namespace: str = None,
+    limit: int = 10,
+    event_window_minutes: float = 60,
+    timeout_seconds: float = OVERVIEW_TIMEOUT,
+    context: str = None,
+) -> str:
+    """Summarize what is broken: crash-looping and pending pods, workloads with unavailable replicas,
+    NotReady or pressured nodes and the top warning event reasons.
+
+    Pods, deployments, statefulsets, daemonsets, nodes and warning events are fetched in parallel and
+    aggregated page by page; limit caps each list. Kinds not fetched within timeout_seconds are named.
+    """
+    try:
+        summaries = {
+            "nodes": lambda: _summarize_nodes(_snapshot_items("nodes", None, context)),
+            "pods": lambda: _summarize_pods(_snapshot_items("pods", namespace, context)),
+            "events": lambda: _summarize_warnings(
+                _snapshot_items("events", namespace, context, field_selector="type=Warning"), event_window_minutes * 60
+            ),
+        }
+        for kind in ("deployments", "statefulsets", "daemonsets"):
+            summaries[kind] = partial(lambda k: _summarize_workloads(k, _snapshot_items(k, namespace, context)), kind)
+        calls = {kind: partial(_overview_part, summarize) for kind, summarize in summaries.items()}
+        parts = _run_parallel(calls, len(calls), timeout_seconds)
+        return _format_overview(parts, namespace, limit, event_window_minutes)
+    except Exception as e:
+        return f"Error building cluster overview: {e}"
+
+@_tool(cache="events")
+def query_events(
+    namespace: str = None,
+    object_kind: str = None,
+    object_name: str = None,
+    reason: str = None,
+    type: str = None,
+    since_minutes: float = None,
+    group_by: str = None,
+    limit: int = 50,
+    context: str = None,
+) -> str:
+    """Search events from an in-memory, watch-fed event store, newest first.
+
+    Filter by namespace, involved object (object_kind, object_name; a trailing * matches a name prefix),
+    reason, type (Normal/Warning) and since_minutes. group_by (reason, object, type, namespace) returns
+    the top groups by event count instead of the events.
+    """
+    try:
+        if group_by and group_by not in EVENT_GROUPS:
+            return f"Error: group_by must be one of {', '.join(EVENT_GROUPS)}"
+        store = _event_store(context)
+        loading = not store.synced.wait(min(INFORMER_SYNC_TIMEOUT, _remaining() or INFORMER_SYNC_TIMEOUT))
+        events = store.query(namespace, object_kind, object_name, reason, type, since_minutes and since_minutes * 60)
+        notes = []
+        if loading:
+            notes.append("Event store is still loading; results may be incomplete.")
+        if store.evicted and store.oldest():
+            notes.append(f"History covers the last {_age(datetime.fromtimestamp(store.oldest(), timezone.utc))} "
+                         f"({store.evicted} older events dropped to stay under the memory cap).")
+        if not events:
+            return "\n".join(["No matching events."] + notes)
+        with _phase("render"):
+            lines = _format_event_groups(events, group_by, limit) if group_by else _format_events(events, limit)
+        return "\n".join(lines + notes)
+    except Exception as e:
+        return f"Error querying events: {e}"
+
+@_tool(cache=("deployments", "cronjobs", *OWNER_GRAPH_KINDS))
+def get_workload_tree(kind: str, name: str, namespace: str = None, max_children: int = 50, context: str = None) -> str:
+    """Resolve the ownership tree around a workload or pod in one call, e.g. Deployment -> ReplicaSets -> Pods
+    or Pod -> Job -> CronJob, with the live status of each object.
+
+    kind is one of deployment, replicaset, statefulset, daemonset, cronjob, job or pod. Ownership comes
+    from watch-fed metadata of pods, replicasets, jobs, statefulsets and daemonsets; max_children caps the
+    children shown per object.
+    """
+    try:
+        kind = _resource_kind(kind)
+        if kind not in OWNER_ROOT_KINDS:
+            return f"Error: kind must be one of {', '.join(OWNER_ROOT_KINDS)}"
+        namespace = namespace or "default"
+        graph = _owner_graph(context)
+        loading = not graph.synced(min(INFORMER_SYNC_TIMEOUT, _remaining() or INFORMER_SYNC_TIMEOUT))
+        uid, tree = graph.resolve(kind, namespace, name, max_children)
+        notes = ["Caches are still loading; the tree may be incomplete."] if loading else []
+        if uid is None:
+            return "\n".join([f"No {OWNER_ROOT_KINDS[kind]} {namespace}/{name} found, and nothing it owns."] + notes)
+        statuses = graph.statuses(namespace, [(node_kind, node_name) for _, node, node_kind, node_name in tree if node])
+        lines = []
+        with _phase("render"):
+            for depth, node, node_kind, node_name in tree:
+                if node is None:
+                    lines.append("  " * depth + f"... [{node_name} more]")
+                    continue
+                status = statuses.get((node_kind, node_name), "")
+                lines.append(
+                    "  " * depth + f"{OWNER_ROOT_KINDS.get(node_kind, node_kind)} {node_name}"
+                    + (f" ({status})" if status else "") + ("  <-" if node == uid and depth else "")
+                )
+        return "\n".join([f"Namespace: {namespace}"] + lines + notes)
+    except Exception as e:
+        return f"Error resolving workload tree: {e}"
+
+@_tool(cache=("pods", "nodes"))
+def get_resource_usage(
+    kind: str = "pods",
+    namespace: str = None,
+    node: str = None,
+    sort_by: str = "cpu",
+    by_request_ratio: bool = False,
+    limit: int = 20,
+    context: str = None,
+) -> str:
+    """Top CPU/memory consumers from metrics.k8s.io, next to their requests and limits.
+
+    kind is pods, nodes or namespaces (pod usage summed per namespace); namespace and node narrow
+    the pods counted. sort_by is cpu or memory. by_request_ratio ranks by usage / request instead
+    (usage / allocatable for nodes). Usage is aggregated once per context and reused for a few seconds.
+    """
+    try:
+        kind = _resource_kind(kind)
+        if kind not in USAGE_KINDS:
+            return f"Error: kind must be one of {', '.join(USAGE_KINDS)}"
+        if sort_by not in USAGE_SORTS:
+            return f"Error: sort_by must be one of {', '.join(USAGE_SORTS)}"
+        if kind == "nodes" and namespace:
+            return "Error: namespace does not apply to kind=nodes"
+        snapshot = _usage_snapshot(namespace, context)
+        rows, header, columns = _usage_rows(snapshot, kind, namespace, node)
+        resource = USAGE_SORTS.index(sort_by)
+        if by_request_ratio:
+            def key(row):
+                values = columns(row)
+                return values[resource] / values[resource + 2] if values[resource + 2] else -1
+        else:
+            def key(row):
+                return columns(row)[resource]
+        with _phase("render"):
+            top = heapq.nlargest(max(0, limit), rows, key=key)
+            ranking = "usage / allocatable" if kind == "nodes" else "usage / request"
+            ranking = f"{sort_by} {ranking if by_request_ratio else 'usage'}"
+            scope = (f" in namespace {namespace}" if namespace else "") + (f" on node {node}" if node else "")
+            lines = [f"{kind.capitalize()}{scope} by {ranking}: top {len(top)} of {len(rows)} "
+                     f"(metrics window {snapshot.window or 'unknown'}, aggregated {snapshot.age():.0f}s ago)", header]
+            lines += ["\t".join(str(cell) for cell in columns(row)[4]) for row in top]
+        if by_request_ratio and kind != "nodes":
+            unranked = sum(1 for row in rows if not columns(row)[resource + 2])
+            if unranked:
+                lines.append(f"{unranked} {kind} without a {sort_by} request ranked last.")
+        return "\n".join(lines)
+    except ApiException as e:
+        if e.status == 404:
+            return "Error: the metrics.k8s.io API is not available (is metrics-server installed?)"
+        return f"Error reading resource usage: {_api_message(e)}"
+    except Exception as e:
+        return f"Error reading resource usage: {e}"
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request):
+    """Prometheus metrics, served next to the HTTP transport."""
+    entries, size = _responses.usage()
+    _metrics.set("kube_mcp_cache_entries", entries)
+    _metrics.set("kube_mcp_cache_bytes", size)
+    for context, store in list(_event_stores.items()):
+        _metrics.set("kube_mcp_event_store_events", len(store), context=context or "")
+        _metrics.set("kube_mcp_event_store_bytes", store.bytes, context=context or "")
+    for phase, seconds in list(_startup.items()):
+        _metrics.set("kube_mcp_startup_seconds", seconds, phase=phase)
+    return PlainTextResponse(_metrics.render(), media_type="text/plain; version=0.0.4")
+
+_startup_phase("module body", time.perf_counter() - _started - _startup["imports"])
+
 if __name__ == "__main__":
-    mcp.run(transport="http", host="0.0.0.0", port=8000)
+    parser = argparse.ArgumentParser(description=mcp.name)
+    parser.add_argument("--transport", choices=("http", "stdio"), default=os.environ.get("KUBE_MCP_TRANSPORT", "http"),
+                        help="http serves /mcp and /metrics; stdio speaks MCP over stdin/stdout for clients that spawn the server")
+    parser.add_argument("--host", default=os.environ.get("KUBE_MCP_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("KUBE_MCP_PORT", "8000")))
+    parser.add_argument("--startup-report", action="store_true",
+                        help="load the kubeconfig and every API group, print how long each startup phase took, and exit")
+    args = parser.parse_args()
+    if args.startup_report:
+        for api_name in dict.fromkeys(api_name for api_name, _, _ in LIST_RESOURCES.values()):
+            _api_class(api_name)
+        try:
+            _clients.api_client()
+        except Exception as e:
+            print(f"Config not loaded: {e}", file=sys.stderr)
+        print(_startup_report())
+        sys.exit(0)
+    _startup_phase("ready", time.perf_counter() - _started)
+    logger.info("startup phases:\n%s", _startup_report())
+    if args.transport == "stdio":
+        mcp.run(transport="stdio", show_banner=False)
+    else:
+        mcp.run(transport="http", host=args.host, port=args.port)
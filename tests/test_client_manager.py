@@ -0,0 +1,26 @@
+"""KubeClientManager: contexts load independently of each other."""
+import threading
+import time
+
+import kube_mcp_server as k
+
+
+def test_slow_context_does_not_block_others():
+    manager = k.KubeClientManager()
+    release = threading.Event()
+
+    def load(context):
+        if context == "slow":
+            release.wait(5)
+        return f"client for {context}"
+
+    manager._load = load
+    slow = threading.Thread(target=manager.api_client, args=("slow",))
+    slow.start()
+    time.sleep(0.05)
+    start = time.monotonic()
+    assert manager.api_client("fast") == "client for fast"
+    assert time.monotonic() - start < 1
+    release.set()
+    slow.join()
+    assert manager.api_client("slow") == "client for slow"
@@ -0,0 +1,174 @@
+"""get_resource_usage against benchmarks/fake_apiserver.py, which serves metrics.k8s.io from its synthetic pods and nodes."""
+import pytest
+
+from fake_apiserver import SyntheticCluster, serve
+
+KUBECONFIG = """apiVersion: v1
+kind: Config
+clusters:
+- {{name: fake, cluster: {{server: "http://127.0.0.1:{port}"}}}}
+- {{name: bare, cluster: {{server: "http://127.0.0.1:{bare_port}"}}}}
+users:
+- {{name: test, user: {{token: test}}}}
+contexts:
+- {{name: fake, context: {{cluster: fake, user: test}}}}
+- {{name: no-metrics, context: {{cluster: bare, user: test}}}}
+current-context: fake
+"""
+
+
+@pytest.fixture(scope="module")
+def cluster():
+    return SyntheticCluster(namespaces=4, nodes=6, pods=600, deployments=60, events=10)
+
+
+@pytest.fixture(scope="module")
+def k(cluster, tmp_path_factory):
+    bare = SyntheticCluster(namespaces=1, nodes=1, pods=5, deployments=1, events=0)
+    bare.metrics_available = False
+    servers = [serve(cluster), serve(bare)]
+    kubeconfig = tmp_path_factory.mktemp("kube") / "config"
+    kubeconfig.write_text(KUBECONFIG.format(port=servers[0].server_port, bare_port=servers[1].server_port))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("KUBECONFIG", str(kubeconfig))
+        # The client reads $KUBECONFIG once at import, which may predate this fixture.
+        mp.setattr("kubernetes.config.kube_config.KUBE_CONFIG_DEFAULT_LOCATION", str(kubeconfig))
+        import kube_mcp_server
+
+        kube_mcp_server._usage_snapshots.clear()
+        yield kube_mcp_server
+    for server in servers:
+        server.shutdown()
+
+
+def usage(k, **kwargs):
+    return k._TOOL_IMPLS["get_resource_usage"](**kwargs)
+
+
+def table(text):
+    """Header cells and rows of a get_resource_usage answer (its first line is the title)."""
+    lines = text.splitlines()
+    header = lines[1].split("\t")
+    return header, [dict(zip(header, line.split("\t"))) for line in lines[2:] if "\t" in line]
+
+
+def millicores(cell):
+    return int(cell.rstrip("m"))
+
+
+def mebibytes(cell):
+    return int(cell.rstrip("Mi"))
+
+
+def expected_pods(cluster):
+    """(namespace/name, node, cpu millicores, memory MiB) of every running pod, from the fake metrics."""
+    pods = []
+    for _, pod in cluster.scan("pods"):
+        metrics = cluster.usage("pods", pod)
+        if metrics:
+            cpu = sum(int(c["usage"]["cpu"].rstrip("n")) for c in metrics["containers"]) / 1e6
+            memory = sum(int(c["usage"]["memory"].rstrip("Ki")) for c in metrics["containers"]) / 1024
+            pods.append((f"{pod['metadata']['namespace']}/{pod['metadata']['name']}", pod["spec"]["nodeName"], cpu, memory))
+    return pods
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("250m", 0.25), ("1500000n", 0.0015), ("12u", 0.000012), ("2", 2.0), ("1e3", 1000.0),
+    ("512Ki", 512 * 1024), ("128Mi", 128 * 2 ** 20), ("1.5Gi", 1.5 * 2 ** 30), ("1k", 1000.0),
+])
+def test_quantity(k, value, expected):
+    assert k._quantity(value) == pytest.approx(expected)
+
+
+def test_quantity_rejects_unknown_suffix(k):
+    with pytest.raises(ValueError):
+        k._quantity("3Xi")
+
+
+def test_resources_sum_containers(k):
+    containers = [
+        {"resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"cpu": "1", "memory": "1Gi"}}},
+        {"resources": {"requests": {"cpu": "250m", "memory": "64Mi"}}},
+    ]
+    assert k._resources(containers, "requests") == pytest.approx((0.35, 192 * 2 ** 20))
+    assert k._resources(containers, "limits") == (None, None)  # the second container sets no limits
+
+
+def test_pods_by_cpu(k, cluster):
+    header, rows = table(usage(k, limit=10))
+    assert header[:3] == ["POD", "NODE", "CPU"]
+    cpus = [millicores(r["CPU"]) for r in rows]
+    assert len(rows) == 10 and cpus == sorted(cpus, reverse=True)
+    assert cpus[0] == round(max(p[2] for p in expected_pods(cluster)))
+    top = rows[0]
+    assert (top["CPU_REQ"], top["CPU_LIM"], top["MEM_REQ"], top["MEM_LIM"]) == ("100m", "500m", "128Mi", "512Mi")
+    assert top["CPU%REQ"] == f"{millicores(top['CPU']) / 100:.0%}"
+
+
+def test_pods_by_memory_in_namespace_and_on_node(k, cluster):
+    _, rows = table(usage(k, namespace="ns-001", sort_by="memory", limit=5))
+    assert rows and all(r["POD"].startswith("ns-001/") for r in rows)
+    memory = [mebibytes(r["MEMORY"]) for r in rows]
+    assert memory == sorted(memory, reverse=True)
+    assert memory[0] == round(max(p[3] for p in expected_pods(cluster) if p[0].startswith("ns-001/")))
+
+    _, rows = table(usage(k, node="node-0002", limit=1000))
+    assert len(rows) == sum(1 for p in expected_pods(cluster) if p[1] == "node-0002")
+    assert {r["NODE"] for r in rows} == {"node-0002"}
+
+
+def test_by_request_ratio(k):
+    text = usage(k, sort_by="memory", by_request_ratio=True, limit=5)
+    assert "by memory usage / request" in text.splitlines()[0]
+    _, rows = table(text)
+    ratios = [int(r["MEM%REQ"].rstrip("%")) for r in rows]
+    assert ratios == sorted(ratios, reverse=True) and ratios[0] > 100
+
+
+def test_nodes(k, cluster):
+    pods = expected_pods(cluster)
+    header, rows = table(usage(k, kind="nodes", limit=10))
+    assert header[0] == "NODE" and len(rows) == cluster.counts["nodes"]
+    cpus = [millicores(r["CPU"]) for r in rows]
+    assert cpus == sorted(cpus, reverse=True)
+    for row in rows:
+        on_node = sum(1 for p in pods if p[1] == row["NODE"])
+        assert int(row["PODS"]) >= on_node  # pending pods count towards requests too
+        assert row["CPU_REQUESTED"] == f"{int(row['PODS']) * 100}m"
+        assert row["CPU%"] == f"{millicores(row['CPU']) / 15800:.0%}"  # allocatable 15800m
+
+    _, rows = table(usage(k, kind="nodes", sort_by="memory", by_request_ratio=True, limit=2))
+    percents = [int(r["MEMORY%"].rstrip("%")) for r in rows]
+    assert len(rows) == 2 and percents == sorted(percents, reverse=True)
+
+
+def test_namespaces(k, cluster):
+    pods = expected_pods(cluster)
+    _, rows = table(usage(k, kind="namespaces", limit=10))
+    assert len(rows) == cluster.counts["namespaces"]
+    for row in rows:
+        mine = [p for p in pods if p[0].startswith(row["NAMESPACE"] + "/")]
+        assert int(row["PODS"]) == len(mine)
+        assert millicores(row["CPU"]) == round(sum(p[2] for p in mine))
+        assert row["CPU_REQ"] == f"{len(mine) * 100}m"
+
+
+def test_snapshot_reused_within_ttl(k, monkeypatch):
+    k._usage_snapshots.clear()
+    first = k._usage_snapshot(None, None)
+    assert k._usage_snapshot(None, None) is first
+    assert k._usage_snapshot("ns-002", None) is first  # a fresh cluster-wide snapshot answers namespaces too
+    monkeypatch.setattr(k, "USAGE_TTL", 0)
+    assert k._usage_snapshot(None, None) is not first
+
+
+def test_bad_arguments(k):
+    assert usage(k, sort_by="disk").startswith("Error: sort_by must be one of")
+    assert usage(k, kind="nodes", namespace="ns-001") == "Error: namespace does not apply to kind=nodes"
+    assert usage(k, kind="deployments").startswith("Error: kind must be one of")
+
+
+def test_without_metrics_server(k):
+    assert usage(k, context="no-metrics") == (
+        "Error: the metrics.k8s.io API is not available (is metrics-server installed?)"
+    )
@@ -0,0 +1,31 @@
+"""ResponseCache: stored answers, coalesced calls, and answers that must never be stored."""
+import asyncio
+
+import kube_mcp_server as k
+
+
+def run(cache, key, answers, store=True, callers=1):
+    async def compute():
+        await asyncio.sleep(0.01)
+        answers.append(len(answers))
+        return f"answer {answers[-1]}"
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_run(key, compute, store) for _ in range(callers)))
+
+    return asyncio.run(main())
+
+
+def test_answers_are_stored():
+    cache, answers = k.ResponseCache(ttl=60), []
+    assert run(cache, (("secrets",), "get_secret", ()), answers) == ["answer 0"]
+    assert run(cache, (("secrets",), "get_secret", ()), answers) == ["answer 0"]
+    assert answers == [0]
+
+
+def test_unstored_answers_are_coalesced_but_not_kept():
+    cache, answers = k.ResponseCache(ttl=60), []
+    key = (("secrets",), "get_secret", (("keys", "*"),))
+    assert run(cache, key, answers, store=False, callers=3) == ["answer 0"] * 3
+    assert cache.usage() == (0, 0)
+    assert run(cache, key, answers, store=False) == ["answer 1"]
@@ -0,0 +1,10 @@
+"""search_pod_logs argument checks, made before any API request."""
+import pytest
+
+import kube_mcp_server as k
+
+
+@pytest.mark.parametrize("max_bytes_per_pod", [None, 0, -1])
+def test_rejects_non_positive_byte_limit(max_bytes_per_pod):
+    answer = k._TOOL_IMPLS["search_pod_logs"]("ERROR", namespace="default", max_bytes_per_pod=max_bytes_per_pod)
+    assert answer == "Error: max_bytes_per_pod must be a positive number of bytes"
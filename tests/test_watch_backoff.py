@@ -0,0 +1,121 @@
+"""ListWatch retry loop: which watch rounds back off and which reset the backoff."""
+import time
+
+import kube_mcp_server as k
+
+
+class Stop:
+    """Stands in for the stop event: records waits and stops once the script runs out."""
+
+    def __init__(self):
+        self.waits = []
+        self.done = False
+
+    def is_set(self):
+        return self.done
+
+    def wait(self, seconds):
+        self.waits.append(seconds)
+
+
+class Scripted(k.ListWatch):
+    """Each watch round plays one step: ("events", n), ("timeout",), ("closed",), ("error", code) or ("raise", exc).
+
+    ("timeout",) ends the watch after watch_timeout, as the server does; ("closed",) ends it at once.
+    """
+
+    watch_timeout = 0.05
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.relists = 0
+        self.resource_version = None
+        self._stop = Stop()
+
+    def _relist(self):
+        self.relists += 1
+        self.resource_version = "1"
+
+    def _watch(self):
+        step = self.steps.pop(0)
+        if not self.steps:
+            self._stop.done = True
+        if step[0] == "events":
+            yield from range(step[1])
+        elif step[0] == "timeout":
+            time.sleep(self.watch_timeout)
+        elif step[0] == "error":
+            raise k.WatchError({"code": step[1], "message": "boom"})
+        elif step[0] == "raise":
+            raise step[1]
+
+
+def run(*steps):
+    lw = Scripted(steps)
+    lw._run()
+    return lw
+
+
+def test_error_events_back_off():
+    lw = run(("error", 500), ("error", 500), ("error", 500), ("error", 500))
+    assert lw._stop.waits == [1, 2, 4, 8]
+
+
+def test_api_and_connection_errors_back_off():
+    lw = run(("raise", k.ApiException(status=503)), ("raise", ConnectionError()), ("timeout",))
+    assert lw._stop.waits == [1, 2]
+
+
+def test_backoff_is_capped():
+    lw = run(*[("error", 500)] * 8)
+    assert lw._stop.waits == [1, 2, 4, 8, 16, 32, 60, 60]
+
+
+def test_delivered_events_reset_backoff():
+    lw = run(("error", 500), ("error", 500), ("events", 1), ("error", 500))
+    assert lw._stop.waits == [1, 2, 1]
+
+
+def test_normal_timeout_resets_backoff():
+    lw = run(("error", 500), ("error", 500), ("timeout",), ("error", 500))
+    assert lw._stop.waits == [1, 2, 1]
+
+
+def test_watch_closed_early_backs_off():
+    lw = run(("closed",), ("closed",), ("closed",), ("events", 1), ("closed",))
+    assert lw._stop.waits == [1, 2, 4, 1]
+    assert lw.relists == 1
+
+
+def test_gone_relists_without_waiting():
+    lw = run(("error", 410), ("raise", k.ApiException(status=410)), ("timeout",))
+    assert lw._stop.waits == []
+    assert lw.relists == 3
+
+
+def test_event_store_relists_after_a_failed_page(monkeypatch):
+    pages = {
+        None: {"metadata": {"continue": "p2", "resourceVersion": "5"}, "items": [{"metadata": {"uid": "a"}}]},
+        "p2": {"metadata": {"resourceVersion": "5"}, "items": [{"metadata": {"uid": "b"}}]},
+    }
+    failures = [k.ApiException(status=500)]
+
+    def list_fn(limit=None, _continue=None):
+        if _continue == "p2" and failures:
+            raise failures.pop()
+        return pages[_continue]
+
+    monkeypatch.setattr(k, "_raw_list_fn", lambda *args, **kwargs: list_fn)
+    store = k.EventStore()
+    store._stop = Stop()
+
+    def watch_once():
+        store._stop.done = True
+        yield from ()
+
+    store._watch = watch_once
+    store.watch_timeout = 0  # the stub watch ends at once, like one that ran its full timeout
+    store._run()
+    assert store._stop.waits == [1]
+    assert store.synced.is_set() and store.resource_version == "5"
+    assert len(store) == 2